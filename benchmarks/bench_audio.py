@@ -0,0 +1,91 @@
+"""
+Time to synthesize the noise and chime assets.
+
+Compares the old per-sample loop (random.uniform + struct.pack) with the bulk
+synthesizer in modules/synth.py, using numpy when it is installed and the
+pure-Python array fallback either way. Nothing is written to disk.
+
+    python benchmarks/bench_audio.py [--seconds 60] [--runs 3]
+"""
+import argparse
+import math
+import os
+import random
+import statistics
+import struct
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from modules import synth
+
+def legacy_brown(seconds, sample_rate=synth.SAMPLE_RATE):
+    """The original AudioManager.ensure_asset loop, minus the file write."""
+    samples = []
+    val = 0.0
+    for _ in range(int(seconds * sample_rate)):
+        val += random.uniform(-1, 1)
+        val -= val * 0.02
+        samples.append(val)
+    max_val = max(abs(min(samples)), abs(max(samples)))
+    samples = [s / max_val for s in samples]
+    wave_data = bytearray()
+    for s in samples:
+        wave_data.extend(struct.pack('<h', int(s * 32767)))
+    return bytes(wave_data)
+
+def legacy_chime(seconds=1.0, sample_rate=synth.SAMPLE_RATE):
+    wave_data = bytearray()
+    for i in range(int(seconds * sample_rate)):
+        t = float(i) / sample_rate
+        val = math.sin(2.0 * math.pi * 880.0 * t) * math.exp(-3.0 * t)
+        wave_data.extend(struct.pack('<h', int(val * 32767)))
+    return bytes(wave_data)
+
+def timed(fn, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark noise/chime synthesis")
+    parser.add_argument("--seconds", type=float, default=60, help="Noise length to generate")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    numpy = synth.np
+    cases = [
+        (f"legacy brown {args.seconds:g}s", lambda: legacy_brown(args.seconds)),
+        ("legacy chime 1s", legacy_chime),
+    ]
+    if numpy is not None:
+        cases += [
+            (f"numpy brown {args.seconds:g}s", lambda: synth.brown_noise(args.seconds)),
+            ("numpy chime 1s", synth.chime),
+        ]
+
+    def pure(fn):
+        def run():
+            synth.np = None
+            try:
+                return fn()
+            finally:
+                synth.np = numpy
+        return run
+
+    cases += [
+        (f"array brown {args.seconds:g}s", pure(lambda: synth.brown_noise(args.seconds))),
+        ("array chime 1s", pure(synth.chime)),
+    ]
+
+    print(f"{'case':<28} {'median':>10}")
+    for name, fn in cases:
+        print(f"{name:<28} {timed(fn, args.runs) * 1000:>8.1f}ms")
+
+if __name__ == "__main__":
+    main()
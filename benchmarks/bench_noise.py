@@ -0,0 +1,62 @@
+"""
+CPU cost of streaming noise, per second of audio produced.
+
+Synthesizes CHUNK_SECONDS chunks exactly like NoiseEngine does (generate,
+convert to interleaved 16-bit PCM) without touching the sound card, for
+every colour, with numpy if installed and with the pure-Python fallback.
+
+    python benchmarks/bench_noise.py [--seconds 30]
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "hide")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from modules import synth
+from modules.noise_engine import CHUNK_SECONDS
+
+def mixer_format():
+    """(sample_rate, channels) the engine would stream at on this machine."""
+    try:
+        import pygame
+        pygame.mixer.init(size=-16)
+        rate, _, channels = pygame.mixer.get_init()
+        pygame.mixer.quit()
+        return rate, channels
+    except Exception:
+        return synth.SAMPLE_RATE, 2
+
+def cpu_percent(color, seconds, rate, channels):
+    generator = synth.NoiseGenerator(color)
+    frames = int(rate * CHUNK_SECONDS)
+    chunks = int(seconds / CHUNK_SECONDS)
+    start = time.process_time()
+    for _ in range(chunks):
+        synth.to_pcm16(generator.generate(frames), peak=1.0, channels=channels)
+    return 100.0 * (time.process_time() - start) / (chunks * CHUNK_SECONDS)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark streaming noise synthesis")
+    parser.add_argument("--seconds", type=float, default=30, help="Audio to synthesize per case")
+    args = parser.parse_args()
+
+    rate, channels = mixer_format()
+    print(f"{rate} Hz, {channels} channel(s), {CHUNK_SECONDS:g}s chunks")
+    numpy = synth.np
+    backends = [("numpy", numpy)] if numpy is not None else []
+    backends.append(("array", None))
+
+    print(f"{'case':<16} {'cpu':>8}")
+    for name, module in backends:
+        synth.np = module
+        for color in synth.NOISE_COLORS:
+            print(f"{name + ' ' + color:<16} {cpu_percent(color, args.seconds, rate, channels):>7.2f}%")
+    synth.np = numpy
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Per-call latency of `dailydash status` as a status bar would poll it.
+
+Runs each variant as a fresh process (like waybar/polybar/tmux do) against a
+throwaway HOME so your real config is never touched.
+
+    python benchmarks/bench_status.py [--runs 20]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN = os.path.join(ROOT, "main.py")
+
+VARIANTS = {
+    "status (rich)": ["status"],
+    "status --format json": ["status", "--format", "json"],
+    "status --format line": ["status", "--format", "line"],
+    "status --format template": ["status", "--format", "template", "--template", "{water}/{water_goal}ml"],
+}
+
+def make_home():
+    home = tempfile.mkdtemp(prefix="dailydash-bench-")
+    config_dir = os.path.join(home, ".config", "dailydash")
+    os.makedirs(config_dir)
+    config = {
+        "user_profile": {"name": "Bench", "city": "", "daily_water_goal": 2000},
+        "daily_state": {
+            "current_water_intake": 750,
+            "current_caffeine_intake": 100,
+            "tasks": [{"id": i, "text": f"Task {i}", "done": i == 1, "budget": None} for i in (1, 2, 3)],
+            "habit_status": {}
+        },
+        "persistent_data": {"brain_dump_content": [], "parking_lot_links": [], "habits": []},
+        "setup_complete": True
+    }
+    with open(os.path.join(config_dir, "config.json"), "w") as f:
+        json.dump(config, f)
+    return home
+
+def time_variant(argv, runs, env):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, MAIN] + argv, env=env, cwd=ROOT,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "mean_ms": round(statistics.mean(samples), 1),
+        "p50_ms": round(samples[len(samples) // 2], 1),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 1),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    env = dict(os.environ, HOME=make_home(), SDL_AUDIODRIVER="dummy")
+    env.pop("XDG_CACHE_HOME", None)
+
+    print(f"{'variant':<28}{'mean':>10}{'p50':>10}{'p95':>10}")
+    for name, argv in VARIANTS.items():
+        r = time_variant(argv, args.runs, env)
+        print(f"{name:<28}{r['mean_ms']:>8}ms{r['p50_ms']:>8}ms{r['p95_ms']:>8}ms")
+
+if __name__ == "__main__":
+    main()
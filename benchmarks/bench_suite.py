@@ -0,0 +1,294 @@
+"""
+End-to-end timings against a synthetic heavy user.
+
+Builds a throwaway HOME holding 10k notes, 5k links, 1k clipboard entries and
+ten years of daily history, then times the hot paths in-process: config
+load/save, history logging, the status dashboard and the grid dashboard
+rendered to a string console, weather fetches answered by a local stub
+server (no network), and as-you-type search over a separate 30k-entry index.
+Your real config is never touched.
+
+    python benchmarks/bench_suite.py [--runs 20] [--json results.json]
+    python benchmarks/bench_suite.py --compare results.json [--threshold 0.2]
+
+--json writes machine-readable results; --compare times the current tree,
+prints the change against that file and exits 1 if any benchmark got slower
+by more than --threshold (a fraction of the baseline mean).
+"""
+import argparse
+import atexit
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+NOTES = 10000
+LINKS = 5000
+CLIPBOARD = 1000
+HISTORY_DAYS = 3650
+# The search benchmarks use their own index: a long clipboard history of
+# random words, about 200k of them distinct
+SEARCH_ENTRIES = 30000
+SEARCH_VOCAB = 250000
+
+def make_home():
+    """Points HOME at a fresh directory; must run before any module is imported."""
+    home = tempfile.mkdtemp(prefix="dailydash-bench-")
+    atexit.register(shutil.rmtree, home, ignore_errors=True)
+    os.environ["HOME"] = home
+    os.environ.pop("XDG_CACHE_HOME", None)
+    os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "hide"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    # data_handler copies a ./config.json it finds in the working directory
+    os.chdir(home)
+    return home
+
+def populate():
+    """Writes the synthetic profile through the same code paths the app uses."""
+    from modules import data_handler, migrations
+    from modules.clipboard_store import ClipboardStore
+
+    config = data_handler.DataManager.DEFAULT_CONFIG
+    sections = {name: json.loads(json.dumps(value)) for name, value in config.items()}
+    sections["user_profile"].update({"name": "Bench", "city": "Benchville", "daily_water_goal": 2500})
+    sections["daily_state"].update({
+        "last_login_date": date.today().isoformat(),
+        "current_water_intake": 1250,
+        "current_caffeine_intake": 180,
+        "tasks": [{"id": i, "text": f"Task number {i}", "done": i == 1, "budget": 25} for i in (1, 2, 3)]
+    })
+    persistent = sections["persistent_data"]
+    persistent["brain_dump_content"] = [f"Note {i}: remember to look into item {i * 7 % 1000}" for i in range(NOTES)]
+    persistent["parking_lot_links"] = [f"https://example.com/articles/{i}?ref=bench" for i in range(LINKS)]
+    persistent["habits"] = ["Read", "Stretch", "Journal"]
+    sections["app_settings"]["history_logging"] = True
+    for name, value in sections.items():
+        data_handler.write_section(name, value)
+    data_handler.write_section("schema_version", migrations.SCHEMA_VERSION)
+
+    store = ClipboardStore()
+    for i in range(CLIPBOARD):
+        # Every 50th entry is large enough to go to a blob file
+        text = f"clipboard entry {i} " * (300 if i % 50 == 0 else 3)
+        store.add(text)
+
+    today = date.today()
+    with open(data_handler.HISTORY_FILE, "w", newline="") as f:
+        f.write("Date,Water_ml,Caffeine_mg,Tasks_Completed,Daily_Note,Focus_Minutes,Sessions_Completed\n")
+        for n in range(HISTORY_DAYS, 0, -1):
+            day = today - timedelta(days=n)
+            f.write(f"{day.isoformat()},{1500 + n % 1000},{n % 300},{n % 4},day {n},{n % 120},{n % 5}\n")
+
+# --- Weather stub ---
+
+class _StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.startswith("/v1/search"):
+            body = {"results": [{"name": "Benchville", "latitude": 52.52, "longitude": 13.41}]}
+        else:
+            body = {
+                "current_weather": {"temperature": 18.4, "windspeed": 11.2, "weathercode": 2},
+                "hourly": {"relative_humidity_2m": [64] * 24}
+            }
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+def start_stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def build_search_index():
+    from modules.search_index import SearchIndex
+
+    rng = random.Random(0)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    vocab = ["".join(rng.choice(letters) for _ in range(rng.randint(3, 10))) for _ in range(SEARCH_VOCAB)]
+    index = SearchIndex()
+    for i in range(SEARCH_ENTRIES):
+        index.add("clip", f"h{i}", " ".join(rng.choice(vocab) for _ in range(12)))
+    return index
+
+# --- Benchmarks ---
+
+def string_console():
+    from rich.console import Console
+    return Console(file=io.StringIO(), width=140, force_terminal=True, color_system="truecolor")
+
+def build_benchmarks(stub_url):
+    """{name: zero-argument callable}. Imports the app only now that HOME is set up."""
+    from modules import data_handler, weather_api
+    from modules.ui import DailyDashUI
+
+    # Keep main.py's import-time checks off the benchmark's own arguments
+    argv, sys.argv = sys.argv, [os.path.join(ROOT, "main.py")]
+    try:
+        import main
+    finally:
+        sys.argv = argv
+
+    dm = data_handler.DataManager()
+    ui = DailyDashUI(string_console())
+
+    def load_lazy():
+        data_handler.DataManager()
+
+    def load_all_sections():
+        fresh = data_handler.DataManager()
+        for name in fresh.config:
+            fresh.config[name]
+
+    def save_persistent():
+        dm.config["persistent_data"]["brain_dump_content"].append("bench")
+        dm.save_config()
+        dm.config["persistent_data"]["brain_dump_content"].pop()
+
+    def log_history():
+        dm.log_daily_history()
+
+    def status_dashboard():
+        main.console = string_console()
+        main.command_status(None, show_hints=True, weather="Benchville: 18.4°C", vitals="CPU: 3%")
+
+    def grid_dashboard():
+        ui.console.file = io.StringIO()
+        ui.render_dashboard(dm, "Benchville: 18.4°C", "CPU: 3%", "IDLE")
+
+    weather_api.GEOCODING_URL = f"{stub_url}/v1/search"
+    weather_api.FORECAST_URL = f"{stub_url}/v1/forecast"
+
+    def weather_fetch():
+        weather_api._weather_cache["data"] = None
+        weather_api._fetch_weather_thread("Benchville", "metric")
+        if not weather_api._weather_cache["data"].startswith("Benchville:"):
+            raise RuntimeError(f"stub fetch failed: {weather_api._weather_cache['data']}")
+
+    def weather_cached():
+        weather_api.get_cached_weather("Benchville", "metric")
+
+    index = build_search_index()
+
+    def searcher(query):
+        return lambda: index.search(query)
+
+    return {
+        "config.load (lazy)": load_lazy,
+        "config.load (all sections)": load_all_sections,
+        "config.save (persistent_data)": save_persistent,
+        "history.log (10y)": log_history,
+        "render.command_status": status_dashboard,
+        "render.render_dashboard": grid_dashboard,
+        "weather.fetch (stub)": weather_fetch,
+        "weather.cached": weather_cached,
+        # Each keystroke in the finder is one search; these should stay well under a frame
+        "search.one letter (30k)": searcher("e"),
+        "search.prefix (30k)": searcher("abc"),
+        "search.substring (30k)": searcher("qxjv"),
+        "search.no match (30k)": searcher("zzqxv"),
+    }
+
+def time_call(func, runs):
+    func()  # warm-up: first-call imports and caches are not what we measure
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "runs": runs,
+        "mean_ms": round(statistics.mean(samples), 3),
+        "p50_ms": round(samples[len(samples) // 2], 3),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+        "min_ms": round(samples[0], 3),
+    }
+
+def compare(results, baseline, threshold):
+    """Prints the change per benchmark; returns the names that regressed past threshold."""
+    regressed = []
+    print(f"\n{'benchmark':<32}{'baseline':>12}{'now':>12}{'change':>10}")
+    for name, r in results.items():
+        old = baseline.get("results", {}).get(name)
+        if not old:
+            print(f"{name:<32}{'-':>12}{r['mean_ms']:>10.2f}ms{'new':>10}")
+            continue
+        change = (r["mean_ms"] - old["mean_ms"]) / old["mean_ms"] if old["mean_ms"] else 0.0
+        flag = "  !" if change > threshold else ""
+        print(f"{name:<32}{old['mean_ms']:>10.2f}ms{r['mean_ms']:>10.2f}ms{change:>+9.0%}{flag}")
+        if change > threshold:
+            regressed.append(name)
+    return regressed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="baseline JSON from an earlier --json run")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown before --compare fails (default 0.2)")
+    parser.add_argument("--only", metavar="TEXT", help="run benchmarks whose name contains TEXT")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    out_path = os.path.abspath(args.json) if args.json else None
+
+    make_home()
+    start = time.perf_counter()
+    populate()
+    setup_s = time.perf_counter() - start
+    server = start_stub_server()
+    benchmarks = build_benchmarks(f"http://127.0.0.1:{server.server_address[1]}")
+
+    results = {}
+    print(f"{'benchmark':<32}{'mean':>10}{'p50':>10}{'p95':>10}")
+    for name, func in benchmarks.items():
+        if args.only and args.only not in name:
+            continue
+        r = results[name] = time_call(func, args.runs)
+        print(f"{name:<32}{r['mean_ms']:>8.2f}ms{r['p50_ms']:>8.2f}ms{r['p95_ms']:>8.2f}ms")
+    server.shutdown()
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "dataset": {"notes": NOTES, "links": LINKS, "clipboard": CLIPBOARD, "history_days": HISTORY_DAYS},
+            "setup_s": round(setup_s, 2),
+        },
+        "results": results,
+    }
+    if out_path:
+        with open(out_path, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {out_path}")
+
+    if baseline is not None:
+        regressed = compare(results, baseline, args.threshold)
+        if regressed:
+            print(f"\n{len(regressed)} benchmark(s) slower than the baseline by more than {args.threshold:.0%}")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,54 +1,100 @@
 import argparse
+import asyncio
 import time
 import sys
 import os
+import shlex
 import threading
-try:
-    from plyer import notification
-except ImportError:
-    notification = None
+from collections import Counter
+from contextlib import contextmanager
 
 # Hide Pygame support prompt
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
 
-try:
-    from rich.console import Console
-    from rich.table import Table
-    from rich.panel import Panel
-    from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
-    from rich.layout import Layout
-    from rich.live import Live
-    from rich.align import Align
-    from rich import box
-    from rich.prompt import Prompt, IntPrompt, Confirm
-
-    from modules.data_handler import DataManager
-    from modules.audio_manager import AudioManager
-    from modules.clipboard_manager import ClipboardManager
-    from modules.weather_api import get_weather_for_city
-    from modules.themes import get_theme
-    import psutil
-except ImportError as e:
-    print(f"❌ Error: Missing dependencies. ({e})")
-    print("\nPlease make sure you are running in the virtual environment:")
-    print("  source venv/bin/activate")
-    print("  python main.py")
-    print("\nOR run directly:")
-    print("  ./venv/bin/python main.py")
-    sys.exit(1)
+# Tracing is switched on before anything it instruments is imported
+def _take_trace_arg(argv):
+    """Removes `--trace PATH` / `--trace=PATH` from argv and returns PATH (or None)."""
+    for i, arg in enumerate(argv):
+        if arg == "--trace" and i + 1 < len(argv):
+            path = argv[i + 1]
+            del argv[i:i + 2]
+            return path
+        if arg.startswith("--trace="):
+            del argv[i]
+            return arg.split("=", 1)[1]
+    return None
+
+from modules import tracing
+_trace_path = _take_trace_arg(sys.argv)
+if _trace_path:
+    tracing.enable(_trace_path)
+
+from modules import profiling
+if "--profile" in sys.argv[1:]:
+    sys.argv.remove("--profile")
+    profiling.enable()
+
+# Status bar fast path: answer `status --format ...` / `watch` before rich/pygame are imported
+from modules.status_line import wants_fast_status, run_fast_status
+if wants_fast_status(sys.argv[1:]):
+    with profiling.profiled("status-fast"):
+        code = run_fast_status(sys.argv[1:])
+    sys.exit(code)
+
+with tracing.span("import", cat="startup"):
+    try:
+        from rich.console import Console
+        from rich.table import Table
+        from rich.panel import Panel
+        from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
+        from rich.layout import Layout
+        from rich.live import Live
+        from rich.align import Align
+        from rich.text import Text
+        from rich import box
+        from rich.prompt import Prompt, IntPrompt, Confirm
+
+        from modules.data_handler import DataManager
+        from modules.audio_manager import AudioManager
+        from modules.clipboard_manager import ClipboardManager
+        from modules.weather_api import get_weather_for_city
+        from modules.themes import get_theme
+        from modules.scheduler import Scheduler
+        from modules import timer_store
+        from modules import pomodoro
+        from modules.timer_notifier import fire_timer
+        from modules.search_index import SearchIndex
+        from modules import notifications
+        from modules import toast
+        from modules import metrics
+        import psutil
+    except ImportError as e:
+        print(f"❌ Error: Missing dependencies. ({e})")
+        print("\nPlease make sure you are running in the virtual environment:")
+        print("  source venv/bin/activate")
+        print("  python main.py")
+        print("\nOR run directly:")
+        print("  ./venv/bin/python main.py")
+        sys.exit(1)
 
 # Initialize global objects
 console = Console()
 data_manager = DataManager()
+# One scheduler thread for reminders, timers, noise streaming and the clipboard poller
+scheduler = Scheduler()
 # Audio manager might be needed for noise command
-audio_manager = AudioManager()
+audio_manager = AudioManager(scheduler)
 # Clipboard Manager
-clipboard_manager = ClipboardManager(data_manager)
+clipboard_manager = ClipboardManager(data_manager, scheduler)
+
+# Full-text index for `find`, built on first search
+search_index = None
 
 # Load Theme
 current_theme_name = data_manager.get("app_settings", {}).get("theme", "default")
 T = get_theme(current_theme_name)
 
+@tracing.traced(cat="vitals")
 def get_system_vitals():
     p_cpu = psutil.cpu_percent(interval=None)
     # If first call returns 0.0, we just show it. It will normalize on next tick.
@@ -58,80 +104,76 @@ def get_system_vitals():
     batt_str = f"{batt.percent}%" if batt else "AC"
     return f"CPU: {p_cpu}% | RAM: {mem}% | Disk: {disk}% | PWR: {batt_str}"
 
-import subprocess
-timer_end_timestamp = None
-current_timer_id = None
-
-# Eye Strain Thread Logic
-def eye_strain_worker():
-    while True:
-        # Check config inside loop so we respect changes (simple poll)
-        # Note: In a real app we might want better signaling, but this suffices for CLI
-        settings = data_manager.get("app_settings", {})
-        enabled = settings.get("nag_eye_strain", True)
-        
-        if enabled:
-            # 20 minutes = 1200 seconds
-            time.sleep(1200)
-            # Re-check in case it was disabled during sleep
-            if data_manager.get("app_settings", {}).get("nag_eye_strain", True):
-                try:
-                    if notification:
-                        notification.notify(
-                            title='DailyDash Health',
-                            message='20-20-20 Rule:\nLook at something 20 feet away for 20 seconds.',
-                            app_name='DailyDash',
-                            timeout=10
-                        )
-                    else:
-                        # Fallback for systems without plyer support (e.g. servers?)
-                        pass 
-
-                    # Play a subtle ding if audio enabled
-                    if settings.get("audio_enabled", True):
-                         audio_manager.play_chime()
-                except Exception as e:
-                    # console.print(f"[dim]Notification failed: {e}[/dim]")
-                    pass
-        else:
-            time.sleep(60) # check again in a minute
-
-# Stand Up Thread Logic
-def stand_up_worker():
-    while True:
-        settings = data_manager.get("app_settings", {})
-        enabled = settings.get("nag_stand_up", True)
-        
-        if enabled:
-            # 60 minutes = 3600 seconds
-            time.sleep(3600)
-            if data_manager.get("app_settings", {}).get("nag_stand_up", True):
-                try:
-                    if notification:
-                        notification.notify(
-                            title='DailyDash Health',
-                            message='Time to Stand Up!\nStretch your legs for a bit.',
-                            app_name='DailyDash',
-                            timeout=10
-                        )
-                    
-                    if settings.get("audio_enabled", True):
-                         audio_manager.play_chime()
-                except Exception:
-                    pass
+# Message of the last command failure; batch mode stops on it
+last_error = None
+
+def report_error(message):
+    """Prints a command failure and records it for batch mode."""
+    global last_error
+    last_error = message
+    console.print(f"[red]{message}[/red]")
+
+NAG_INTERVALS = {
+    "nag_eye_strain": 1200,  # 20 minutes
+    "nag_stand_up": 3600     # 60 minutes
+}
+
+NAG_MESSAGES = {
+    "nag_eye_strain": '20-20-20 Rule:\nLook at something 20 feet away for 20 seconds.',
+    "nag_stand_up": 'Time to Stand Up!\nStretch your legs for a bit.'
+}
+
+def play_notification_sound():
+    # Play a subtle ding if audio enabled
+    if data_manager.get("app_settings", {}).get("audio_enabled", True):
+        audio_manager.play_chime()
+
+# One notification service for nags, timers and pomodoro alerts
+notifier = notifications.NotificationService(
+    scheduler,
+    preference=data_manager.get("app_settings", {}).get("notification_backend", "auto"),
+    play_sound=play_notification_sound
+)
+notifications.set_service(notifier)
+
+def send_nag(setting):
+    # Reminders due close together are merged into one notification
+    notifier.notify('DailyDash Health', NAG_MESSAGES[setting], sound=True)
+
+def schedule_nags():
+    """(Re)arms the health reminders on the shared scheduler from current settings."""
+    settings = data_manager.get("app_settings", {})
+    for setting, interval in NAG_INTERVALS.items():
+        if settings.get(setting, True):
+            if not scheduler.is_scheduled(setting):
+                scheduler.schedule(interval, send_nag, setting, interval=interval, key=setting)
         else:
-            time.sleep(60)
+            scheduler.cancel(setting)
 
-# Start Threads
+def _on_settings_change(event):
+    """Applies a saved settings change to the running services right away."""
+    global T
+    if len(event.path) < 2:
+        schedule_nags()
+        clipboard_manager.stop_monitoring()
+        clipboard_manager.start_monitoring()
+        return
+    key = event.path[1]
+    if key in NAG_INTERVALS:
+        schedule_nags()
+    elif key in ("clipboard_enabled", "clipboard_backend"):
+        clipboard_manager.stop_monitoring()
+        clipboard_manager.start_monitoring()
+    elif key == "theme":
+        T = get_theme(event.new or "default")
+    elif key == "notification_backend":
+        notifier.set_preference(event.new or "auto")
+
+# Start Background Services
+scheduler.start()
+schedule_nags()
 clipboard_manager.start_monitoring()
-
-# Start Eye Strain Thread
-eye_thread = threading.Thread(target=eye_strain_worker, daemon=True)
-eye_thread.start()
-
-# Start Stand Up Thread
-stand_thread = threading.Thread(target=stand_up_worker, daemon=True)
-stand_thread.start()
+data_manager.subscribe("app_settings", _on_settings_change)
 
 import random
 
@@ -145,7 +187,8 @@ QUOTES = [
     "Discipline is choosing between what you want now and what you want most."
 ]
 
-def command_status(args, show_hints=True):
+@tracing.traced(cat="render")
+def command_status(args, show_hints=True, weather=None, vitals=None):
     """
     Displays the 'Head-Up Display' summary:
     - Weather & System
@@ -159,14 +202,15 @@ def command_status(args, show_hints=True):
     name = user_profile.get("name", "User")
     city = user_profile.get("city", "Unknown")
     units = user_profile.get("unit_system", "metric")
-    weather_info = get_weather_for_city(city, units)
-    vitals = get_system_vitals()
+    # The interactive session passes in what its background tasks sampled
+    weather_info = weather if weather is not None else get_weather_for_city(city, units)
+    if vitals is None:
+        vitals = get_system_vitals()
     
     # 2. Daily State
-    daily_state = data_manager.get("daily_state", {})
-    tasks = daily_state.get("tasks", [])
-    water = daily_state.get("current_water_intake", 0)
-    caffeine = daily_state.get("current_caffeine_intake", 0)
+    daily = data_manager.daily()
+    water = daily.water
+    caffeine = daily.caffeine
     goal = user_profile.get("daily_water_goal", 2000)
     
     # 3. Persistent Data
@@ -183,7 +227,8 @@ def command_status(args, show_hints=True):
     header.add_column(justify="left", style=T["primary"])
     header.add_column(justify="right", style=T["accent"])
     header.add_row(f"Hi {name}!", f"DailyDash - {current_date} {current_time}")
-    console.print(header)
+    with tracing.span("print header", cat="render"):
+        console.print(header)
     
     # 2. Main Table (No Title)
     table = Table(box=box.ROUNDED, expand=True, padding=(0, 1), border_style=T["box"])
@@ -194,10 +239,11 @@ def command_status(args, show_hints=True):
     table.add_row("Weather", weather_info)
     
     # System
-    if timer_end_timestamp and timer_end_timestamp > time.time():
-        end_struct = time.localtime(timer_end_timestamp)
+    active_timer = timer_store.get_active_timer()
+    if active_timer:
+        end_struct = time.localtime(active_timer["deadline"])
         end_str = time.strftime("%H:%M", end_struct)
-        vitals += f" | ⏳ Ends: {end_str}"
+        vitals += f" | ⏳ {active_timer.get('label', 'Timer')} ends: {end_str}"
     table.add_row("System", f"[dim]{vitals}[/dim]")
 
     # Health (Water + Caffeine on same line)
@@ -214,23 +260,21 @@ def command_status(args, show_hints=True):
     
     # Tasks
     task_str = ""
-    for t in tasks:
-        icon = f"[{T['success']}]✔[/{T['success']}]" if t["done"] else f"[{T['error']}]☐[/{T['error']}]"
-        txt = t["text"] if t["text"] else f"[{T['dim']}]Empty[/{T['dim']}]"
-        if t.get("budget"):
-            txt += f" [{T['dim']}]({t['budget']})[/{T['dim']}]"
+    for t in daily.tasks:
+        icon = f"[{T['success']}]✔[/{T['success']}]" if t.done else f"[{T['error']}]☐[/{T['error']}]"
+        txt = t.text if t.text else f"[{T['dim']}]Empty[/{T['dim']}]"
+        if t.budget:
+            txt += f" [{T['dim']}]({t.budget})[/{T['dim']}]"
         task_str += f"{icon} {txt}\n"
     table.add_row("Big 3 Tasks", task_str.strip())
     
     # Habits
-    habits = persistent.get("habits", [])
-    habit_status = daily_state.get("habit_status", {})
+    habits = daily.habits(persistent.get("habits", []))
     habit_str = ""
     if habits:
         for h in habits:
-            is_done = habit_status.get(h, False)
-            icon = f"[{T['success']}]✔[/{T['success']}]" if is_done else f"[{T['error']}]☐[/{T['error']}]"
-            habit_str += f"{icon} {h}\n"
+            icon = f"[{T['success']}]✔[/{T['success']}]" if h.done else f"[{T['error']}]☐[/{T['error']}]"
+            habit_str += f"{icon} {h.name}\n"
     else:
         habit_str = f"[{T['dim']}]No habits set[/{T['dim']}]"
     table.add_row("Habits", habit_str.strip(), end_section=True)
@@ -251,7 +295,8 @@ def command_status(args, show_hints=True):
     
     table.add_row("Brain Dump", note_content)
 
-    console.print(table)
+    with tracing.span("print table", cat="render"):
+        console.print(table)
     
     # 3. Quote (Bottom)
     quote = random.choice(QUOTES)
@@ -292,13 +337,13 @@ def command_end_day(args):
     if Confirm.ask("[bold red]End Day & Reset?[/bold red] This will save stats and clear daily progress.", default=True):
         # Check setting
         logging_enabled = data_manager.get("app_settings", {}).get("history_logging", True)
+        logged = ""
         if logging_enabled:
             data_manager.log_daily_history()
-            console.print("[dim]History logged to CSV.[/dim]")
+            logged = " [dim]History logged to CSV.[/dim]"
             
         data_manager.confirm_new_day()
-        console.print("[green]Day reset. Good job today![/green]")
-        time.sleep(2.0)
+        show_toast(f"[green]Day reset. Good job today![/green]{logged}")
 
 # ... (Existing interactive_mode and main dispatcher updates)
 
@@ -312,6 +357,9 @@ def command_help(args):
 
 [bold]Dashboard[/bold]
   [green]status[/green]        Show the main dashboard (default).
+  [green]status --format json|line|template[/green]
+                Fast plain output for waybar/polybar/tmux.
+  [green]watch --interval N[/green]  Stay resident, print a line per tick or change.
   [green]setup[/green]         Run configuration wizard.
 
 [bold]Task Management[/bold]
@@ -321,8 +369,13 @@ def command_help(args):
   [green]task delete <id>[/green]    Clear task #<id>.
 
 [bold]Focus Tools[/bold]
-  [green]timer <min>[/green]       Start a blocking focus timer (default 25m).
-  [green]noise play[/green]        Play Brown Noise (Ctrl+C to stop).
+  [green]timer <min>[/green]       Start a focus timer (default 25m), survives exit.
+  [green]pomo start[/green]        Start Pomodoro cycles (work/short/long breaks).
+  [green]pomo skip|pause|resume|stop|status[/green]
+  [green]noise play[/green]        Stream brown/pink/white noise (b/p/w, +/- live, q to stop).
+  [green]noise play --color pink --volume 40[/green]
+  [green]noise set --color white[/green]  Save the default colour/volume.
+  [green]noise mix rain brown=0.3[/green]  Layered soundscape (rain, fan, storm, cabin, deep).
 
 [bold]Hydration[/bold]
   [green]water show[/green]        Show current intake.
@@ -334,10 +387,21 @@ def command_help(args):
   [green]note add <text>[/green]     Append a note.
   [green]note clear[/green]        Clear all notes.
 
+[bold]Search[/bold]
+  [green]find <words>[/green]      Search notes, links and clipboard (prefixes match).
+  [green]find <words> --kind clip[/green]  Only one kind: note, link or clip.
+
 [bold]Parking Lot (Links)[/bold]
   [green]link list[/green]         List saved URLs.
   [green]link add <url>[/green]      Save a URL.
   [green]link open <id>[/green]      Open URL in browser.
+
+[bold]Automation[/bold]
+  [green]batch [file][/green]       Run one command per line (stdin by default); saves once, stops at the first error.
+  [green]metrics[/green]           Save/weather/clipboard/render/timer counters in Prometheus format.
+  [green]metrics --textfile <path>[/green]  Write them for node-exporter's textfile collector.
+  [green]--profile <command>[/green]   Save a cProfile of the command (or of each dashboard key).
+  [green]profile report[/green]      Merge saved profiles into a hotspot table (--top, --sort, --only).
     """
     console.print(Panel(help_text, title="Help & Usage", border_style=T["success"]))
 
@@ -377,7 +441,7 @@ def command_setup(args):
     eod_journal = Confirm.ask("Enable End of Day Journal?", default=False)
     
     # 9. Clipboard
-    clipboard_en = Confirm.ask("Enable Clipboard Manager (Stores last 10 copied items)?", default=False)
+    clipboard_en = Confirm.ask("Enable Clipboard Manager (Keeps a searchable history of copied items)?", default=False)
     
     # 10. Habits (New)
     habits = []
@@ -418,8 +482,7 @@ def command_setup(args):
 
 def command_task(args):
     action = args.action
-    daily_state = data_manager.get("daily_state", {})
-    tasks = daily_state.get("tasks", [])
+    daily = data_manager.daily()
 
     if action == "list":
         table = Table(title="Current Tasks", box=box.SIMPLE, border_style=T["box"])
@@ -428,57 +491,50 @@ def command_task(args):
         table.add_column("Description")
         table.add_column("Est. Time", style=T["secondary"])
         
-        for t in tasks:
-            status = "[green]DONE[/green]" if t["done"] else "[red]TODO[/red]"
-            budget = f"({t['budget']})" if t.get("budget") else ""
-            table.add_row(str(t["id"]), status, t["text"] or "[dim]Empty[/dim]", budget)
+        for t in daily.tasks:
+            status = "[green]DONE[/green]" if t.done else "[red]TODO[/red]"
+            budget = f"({t.budget})" if t.budget else ""
+            table.add_row(str(t.id), status, t.text or "[dim]Empty[/dim]", budget)
         console.print(table)
         
     elif action == "add":
         text = " ".join(args.text)
         budget = args.budget if hasattr(args, 'budget') else None
         
-        found = False
-        for t in tasks:
-            if not t["text"]:
-                t["text"] = text
-                t["done"] = False
-                t["budget"] = budget
-                found = True
-                budget_str = f" [blue]({budget})[/blue]" if budget else ""
-                console.print(f"[green]Added task to slot {t['id']}:[/green] {text}{budget_str}")
-                break
-        if not found:
-            console.print("[yellow]All 3 task slots are full. Use 'task done <id>' or 'task delete <id>' first.[/yellow]")
+        slot = daily.free_slot()
+        if slot is None:
+            report_error("All 3 task slots are full. Use 'task done <id>' or 'task delete <id>' first.")
         else:
-            data_manager.save_config()
+            slot.assign(text, budget)
+            data_manager.save_daily(daily)
+            budget_str = f" [blue]({budget})[/blue]" if budget else ""
+            console.print(f"[green]Added task to slot {slot.id}:[/green] {text}{budget_str}")
 
     elif action == "done":
         try:
             t_id = int(args.target_id)
-            for t in tasks:
-                if t["id"] == t_id:
-                    t["done"] = True
-                    console.print(f"[green]Task {t_id} marked as done![/green]")
-                    data_manager.save_config()
-                    return
-            console.print(f"[red]Task ID {t_id} not found.[/red]")
+            task = daily.task(t_id)
+            if task is None:
+                report_error(f"Task ID {t_id} not found.")
+                return
+            task.done = True
+            data_manager.save_daily(daily)
+            console.print(f"[green]Task {t_id} marked as done![/green]")
         except:
-            console.print("[red]Invalid ID format.[/red]")
+            report_error("Invalid ID format.")
 
     elif action == "delete":
         try:
             t_id = int(args.target_id)
-            for t in tasks:
-                if t["id"] == t_id:
-                    t["text"] = ""
-                    t["done"] = False
-                    console.print(f"[yellow]Task {t_id} cleared.[/yellow]")
-                    data_manager.save_config()
-                    return
-            console.print(f"[red]Task ID {t_id} not found.[/red]")
+            task = daily.task(t_id)
+            if task is None:
+                report_error(f"Task ID {t_id} not found.")
+                return
+            task.clear()
+            data_manager.save_daily(daily)
+            console.print(f"[yellow]Task {t_id} cleared.[/yellow]")
         except:
-            console.print("[red]Invalid ID format.[/red]")
+            report_error("Invalid ID format.")
 
 def command_water(args):
     action = args.action
@@ -551,7 +607,12 @@ def command_note(args):
             valid_indices = {i for i in indices_to_delete if 1 <= i <= len(current_notes)}
             
             if not valid_indices:
-                console.print(f"[red]No valid IDs found in range 1-{len(current_notes)}.[/red]")
+                report_error(f"No valid IDs found in range 1-{len(current_notes)}.")
+                return
+            # Unknown IDs are skipped, but a batch must not half-apply a line
+            invalid = sorted(indices_to_delete - valid_indices)
+            if invalid and getattr(args, "in_batch", False):
+                report_error(f"ID(s) {', '.join(map(str, invalid))} out of range 1-{len(current_notes)}; nothing deleted.")
                 return
 
             # Delete (Filter method)
@@ -565,7 +626,7 @@ def command_note(args):
             console.print(f"[yellow]Deleted {deleted_count} note(s).[/yellow]")
             
         except ValueError:
-             console.print("[red]Invalid format. Use IDs like '1' or '1,3' or '1-5'.[/red]")
+             report_error("Invalid format. Use IDs like '1' or '1,3' or '1-5'.")
 
 def command_link(args):
     action = args.action
@@ -598,9 +659,9 @@ def command_link(args):
                 data_manager.save_config()
                 console.print(f"[yellow]Removed:[/yellow] {removed}")
             else:
-                console.print(f"[red]ID {link_id} out of range.[/red]")
+                report_error(f"ID {link_id} out of range.")
         except ValueError:
-            console.print("[red]Invalid ID format.[/red]")
+            report_error("Invalid ID format.")
 
     elif action == "open":
          try:
@@ -611,69 +672,229 @@ def command_link(args):
                 console.print(f"[green]Opening:[/green] {target}")
                 webbrowser.open(target)
             else:
-                console.print(f"[red]ID {link_id} out of range.[/red]")
+                report_error(f"ID {link_id} out of range.")
          except ValueError:
-            console.print("[red]Invalid ID format.[/red]")
+            report_error("Invalid ID format.")
+
+def arm_timer(timer, spawn_notifier=True):
+    """
+    Makes sure a persisted timer will fire even after this process exits:
+    the resident daemon or a detached notifier owns it. Long-lived sessions also
+    ring it in-process; whichever gets there first claims it.
+    """
+    if spawn_notifier:
+        timer_store.ensure_notifier(timer)
+    remaining = timer["deadline"] - time.time()
+    scheduler.schedule(remaining, ring_timer, timer["id"], key="timer")
+
+def ring_timer(timer_id):
+    fired = fire_timer(timer_id, audio_manager.play_chime)
+    # Follow pomodoro cycles; if we advanced the phase we also own its notifier
+    next_timer = timer_store.get_active_timer()
+    if next_timer and next_timer["id"] != timer_id:
+        arm_timer(next_timer, spawn_notifier=fired)
+
+def confirm_replace_timer(pomodoro_start=False):
+    """
+    Asks before a new timer replaces the running one; False if the user
+    declines. Menus call it before toasting(), which would swallow the prompt,
+    and pass confirmed=True to the command.
+    """
+    active = timer_store.get_active_timer()
+    if not active:
+        return True
+    if pomodoro_start:
+        question = f"A {active.get('label', 'timer')} is running. Replace it?"
+    else:
+        remaining = int((active["deadline"] - time.time()) / 60)
+        question = f"Timer already running ({remaining}m left). Cancel and start new?"
+    return Confirm.ask(f"[yellow]{question}[/yellow]", default=True)
 
 def command_timer(args):
     """
-    Non-blocking focus timer.
+    Non-blocking focus timer. The deadline is persisted, so it survives this process.
     """
-    global timer_end_timestamp, current_timer_id
-    
-    # Check if timer is already running
-    if timer_end_timestamp and timer_end_timestamp > time.time():
-        remaining = int((timer_end_timestamp - time.time()) / 60)
-        if not Confirm.ask(f"[yellow]Timer already running ({remaining}m left). Cancel and start new?[/yellow]", default=True):
-            console.print("[dim]Timer start cancelled.[/dim]")
-            return
+    if not getattr(args, "confirmed", False) and not confirm_replace_timer():
+        report_error("Timer start cancelled.")
+        return
 
     duration_min = args.duration
-    timer_end_timestamp = time.time() + duration_min * 60
+    # Replacing the persisted timer cancels the old one everywhere
+    timer = timer_store.start_timer(duration_min)
+    arm_timer(timer)
     
-    # Generate unique ID for this timer instance
-    this_timer_id = time.time()
-    current_timer_id = this_timer_id
+    console.print(f"[bold green]Timer started for {duration_min} minutes.[/bold green]")
+
+def command_pomo(args):
+    """
+    Pomodoro cycles: work / short break / long break, advancing automatically.
+    """
+    action = args.action
     
-    # Background thread for bell
-    def timer_bell(timer_id):
-        total_seconds = duration_min * 60
-        time.sleep(total_seconds)
+    if action == "start":
+        if not getattr(args, "confirmed", False) and not confirm_replace_timer(pomodoro_start=True):
+            report_error("Pomodoro start cancelled.")
+            return
+        timer = pomodoro.start(data_manager.get("app_settings", {}))
+        arm_timer(timer)
+        console.print(f"[bold green]Pomodoro started:[/bold green] {timer['label']} for {timer['minutes']} minutes.")
         
-        # Check if this timer is still the active one
-        if current_timer_id == timer_id:
-            audio_manager.play_chime()
+    elif action == "skip":
+        timer = pomodoro.skip()
+        if not timer:
+            report_error("No pomodoro running.")
+            return
+        arm_timer(timer)
+        console.print(f"[green]Skipped.[/green] Now: {timer['label']} ({timer['minutes']}m)")
+        
+    elif action == "pause":
+        if pomodoro.pause():
+            scheduler.cancel("timer")
+            console.print(f"[yellow]Paused[/yellow] with {timer_store.get_timer_status().split()[-1]} left.")
+        else:
+            report_error("No running pomodoro to pause.")
             
-            # Desktop Notification
-            try:
-                subprocess.Popen(['notify-send', 'DailyDash Timer', 'Time is up! Take a break.'])
-            except FileNotFoundError:
-                # notify-send might not be installed
-                pass
-            except Exception as e:
-                # unexpected error
-                pass
+    elif action == "resume":
+        timer = pomodoro.resume()
+        if timer:
+            arm_timer(timer)
+            console.print(f"[green]Resumed[/green] {timer['label']}: {timer_store.get_timer_status()} left.")
+        else:
+            report_error("Nothing paused.")
+            
+    elif action == "stop":
+        pomodoro.stop()
+        scheduler.cancel("timer")
+        console.print("[yellow]Pomodoro stopped.[/yellow]")
+        
+    elif action == "status":
+        timer = pomodoro.current()
+        focus_min, sessions = pomodoro.get_day_summary()
+        if timer:
+            state = timer["pomodoro"]
+            console.print(f"[{T['accent']}]{timer['label']}[/] (cycle {state['cycle']}): {timer_store.get_timer_status()}")
+        else:
+            console.print(f"[{T['dim']}]No pomodoro running.[/{T['dim']}]")
+        console.print(f"Today: [green]{sessions}[/green] session(s), [green]{focus_min}[/green] focus minutes")
 
-    t = threading.Thread(target=timer_bell, args=(this_timer_id,), daemon=True)
-    t.start()
-    
-    console.print(f"[bold green]Timer started for {duration_min} minutes.[/bold green]")
-    time.sleep(1)
+NOISE_STYLES = {"brown": "#964B00", "pink": "#FF69B4", "white": "white"}
+NOISE_KEYS = {"b": "brown", "p": "pink", "w": "white"}
+NOISE_VOLUME_STEP = 0.1
 
-def command_noise(args):
-    if args.action == "play":
-        console.print("[bold  #964B00]Playing Brown Noise... (Ctrl+C to stop)[/]")
-        audio_manager.toggle_brown_noise() # Starts playing
+def _noise_line(engine):
+    style = NOISE_STYLES.get(engine.color, "white")
+    return f"[bold {style}]{engine.color.title()} noise[/] at {round(engine.volume * 100)}%"
+
+def _audio_session(render, on_key, hint):
+    """
+    Keeps playing until q/Esc/Ctrl+C, passing every other key to on_key and
+    redrawing render() after it. Without a terminal it just waits for Ctrl+C.
+    """
+    try:
+        import termios
+        import tty
+        fd = sys.stdin.fileno()
+        old_attrs = termios.tcgetattr(fd)
+    except Exception:
+        console.print(f"{render()}... (Ctrl+C to stop)")
         try:
             while True:
                 time.sleep(1)
         except KeyboardInterrupt:
-            audio_manager.toggle_brown_noise() # Stops
-            console.print("\n[dim]Noise stopped.[/dim]")
+            pass
+        return
+
+    console.print(f"[dim]{hint} | q: stop[/dim]")
+    try:
+        tty.setcbreak(fd)
+        while True:
+            console.print(f"\r{render()}   ", end="")
+            key = _read_key(fd)
+            if key in ("q", "esc", "enter"):
+                break
+            on_key(key)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
+
+def _volume_key(key, current):
+    """New 0..1 volume for +/- keys, or None for any other key."""
+    if key in ("+", "=", "up"):
+        return min(1.0, current + NOISE_VOLUME_STEP)
+    if key in ("-", "_", "down"):
+        return max(0.0, current - NOISE_VOLUME_STEP)
+    return None
+
+def command_noise(args):
+    settings = data_manager.get("app_settings", {})
+    color = getattr(args, "color", None) or settings.get("noise_color", "brown")
+    volume = getattr(args, "volume", None)
+    volume = settings.get("noise_volume", 0.6) if volume is None else max(0, min(100, volume)) / 100.0
+
+    if args.action == "set":
+        data_manager.config["app_settings"]["noise_color"] = color
+        data_manager.config["app_settings"]["noise_volume"] = volume
+        data_manager.save_config()
+        console.print(f"[green]Noise set to {color} at {round(volume * 100)}%.[/green]")
+        return
+
+    if args.action == "mix":
+        command_noise_mix(args, volume)
+        return
+
+    if args.action == "play":
+        if not audio_manager.toggle_noise(color, volume):
+            report_error("Audio is unavailable.")
+            return
+        engine = audio_manager.noise
+
+        def on_key(key):
+            if key in NOISE_KEYS:
+                engine.set_color(NOISE_KEYS[key])
+            elif _volume_key(key, engine.volume) is not None:
+                engine.set_volume(_volume_key(key, engine.volume))
+
+        _audio_session(lambda: _noise_line(engine), on_key, "b/p/w: colour | +/-: volume")
+        audio_manager.toggle_noise() # Stops
+        # Remember the last colour/volume for next time
+        if (engine.color, engine.volume) != (settings.get("noise_color"), settings.get("noise_volume")):
+            data_manager.config["app_settings"]["noise_color"] = engine.color
+            data_manager.config["app_settings"]["noise_volume"] = round(engine.volume, 2)
+            data_manager.save_config()
+        console.print(f"\n[dim]Noise stopped. Synthesis used {engine.cpu_percent():.1f}% CPU.[/dim]")
+
+def command_noise_mix(args, volume):
+    """Plays a layered soundscape: presets and/or LAYER=GAIN pairs, else the saved mix."""
+    from modules import ambient
+    try:
+        mix = ambient.parse_mix(args.layers) if args.layers else data_manager.get("app_settings", {}).get("ambient_mix")
+    except ValueError as e:
+        report_error(f"{e}. Layers: {', '.join(ambient.LAYERS)}; presets: {', '.join(ambient.PRESETS)}")
+        return
+    mix = mix or dict(ambient.PRESETS["rain"])
+
+    missing = [kind for kind in mix if not ambient.layer_path(kind).exists()]
+    if missing:
+        console.print(f"[dim]Generating {', '.join(missing)} (first time only)...[/dim]")
+    if not audio_manager.play_mix(mix, volume):
+        report_error("Audio is unavailable.")
+        return
+    mixer = audio_manager.ambient
 
+    def render():
+        layers = ", ".join(f"{kind} {round(gain * 100)}%" for kind, gain in mixer.gains.items())
+        return f"[bold]{layers}[/bold] at {round(mixer.master * 100)}%"
 
-            audio_manager.toggle_brown_noise() # Stops
-            console.print("\n[dim]Noise stopped.[/dim]")
+    def on_key(key):
+        if _volume_key(key, mixer.master) is not None:
+            mixer.set_master(_volume_key(key, mixer.master))
+
+    _audio_session(render, on_key, "+/-: volume")
+    audio_manager.stop_mix()
+    data_manager.config["app_settings"]["ambient_mix"] = mix
+    data_manager.save_config()
+    console.print("\n[dim]Soundscape stopped.[/dim]")
 
 def command_clipboard(args):
     """
@@ -681,15 +902,335 @@ def command_clipboard(args):
     """
     settings = data_manager.get("app_settings", {})
     if not settings.get("clipboard_enabled", False):
-        console.print("[yellow]Clipboard Manager is DISABLED in settings.[/yellow]")
+        report_error("Clipboard Manager is DISABLED in settings.")
         return
         
     menu_clipboard()
+
+@tracing.traced(cat="search")
+def get_search_index():
+    """Builds the search index on first use; edits after that update it incrementally."""
+    global search_index
+    if search_index is None:
+        index = SearchIndex()
+        persistent = data_manager.get("persistent_data", {})
+        notes = persistent.get("brain_dump_content", [])
+        for note in notes if isinstance(notes, list) else []:
+            index.add("note", note, note)
+        for link in persistent.get("parking_lot_links", []):
+            index.add("link", link, link)
+        # Oldest first, so newer clipboard entries win ranking ties
+        for h, text in reversed(clipboard_manager.store.indexable()):
+            index.add("clip", h, text)
+        search_index = index
+        clipboard_manager.store.listener = _on_clipboard_event
+    return search_index
+
+def _on_clipboard_event(event, h, text):
+    if event == "add":
+        search_index.add("clip", h, text)
+    elif event == "del":
+        search_index.remove("clip", h)
+    elif event == "clear":
+        search_index.clear("clip")
+
+def update_search_index(kind, added=(), removed=()):
+    """Keeps an already built index in step with note/link edits."""
+    if search_index is None:
+        return
+    for text in removed:
+        search_index.remove(kind, text)
+    for text in added:
+        search_index.add(kind, text, text)
+
+def _on_list_change(kind):
+    """Subscriber that mirrors a saved note/link list into the search index."""
+    def on_change(event):
+        old = event.old if isinstance(event.old, list) else [event.old] if event.old is not None else []
+        new = event.new if isinstance(event.new, list) else [event.new] if event.new is not None else []
+        old_counts, new_counts = Counter(old), Counter(new)
+        update_search_index(kind, added=list((new_counts - old_counts).elements()),
+                            removed=list((old_counts - new_counts).elements()))
+    return on_change
+
+data_manager.subscribe("persistent_data.brain_dump_content", _on_list_change("note"))
+data_manager.subscribe("persistent_data.parking_lot_links", _on_list_change("link"))
+
+FIND_KIND_NAMES = {"note": "Note", "link": "Link", "clip": "Clip"}
+FIND_LIMIT = 20
+
+def _find_snippet(text, query, width=70):
+    """One line of text around the first query word, for result lists."""
+    flat = " ".join(text.split())
+    lower = flat.lower()
+    start = 0
+    for word in query.lower().split():
+        pos = lower.find(word)
+        if pos != -1:
+            start = max(0, min(pos - width // 3, len(flat) - width))
+            break
+    snippet = flat[start:start + width]
+    if start > 0:
+        snippet = "…" + snippet
+    if start + width < len(flat):
+        snippet += "…"
+    return snippet
+
+def _result_id(kind, ident):
+    """The ID that note/link/clipboard commands use for this result."""
+    if kind == "clip":
+        pos = clipboard_manager.store.position(ident)
+        return str(pos + 1) if pos is not None else "-"
+    key = "brain_dump_content" if kind == "note" else "parking_lot_links"
+    items = data_manager.get("persistent_data", {}).get(key, [])
+    return str(items.index(ident) + 1) if ident in items else "-"
+
+def _results_table(results, query, selected=None):
+    table = Table(box=box.SIMPLE, show_header=True, header_style=T["primary"], border_style=T["box"])
+    table.add_column("Type", style=T["secondary"], width=5)
+    table.add_column("ID", style=T["dim"], width=4)
+    table.add_column("Match", style=T["text"])
+    for i, (kind, ident, text) in enumerate(results):
+        snippet = Text(_find_snippet(text, query))
+        snippet.highlight_words(query.split(), style=f"bold {T['warning']}", case_sensitive=False)
+        table.add_row(FIND_KIND_NAMES[kind], _result_id(kind, ident), snippet, style="reverse" if i == selected else None)
+    return table
+
+def command_find(args):
+    query = " ".join(args.query)
+    limit = getattr(args, "limit", FIND_LIMIT)
+    results = get_search_index().search(query, limit=limit, kind=getattr(args, "kind", None))
+    if not results:
+        console.print(f"[{T['dim']}]No matches for '{query}'.[/{T['dim']}]")
+        return
+    console.print(_results_table(results, query))
+
+def _use_result(kind, ident, text):
+    """Enter on a finder result: open links, copy notes and clipboard entries."""
+    if kind == "link":
+        import webbrowser
+        webbrowser.open(ident)
+        return f"Opening: {ident}"
+    try:
+        clipboard_manager.copy_text(clipboard_manager.store.text_for(ident) if kind == "clip" else text)
+    except Exception:
+        return "Could not copy to the clipboard."
+    return "Copied to clipboard."
+
+def _read_key(fd):
+    """One keypress from a cbreak terminal; arrow keys come back as 'up'/'down'."""
+    import select
+    ch = os.read(fd, 1)
+    if ch == b"\x1b":
+        if select.select([fd], [], [], 0.05)[0]:
+            seq = os.read(fd, 2)
+            return {b"[A": "up", b"[B": "down"}.get(seq, "")
+        return "esc"
+    if ch in (b"\x7f", b"\x08"):
+        return "backspace"
+    if ch in (b"\r", b"\n"):
+        return "enter"
+    if ch in (b"\x03", b"\x04"):
+        return "esc"
+    # Multi-byte UTF-8: read the continuation bytes
+    extra = {0xC0: 1, 0xE0: 2, 0xF0: 3}.get(ch[0] & 0xF0 if ch[0] >= 0xF0 else ch[0] & 0xE0, 0)
+    if extra:
+        ch += os.read(fd, extra)
+    return ch.decode("utf-8", errors="ignore")
+
+def menu_find():
+    """As-you-type finder over notes, links and clipboard history."""
+    index = get_search_index()
+    try:
+        import termios
+        import tty
+        fd = sys.stdin.fileno()
+        old_attrs = termios.tcgetattr(fd)
+    except Exception:
+        # No raw terminal (e.g. Windows): search one query at a time
+        while True:
+            cls()
+            console.print(f"[{T['primary']}]Find ({len(index)} items)[/{T['primary']}]")
+            query = Prompt.ask("Search (Enter to go back)", default="", show_default=False)
+            if not query.strip():
+                break
+            results = index.search(query, limit=FIND_LIMIT)
+            if not results:
+                show_toast(f"[{T['dim']}]No matches.[/{T['dim']}]")
+                continue
+            console.print(_results_table(results, query))
+            pick = IntPrompt.ask("Result # to use (0 to search again)", default=0)
+            if 1 <= pick <= len(results):
+                show_toast(f"[green]{_use_result(*results[pick - 1])}[/green]")
+        return
+
+    query = ""
+    selected = 0
+    try:
+        tty.setcbreak(fd)
+        while True:
+            results = index.search(query, limit=FIND_LIMIT) if query.strip() else []
+            selected = min(selected, max(0, len(results) - 1))
+            cls()
+            console.print(f"[{T['primary']}]Find ({len(index)} items)[/{T['primary']}]  [dim]↑/↓ select | Enter use | Esc back[/dim]")
+            console.print(f"> {query}", markup=False)
+            if results:
+                console.print(_results_table(results, query, selected))
+            elif query.strip():
+                console.print(f"[{T['dim']}]No matches.[/{T['dim']}]")
+
+            key = _read_key(fd)
+            if key == "esc":
+                break
+            elif key == "enter":
+                if results:
+                    termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
+                    show_toast(f"[green]{_use_result(*results[selected])}[/green]")
+                    tty.setcbreak(fd)
+            elif key == "backspace":
+                query = query[:-1]
+                selected = 0
+            elif key == "up":
+                selected = max(0, selected - 1)
+            elif key == "down":
+                selected += 1
+            elif key and key.isprintable():
+                query += key
+                selected = 0
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
+
+def command_metrics(args):
+    """Prints the recorded metrics in the Prometheus text format, or writes them to a file."""
+    if args.reset:
+        metrics.reset()
+        console.print("[green]Metrics reset.[/green]")
+        return
+    # Include what this process has recorded so far
+    metrics.flush()
+    if args.textfile:
+        if not metrics.write_textfile(args.textfile):
+            report_error(f"Cannot write {args.textfile}")
+            return
+        console.print(f"[green]Metrics written to {args.textfile}[/green]")
+        return
+    text = metrics.render()
+    if not text:
+        console.print(f"[{T['dim']}]No metrics recorded yet.[/{T['dim']}]")
+        return
+    # Plain print: the exposition format must not be wrapped or marked up
+    print(text, end="")
+
+def command_profile(args):
+    """Lists, merges into a hotspot report, or deletes the saved --profile runs."""
+    if args.action == "clear":
+        console.print(f"[green]Removed {profiling.clear()} profile(s).[/green]")
+        return
+    files = profiling.list_profiles(args.only)
+    if not files:
+        console.print(f"[{T['dim']}]No profiles yet. Run a command with --profile (or set {profiling.ENV_VAR}=1).[/{T['dim']}]")
+        return
+    if args.action == "list":
+        for path in files:
+            console.print(f"{path.name}  [{T['dim']}]{path.stat().st_size // 1024} KB[/{T['dim']}]")
+        console.print(f"[{T['dim']}]{profiling.profiles_dir()}[/{T['dim']}]")
+        return
+    counts = Counter(path.stem.split("-", 3)[-1] for path in files)
+    console.print(f"[{T['primary']}]Merged {len(files)} profile(s):[/{T['primary']}] " + ", ".join(f"{label} ×{n}" for label, n in counts.most_common()))
+    # pstats' own table: plain text, not rich markup
+    sys.stdout.flush()
+    profiling.report(top=args.top, sort=args.sort, label=args.only, stream=sys.stdout)
+
+# Interactive commands, or ones that would recurse
+BATCH_EXCLUDED = {"batch", "config", "setup", "watch", "clipboard"}
+
+def _run_batch_command(parser, tokens):
+    """Runs one batch line's tokens. Returns an error message, or None on success."""
+    global last_error
+    try:
+        args = parser.parse_args(tokens)
+    except SystemExit:
+        return "invalid command"  # argparse has printed the usage
+    if args.command in BATCH_EXCLUDED or (args.command == "noise" and args.action in ("play", "mix")):
+        return f"'{' '.join(tokens[:2])}' can't run in a batch"
+    # Replays never stop to ask: a new timer replaces the running one, as
+    # the prompt's default answer would
+    args.confirmed = True
+    args.in_batch = True
+    last_error = None
+    try:
+        dispatch(args)
+    except Exception as e:
+        return str(e) or type(e).__name__
+    return last_error
+
+def command_batch(args):
+    """
+    Runs newline-delimited commands (CLI syntax, '#' comments) against one
+    DataManager and saves once at the end. Stops at the first failure; the
+    commands before it are kept. Returns False if a command failed.
+    """
+    try:
+        if args.file == "-":
+            lines = sys.stdin.read().splitlines()
+        else:
+            with open(args.file, 'r') as f:
+                lines = f.read().splitlines()
+    except OSError as e:
+        report_error(f"Cannot read {args.file}: {e}")
+        return False
+
+    parser = build_parser()
+    done = 0
+    failed = False
+    with data_manager.batch():
+        for number, line in enumerate(lines, 1):
+            try:
+                tokens = shlex.split(line, comments=True)
+            except ValueError as e:
+                error = str(e)
+            else:
+                if tokens and tokens[0] == "dailydash":
+                    tokens = tokens[1:]
+                if not tokens:
+                    continue
+                error = _run_batch_command(parser, tokens)
+            if error:
+                console.print(f"[red]✗ {number}:[/red] {line.strip()} [{T['dim']}]({error})[/{T['dim']}]")
+                failed = True
+                break
+            done += 1
+            console.print(f"[green]✓ {number}:[/green] {line.strip()}")
+
+    if failed:
+        console.print(f"[yellow]Stopped after {done} command(s); later lines were not run.[/yellow]")
+        return False
+    console.print(f"[green]{done} command(s) applied.[/green]")
+    return True
+
 def cls():
     # Fast clear using Rich or ANSI directly
     print("\033[H\033[J", end="")
+    # Every frame starts with the live toast, if any
+    message = toast.current()
+    if message is not None:
+        console.print(message)
+
+def show_toast(message):
+    """Shows `message` (markup) at the top of the next frames instead of pausing to let it be read."""
+    toast.show(message)
+
+@contextmanager
+def toasting():
+    """Turns whatever the enclosed command prints into the toast."""
+    with console.capture() as capture:
+        yield
+    output = capture.get().strip()
+    if output:
+        toast.show(Text.from_ansi(output))
 
 def shutdown_sequence():
+    toast.clear()
     # Helper to capture EOD note if enabled
     settings = data_manager.get("app_settings", {})
     if settings.get("eod_journal_enabled", False):
@@ -701,8 +1242,7 @@ def shutdown_sequence():
         if note.strip():
             # Log with note
             data_manager.log_daily_history(note=note.strip())
-            console.print("[green]Note saved.[/green]")
-            time.sleep(1.0)
+            show_toast("[green]Note saved.[/green]")
         else:
             # Still update stats on exit even if no note
             data_manager.log_daily_history()
@@ -722,69 +1262,290 @@ def shutdown_sequence():
     console.print(Align.center(f"[italic]{msg}[/italic]\n\n"))
     sys.exit(0)
 
-def interactive_mode():
+INTERACTIVE_MENU = "w: Water | c: Coffee | t: Task | k: Timer | p: Pomodoro | b: Brain Dump | s: Saved URLs | h: Habits | v: Clipboard | f: Find | e: End Day | m: Menu | q: Quit"
+
+def _interactive_action(choice):
+    """Runs one dashboard key. Submenus and prompts take over the terminal until done."""
+    with tracing.span(f"key {choice}", cat="dashboard"), profiling.profiled(f"key-{choice}"):
+        _run_interactive_action(choice)
+
+def _run_interactive_action(choice):
+    if choice == "w":
+        # Add Water (default amount)
+        args = argparse.Namespace(action="add")
+        with toasting():
+            command_water(args)
+        
+    elif choice == "c":
+        # Coffee - Changed from k
+        args = argparse.Namespace(action="add")
+        with toasting():
+            command_coffee(args)
+        
+    elif choice == "e":
+        # End Day
+        command_end_day(None)
+        
+    elif choice == "t":
+        # Task Menu
+        menu_task()
+    
+    elif choice == "k":
+        # Timer - Changed from c
+        mins = IntPrompt.ask("Duration (minutes)", default=25)
+        if confirm_replace_timer():
+            args = argparse.Namespace(duration=mins, confirmed=True)
+            with toasting():
+                command_timer(args)
+        else:
+            show_toast("[dim]Timer start cancelled.[/dim]")
+        
+    elif choice == "p":
+        menu_pomodoro()
+        
+    elif choice == "b":
+        # Brain Dump
+        menu_note()
+    
+    elif choice == "s":
+        # Saved URLs - Changed from p
+        menu_parking_lot()
+
+    elif choice == "h":
+        # Habit Menu
+        menu_habit()
+
+    elif choice == "v":
+        command_clipboard(None)
+
+    elif choice == "f":
+        menu_find()
+    
+    elif choice == "m":
+        menu_more_settings()
+
+# Idle dashboard: vitals are sampled this often (shown on the next redraw),
+# weather and other processes' edits are checked this often
+VITALS_INTERVAL = 10
+WEATHER_INTERVAL = 60
+RELOAD_INTERVAL = 2
+# A resident dashboard merges its metrics into the shared file this often
+METRICS_FLUSH_INTERVAL = 60
+
+class DashboardSession:
     """
-    Main interactive loop.
+    The interactive dashboard on an asyncio loop. Keys arrive through a reader
+    on stdin (no Enter needed). The dashboard redraws after each action, on
+    the minute, and when data changes, including edits from other dailydash
+    processes. Vitals and weather lookups run in the default executor, so a
+    slow query never stalls input, and an idle session just waits in select().
+
+    Reminders, timers, noise and clipboard watching keep running on the
+    shared scheduler thread, which already sleeps until its next event.
+    Submenus are modal: they run on a worker thread with the terminal back in
+    normal mode, and the dashboard stops redrawing until they finish, while
+    the loop itself keeps going.
     """
-    while True:
+    def __init__(self):
+        self.fd = sys.stdin.fileno()
+        self.loop = None
+        self.keys = None
+        self.dirty = None
+        self.idle = None
+        self.tty_attrs = None
+        self.weather = None
+        self.vitals = ""
+
+    def run(self):
+        asyncio.run(self._main())
+
+    async def _main(self):
+        self.loop = asyncio.get_running_loop()
+        self.keys = asyncio.Queue()
+        self.dirty = asyncio.Event()
+        self.idle = asyncio.Event()
+        self.idle.set()
+        await self._sample_vitals()
+        await self._lookup_weather()
+        handle = data_manager.subscribe("", self._on_data_change)
+        tasks = [asyncio.create_task(job()) for job in
+                 (self._render_loop, self._clock_loop, self._vitals_loop, self._weather_loop, self._reload_loop)]
+        self._grab_keys()
+        self.dirty.set()
         try:
+            while True:
+                key = await self.keys.get()
+                if key == "q":
+                    return
+                if key not in INTERACTIVE_KEYS:
+                    continue
+                self._release_keys()
+                self.idle.clear()
+                try:
+                    await self._run_action(key)
+                finally:
+                    self._grab_keys()
+                    self.idle.set()
+                    self.dirty.set()
+        finally:
+            self._release_keys()
+            for task in tasks:
+                task.cancel()
+            data_manager.unsubscribe(handle)
+
+    # --- Terminal ---
+
+    def _grab_keys(self):
+        import termios
+        import tty
+        self.tty_attrs = termios.tcgetattr(self.fd)
+        tty.setcbreak(self.fd)
+        self.loop.add_reader(self.fd, self._on_input)
+
+    def _release_keys(self):
+        import termios
+        if self.tty_attrs is None:
+            return
+        self.loop.remove_reader(self.fd)
+        termios.tcsetattr(self.fd, termios.TCSADRAIN, self.tty_attrs)
+        self.tty_attrs = None
+
+    def _on_input(self):
+        key = _read_key(self.fd)
+        if key:
+            self.keys.put_nowait(key.lower())
+
+    def _on_data_change(self, event):
+        # Saves may come from the scheduler thread
+        self.loop.call_soon_threadsafe(self.dirty.set)
+
+    async def _run_action(self, key):
+        """
+        Runs _interactive_action(key) on its own thread and waits for it. A
+        daemon thread rather than the default executor: after Ctrl-C the app
+        exits without waiting for a prompt that is still reading stdin.
+        """
+        done = self.loop.create_future()
+
+        def settle(error):
+            if done.done():
+                return
+            if error is None:
+                done.set_result(None)
+            else:
+                done.set_exception(error)
+
+        def work():
+            error = None
+            try:
+                _interactive_action(key)
+            except BaseException as e:
+                error = e
+            try:
+                self.loop.call_soon_threadsafe(settle, error)
+            except RuntimeError:
+                pass  # The session ended (Ctrl-C) while this prompt was open
+
+        threading.Thread(target=work, name="dailydash-action", daemon=True).start()
+        await done
+
+    # --- Tasks ---
+
+    @tracing.traced(cat="dashboard")
+    def render(self):
+        with metrics.timed("dailydash_render_seconds"):
             cls()
-            # Show Dashboard
-            command_status(None, show_hints=False)
-            
-            # Interactive Prompt
+            command_status(None, show_hints=False, weather=self.weather, vitals=self.vitals)
             console.print(f"\n[{T['primary']}]Interactive Menu[/{T['primary']}]")
-            console.print("[dim]w: Water | c: Coffee | t: Task | k: Timer | b: Brain Dump | s: Saved URLs | h: Habits | v: Clipboard | e: End Day | m: Menu | q: Quit[/dim]")
+            console.print(f"[dim]{INTERACTIVE_MENU}[/dim]")
+        fade = toast.remaining()
+        if fade:
+            # Redraw without it once it expires
+            self.loop.call_later(fade, self.dirty.set)
+
+    async def _render_loop(self):
+        while True:
+            await self.dirty.wait()
+            # A submenu owns the screen; redraw once it is done
+            await self.idle.wait()
+            self.dirty.clear()
+            self.render()
+
+    async def _clock_loop(self):
+        while True:
+            await asyncio.sleep(60 - time.time() % 60)
+            self.dirty.set()
+
+    async def _sample_vitals(self):
+        self.vitals = await self.loop.run_in_executor(None, get_system_vitals)
+
+    async def _vitals_loop(self):
+        while True:
+            await asyncio.sleep(VITALS_INTERVAL)
+            await self._sample_vitals()
+
+    async def _lookup_weather(self):
+        profile = data_manager.get("user_profile", {})
+        weather = await self.loop.run_in_executor(
+            None, get_weather_for_city, profile.get("city", "Unknown"), profile.get("unit_system", "metric"))
+        if weather != self.weather:
+            self.weather = weather
+            self.dirty.set()
+
+    async def _weather_loop(self):
+        while True:
+            await asyncio.sleep(WEATHER_INTERVAL)
+            await self._lookup_weather()
+
+    async def _reload_loop(self):
+        while True:
+            await asyncio.sleep(RELOAD_INTERVAL)
+            # A few stat() calls; changes reach us through the subscription
+            data_manager.reload_if_changed()
+
+INTERACTIVE_KEYS = set("wcetkpbshvfm")
+
+def interactive_mode():
+    """
+    Main interactive loop: the asyncio dashboard on a POSIX terminal, else
+    the line-prompt loop.
+    """
+    try:
+        import termios
+        async_ok = sys.stdin.isatty()
+    except ImportError:
+        async_ok = False
+
+    scheduler.schedule(METRICS_FLUSH_INTERVAL, metrics.flush, interval=METRICS_FLUSH_INTERVAL, key="metrics_flush")
+
+    if async_ok:
+        try:
+            DashboardSession().run()
+        except KeyboardInterrupt:
+            pass
+        shutdown_sequence()
+        return
 
-            choice = Prompt.ask("Command", choices=["w", "c", "t", "k", "b", "s", "h", "v", "e", "m", "q"], default="q", show_choices=False, show_default=False)
+    while True:
+        try:
+            # Another dailydash process may have saved meanwhile
+            data_manager.reload_if_changed()
+            with metrics.timed("dailydash_render_seconds"):
+                cls()
+                # Show Dashboard
+                command_status(None, show_hints=False)
+
+                # Interactive Prompt
+                console.print(f"\n[{T['primary']}]Interactive Menu[/{T['primary']}]")
+                console.print(f"[dim]{INTERACTIVE_MENU}[/dim]")
+
+            choice = Prompt.ask("Command", choices=["w", "c", "t", "k", "p", "b", "s", "h", "v", "f", "e", "m", "q"], default="q", show_choices=False, show_default=False)
             
             if choice == "q":
                 shutdown_sequence()
                 break
-                
-            elif choice == "w":
-                # Add Water (default amount)
-                args = argparse.Namespace(action="add")
-                command_water(args)
-                time.sleep(1.0)
-                
-            elif choice == "c":
-                # Coffee - Changed from k
-                args = argparse.Namespace(action="add")
-                command_coffee(args)
-                time.sleep(1.0)
-                
-            elif choice == "e":
-                # End Day
-                command_end_day(None)
-                
-            elif choice == "t":
-                # Task Menu
-                menu_task()
-            
-            elif choice == "k":
-                # Timer - Changed from c
-                mins = IntPrompt.ask("Duration (minutes)", default=25)
-                args = argparse.Namespace(duration=mins)
-                command_timer(args)
-                
-            elif choice == "b":
-                # Brain Dump
-                menu_note()
-            
-            elif choice == "s":
-                # Saved URLs - Changed from p
-                menu_parking_lot()
-
-            elif choice == "h":
-                # Habit Menu
-                menu_habit()
 
-            elif choice == "v":
-                command_clipboard(None)
-            
-            elif choice == "m":
-                menu_more_settings()
+            _interactive_action(choice)
                 
         except KeyboardInterrupt:
             shutdown_sequence()
@@ -807,8 +1568,8 @@ def menu_task():
         elif choice == "x":
             target = IntPrompt.ask("Task ID to mark done")
             args = argparse.Namespace(action="done", target_id=str(target))
-            command_task(args)
-            time.sleep(1.0)
+            with toasting():
+                command_task(args)
             
         elif choice == "a":
             text = Prompt.ask("Task Description")
@@ -817,26 +1578,41 @@ def menu_task():
                 budget_arg = budget if budget else None
                 
                 args = argparse.Namespace(action="add", text=[text], budget=budget_arg)
-                command_task(args)
-                time.sleep(1.0)
+                with toasting():
+                    command_task(args)
                 
         elif choice == "d":
             target = IntPrompt.ask("Task ID to delete")
             args = argparse.Namespace(action="delete", target_id=str(target))
-            command_task(args)
-            time.sleep(1.0)
+            with toasting():
+                command_task(args)
 
         elif choice == "c":
             if Confirm.ask("Clear ALL tasks?"):
-                # Manual clear logic
-                data_manager.config["daily_state"]["tasks"] = [
-                    {"id": 1, "text": "", "done": False},
-                    {"id": 2, "text": "", "done": False},
-                    {"id": 3, "text": "", "done": False}
-                ]
-                data_manager.save_config()
-                console.print("[green]All tasks cleared.[/green]")
-                time.sleep(1.0)
+                daily = data_manager.daily()
+                daily.clear_tasks()
+                data_manager.save_daily(daily)
+                show_toast("[green]All tasks cleared.[/green]")
+
+def menu_pomodoro():
+    while True:
+        cls()
+        console.print(f"[{T['primary']}]Pomodoro[/{T['primary']}]")
+        command_pomo(argparse.Namespace(action="status"))
+        
+        console.print("\n[dim]s: Start | n: Skip | p: Pause | r: Resume | x: Stop | b: Back[/dim]")
+        choice = Prompt.ask("Action", choices=["s", "n", "p", "r", "x", "b"], default="b", show_choices=False, show_default=False)
+        
+        if choice == "b":
+            break
+            
+        if choice == "s" and not confirm_replace_timer(pomodoro_start=True):
+            show_toast("[dim]Pomodoro start cancelled.[/dim]")
+            continue
+
+        actions = {"s": "start", "n": "skip", "p": "pause", "r": "resume", "x": "stop"}
+        with toasting():
+            command_pomo(argparse.Namespace(action=actions[choice], confirmed=True))
 
 def menu_parking_lot():
     while True:
@@ -856,28 +1632,27 @@ def menu_parking_lot():
             url = Prompt.ask("URL to save")
             if url:
                 args = argparse.Namespace(action="add", url=url)
-                command_link(args)
-                time.sleep(1.5)
+                with toasting():
+                    command_link(args)
                 
         elif choice == "d":
             target = IntPrompt.ask("Link ID to delete")
             args = argparse.Namespace(action="delete", target_id=str(target))
-            command_link(args)
-            time.sleep(1.5)
+            with toasting():
+                command_link(args)
 
         elif choice == "x":
             # Clear All
             if Confirm.ask("Are you sure you want to DELETE ALL saved links?", default=False):
                 data_manager.config["persistent_data"]["parking_lot_links"] = []
                 data_manager.save_config()
-                console.print("[green]All links cleared.[/green]")
-                time.sleep(1.5)
+                show_toast("[green]All links cleared.[/green]")
 
         elif choice == "o":
             target = IntPrompt.ask("Link ID to open")
             args = argparse.Namespace(action="open", target_id=str(target))
-            command_link(args)
-            time.sleep(1.5)
+            with toasting():
+                command_link(args)
 
 def menu_note():
     while True:
@@ -897,21 +1672,21 @@ def menu_note():
             text = Prompt.ask("Note content")
             if text:
                 args = argparse.Namespace(action="add", text=[text])
-                command_note(args)
-                time.sleep(1.0)
+                with toasting():
+                    command_note(args)
                 
         elif choice == "d":
             target = Prompt.ask("Note IDs to delete (e.g. 1,3 or 1-5)")
             if target:
                 args = argparse.Namespace(action="delete", target_id=str(target))
-                command_note(args)
-                time.sleep(1.0)
+                with toasting():
+                    command_note(args)
 
         elif choice == "c":
             if Confirm.ask("Clear ALL notes?"):
                 args = argparse.Namespace(action="clear")
-                command_note(args)
-                time.sleep(1.0)
+                with toasting():
+                    command_note(args)
 
 def menu_edit_profile():
     while True:
@@ -942,8 +1717,7 @@ def menu_edit_profile():
             data_manager.save_config()
             # Force update weather cache? 
             # Ideally modules.weather_api._weather_cache should be cleared or updated, but a restart fixes it.
-            console.print("[yellow]Weather will update on next refresh.[/yellow]")
-            time.sleep(1.5)
+            show_toast("[yellow]Weather will update on next refresh.[/yellow]")
 
         elif choice == "3":
             new_val = IntPrompt.ask("Enter Daily Water Goal", default=p.get('daily_water_goal', 2000))
@@ -985,16 +1759,15 @@ def menu_more_settings():
         elif choice == "1":
             # Undo Water
             args = argparse.Namespace(action="undo")
-            command_water(args)
-            time.sleep(1.5)
+            with toasting():
+                command_water(args)
             
         elif choice == "2":
             # Reset Water
             if Confirm.ask("Reset daily water intake to 0?"):
                 data_manager.config["daily_state"]["current_water_intake"] = 0
                 data_manager.save_config()
-                console.print("[green]Water reset.[/green]")
-                time.sleep(1.5)
+                show_toast("[green]Water reset.[/green]")
                 
         elif choice == "3":
             command_setup(None)
@@ -1006,8 +1779,7 @@ def menu_more_settings():
             data_manager.config["app_settings"]["history_logging"] = new_val
             data_manager.save_config()
             status = "ON" if new_val else "OFF"
-            console.print(f"[green]History Logging is now {status}[/green]")
-            time.sleep(1.5)
+            show_toast(f"[green]History Logging is now {status}[/green]")
 
         elif choice == "5":
             curr = data_manager.get("app_settings", {}).get("nag_eye_strain", True)
@@ -1015,8 +1787,7 @@ def menu_more_settings():
             data_manager.config["app_settings"]["nag_eye_strain"] = new_val
             data_manager.save_config()
             status = "ON" if new_val else "OFF"
-            console.print(f"[green]Eye Strain Reminder is now {status}[/green]")
-            time.sleep(1.5)
+            show_toast(f"[green]Eye Strain Reminder is now {status}[/green]")
 
         elif choice == "6":
             curr = data_manager.get("app_settings", {}).get("eod_journal_enabled", False)
@@ -1024,8 +1795,7 @@ def menu_more_settings():
             data_manager.config["app_settings"]["eod_journal_enabled"] = new_val
             data_manager.save_config()
             status = "ON" if new_val else "OFF"
-            console.print(f"[green]EOD Journal is now {status}[/green]")
-            time.sleep(1.5)
+            show_toast(f"[green]EOD Journal is now {status}[/green]")
 
         elif choice == "7":
             curr = data_manager.get("app_settings", {}).get("clipboard_enabled", False)
@@ -1034,14 +1804,7 @@ def menu_more_settings():
             data_manager.save_config()
             
             status = "ON" if new_val else "OFF"
-            console.print(f"[green]Clipboard Manager is now {status}[/green]")
-            
-            if new_val:
-                clipboard_manager.start_monitoring()
-            else:
-                clipboard_manager.stop_monitoring()
-            
-            time.sleep(1.5)
+            show_toast(f"[green]Clipboard Manager is now {status}[/green]")
 
         elif choice == "8":
             curr = data_manager.get("app_settings", {}).get("audio_enabled", True)
@@ -1049,8 +1812,7 @@ def menu_more_settings():
             data_manager.config["app_settings"]["audio_enabled"] = new_val
             data_manager.save_config()
             status = "ON" if new_val else "OFF"
-            console.print(f"[green]Audio is now {status}[/green]")
-            time.sleep(1.5)
+            show_toast(f"[green]Audio is now {status}[/green]")
 
         elif choice == "9":
             curr = data_manager.get("app_settings", {}).get("nag_stand_up", True)
@@ -1058,8 +1820,7 @@ def menu_more_settings():
             data_manager.config["app_settings"]["nag_stand_up"] = new_val
             data_manager.save_config()
             status = "ON" if new_val else "OFF"
-            console.print(f"[green]Stand Up Reminder is now {status}[/green]")
-            time.sleep(1.5)
+            show_toast(f"[green]Stand Up Reminder is now {status}[/green]")
 
         elif choice == "10":
             menu_edit_profile()
@@ -1069,8 +1830,7 @@ def menu_more_settings():
 
 def menu_theme():
     """Menu to select and apply themes."""
-    from modules.themes import THEMES, get_theme
-    global T
+    from modules.themes import THEMES
     
     while True:
         cls()
@@ -1096,21 +1856,10 @@ def menu_theme():
                 if 0 <= idx < len(theme_names):
                     new_theme = theme_names[idx]
                     data_manager.config["app_settings"]["theme"] = new_theme
+                    # The settings subscriber swaps the global T
                     data_manager.save_config()
                     
-                    # Update global T
-                    # We need to reach into the global scope or restart
-                    # Since we are in the same process, we can update the global T
-                    # However, main.py imports T globally. 
-                    # We can update the 'T' variable if we use 'global T'
-                    # Update global T
-                    # We need to reach into the global scope or restart
-                    # Since we are in the same process, we can update the global T
-                    # However, main.py imports T globally. 
-                    T = get_theme(new_theme)
-                    
-                    console.print(f"[green]Theme changed to {new_theme.title()}![/green]")
-                    time.sleep(1.0)
+                    show_toast(f"[green]Theme changed to {new_theme.title()}![/green]")
                     pass
             except ValueError:
                 pass
@@ -1129,14 +1878,14 @@ def command_habit(args):
         table.add_column("Status", width=8)
         table.add_column("Habit")
         
-        for i, h in enumerate(habits):
-            status = "[green]DONE[/green]" if habit_status.get(h, False) else "[red]TODO[/red]"
-            table.add_row(str(i+1), status, h)
+        for i, h in enumerate(data_manager.daily().habits(habits)):
+            status = "[green]DONE[/green]" if h.done else "[red]TODO[/red]"
+            table.add_row(str(i+1), status, h.name)
         console.print(table)
         
     elif action == "add":
         if len(habits) >= 3:
-            console.print("[red]Max 3 habits allowed.[/red]")
+            report_error("Max 3 habits allowed.")
             return
             
         name = " ".join(args.name)
@@ -1149,7 +1898,7 @@ def command_habit(args):
             data_manager.save_config()
             console.print(f"[green]Habit added:[/green] {name}")
         else:
-            console.print("[yellow]Habit already exists.[/yellow]")
+            report_error("Habit already exists.")
             
     elif action == "delete":
         try:
@@ -1165,9 +1914,9 @@ def command_habit(args):
                 data_manager.save_config()
                 console.print(f"[yellow]Habit removed:[/yellow] {removed}")
             else:
-                console.print(f"[red]ID {target_id} out of range.[/red]")
+                report_error(f"ID {target_id} out of range.")
         except ValueError:
-             console.print("[red]Invalid ID.[/red]")
+             report_error("Invalid ID.")
 
     elif action == "done":
         try:
@@ -1180,9 +1929,9 @@ def command_habit(args):
                 data_manager.save_config()
                 console.print(f"[green]Good job![/green] Completed: {h_name}")
             else:
-                console.print(f"[red]ID {target_id} out of range.[/red]")
+                report_error(f"ID {target_id} out of range.")
         except ValueError:
-             console.print("[red]Invalid ID.[/red]")
+             report_error("Invalid ID.")
 
 def menu_habit():
     while True:
@@ -1201,27 +1950,29 @@ def menu_habit():
         elif choice == "x":
             target = IntPrompt.ask("Habit ID to mark done")
             args = argparse.Namespace(action="done", target_id=str(target))
-            command_habit(args)
-            time.sleep(1.0)
+            with toasting():
+                command_habit(args)
             
         elif choice == "a":
             text = Prompt.ask("New Habit Name")
             if text:
                 args = argparse.Namespace(action="add", name=[text])
-                command_habit(args)
-                time.sleep(1.0)
+                with toasting():
+                    command_habit(args)
 
         elif choice == "d":
             target = IntPrompt.ask("Habit ID to delete")
             args = argparse.Namespace(action="delete", target_id=str(target))
-            command_habit(args)
-            time.sleep(1.0)
+            with toasting():
+                command_habit(args)
+
+CLIPBOARD_PAGE_SIZE = 20
 
 def menu_clipboard():
     while True:
         cls()
-        console.print("[bold cyan]Clipboard Manager (Last 10)[/bold cyan]")
-        history = clipboard_manager.get_history()
+        history = clipboard_manager.get_previews()
+        console.print(f"[bold cyan]Clipboard Manager ({len(history)} items)[/bold cyan]")
         
         if not history:
             console.print(f"[italic {T['dim']}]History is empty.[/italic {T['dim']}]")
@@ -1230,13 +1981,15 @@ def menu_clipboard():
             table.add_column("ID", style=T["dim"], width=4)
             table.add_column("Preview", style=T["text"])
             
-            for idx, text in enumerate(history):
+            for idx, text in enumerate(history[:CLIPBOARD_PAGE_SIZE]):
                 # Truncate preview
                 preview = text.replace("\n", " ").strip()
                 if len(preview) > 60:
                     preview = preview[:57] + "..."
                 table.add_row(str(idx+1), preview)
             console.print(table)
+            if len(history) > CLIPBOARD_PAGE_SIZE:
+                console.print(f"[{T['dim']}]Showing newest {CLIPBOARD_PAGE_SIZE} of {len(history)}.[/{T['dim']}]")
             
         console.print("\n[dim]c: Copy ID | d: Delete ID | x: Clear All | b: Back[/dim]")
         choice = Prompt.ask("Action", choices=["c", "d", "x", "b"], default="b")
@@ -1250,11 +2003,9 @@ def menu_clipboard():
             idx = IntPrompt.ask("ID to Copy")
             if 1 <= idx <= len(history):
                 clipboard_manager.copy_to_system(idx-1)
-                console.print(f"[green]Copied item {idx}[/green]")
-                time.sleep(1.0)
+                show_toast(f"[green]Copied item {idx}[/green]")
             else:
-                console.print("[red]Invalid ID[/red]")
-                time.sleep(1.0)
+                show_toast("[red]Invalid ID[/red]")
                 
         elif choice == "d":
             if not history: 
@@ -1262,18 +2013,19 @@ def menu_clipboard():
             idx = IntPrompt.ask("ID to Delete")
             if 1 <= idx <= len(history):
                 clipboard_manager.delete_entry(idx-1)
-                console.print("[green]Deleted.[/green]")
-                time.sleep(1.0)
+                show_toast("[green]Deleted.[/green]")
                 
         elif choice == "x":
             if Confirm.ask("Clear entire clipboard history?"):
                 clipboard_manager.clear_history()
-                console.print("[green]Cleared.[/green]")
-                time.sleep(1.0)
+                show_toast("[green]Cleared.[/green]")
 
 
-def main():
+def build_parser():
     parser = argparse.ArgumentParser(description="DailyDash CLI")
+    # Both are taken out of sys.argv at startup; listed here for --help
+    parser.add_argument("--trace", metavar="PATH", help=f"Write a Chrome trace of this run to PATH (or set {tracing.ENV_VAR})")
+    parser.add_argument("--profile", action="store_true", help=f"Save a cProfile of this command (or set {profiling.ENV_VAR}=1)")
     subparsers = parser.add_subparsers(dest="command")
 
     # SETUP Subcommand
@@ -1335,13 +2087,104 @@ def main():
     timer_parser = subparsers.add_parser("timer", help="Start focus timer")
     timer_parser.add_argument("duration", type=int, nargs="?", default=25, help="Duration in minutes (default 25)")
 
+    # POMODORO Subcommand
+    pomo_parser = subparsers.add_parser("pomo", help="Pomodoro cycles")
+    pomo_sub = pomo_parser.add_subparsers(dest="action", required=True)
+    pomo_sub.add_parser("start", help="Start a work/break cycle")
+    pomo_sub.add_parser("skip", help="Skip to the next phase")
+    pomo_sub.add_parser("pause", help="Pause the current phase")
+    pomo_sub.add_parser("resume", help="Resume a paused phase")
+    pomo_sub.add_parser("stop", help="Stop the cycle")
+    pomo_sub.add_parser("status", help="Show phase and today's focus time")
+
     # NOISE Subcommand
     noise_parser = subparsers.add_parser("noise", help="Ambient noise")
     noise_sub = noise_parser.add_subparsers(dest="action", required=True)
-    noise_sub.add_parser("play", help="Play brown noise")
+    noise_play = noise_sub.add_parser("play", help="Stream ambient noise (live keys: b/p/w, +/-)")
+    noise_set = noise_sub.add_parser("set", help="Save default colour/volume")
+    noise_mix = noise_sub.add_parser("mix", help="Play layered soundscapes (rain, fan, noise colours)")
+    noise_mix.add_argument("layers", nargs="*", help="Presets (rain, fan, storm, cabin, deep) and/or LAYER=GAIN, e.g. rain=0.8 brown=0.3")
+    for p in (noise_play, noise_set):
+        p.add_argument("--color", choices=["brown", "pink", "white"], help="Noise colour")
+    for p in (noise_play, noise_set, noise_mix):
+        p.add_argument("--volume", type=int, help="Volume in percent (0-100)")
     
+    # FIND Subcommand
+    find_parser = subparsers.add_parser("find", help="Search notes, links and clipboard history")
+    find_parser.add_argument("query", nargs="+", help="Words to search for (prefixes match)")
+    find_parser.add_argument("--kind", choices=["note", "link", "clip"], help="Only search one kind")
+    find_parser.add_argument("-n", "--limit", type=int, default=FIND_LIMIT, help="Maximum results")
+
     # STATUS Subcommand
-    subparsers.add_parser("status", help="Show dashboard summary")
+    status_parser = subparsers.add_parser("status", help="Show dashboard summary")
+    status_parser.add_argument("--format", "-f", choices=["json", "line", "template"], help="Rich-free output for status bars")
+    status_parser.add_argument("--template", "-t", help="Template for --format template, e.g. '{water}/{water_goal}ml'")
+    status_parser.add_argument("--no-vitals", action="store_true", help="Skip load/memory/battery sampling")
+
+    # WATCH Subcommand (handled by the rich-free fast path above)
+    watch_parser = subparsers.add_parser("watch", help="Stream status lines for waybar/i3blocks")
+    watch_parser.add_argument("--interval", "-i", type=float, default=5.0, help="Seconds between ticks (default 5)")
+    watch_parser.add_argument("--format", "-f", choices=["json", "line", "template"], default="line", help="Output format")
+    watch_parser.add_argument("--template", "-t", help="Template for --format template")
+    watch_parser.add_argument("--no-vitals", action="store_true", help="Skip load/cpu/memory/battery sampling")
+
+    # BATCH Subcommand
+    batch_parser = subparsers.add_parser("batch", help="Run many commands with one load and one save")
+    batch_parser.add_argument("file", nargs="?", default="-", help="File with one command per line (default: stdin)")
+
+    # METRICS Subcommand
+    metrics_parser = subparsers.add_parser("metrics", help="Show counters and latencies (Prometheus format)")
+    metrics_parser.add_argument("--textfile", metavar="PATH", help="Write them for node-exporter's textfile collector")
+    metrics_parser.add_argument("--reset", action="store_true", help="Forget the recorded metrics")
+
+    # PROFILE Subcommand
+    profile_parser = subparsers.add_parser("profile", help="Report on runs made with --profile")
+    profile_parser.add_argument("action", nargs="?", choices=["report", "list", "clear"], default="report")
+    profile_parser.add_argument("--top", "-n", type=int, default=25, help="Functions to show (default 25)")
+    profile_parser.add_argument("--sort", choices=["cumulative", "tottime", "calls"], default="cumulative", help="Ranking (default cumulative)")
+    profile_parser.add_argument("--only", metavar="COMMAND", help="Only profiles whose command or key contains this, e.g. status or key-w")
+
+    return parser
+
+def dispatch(args):
+    """Runs the handler for parsed CLI arguments."""
+    with tracing.span(f"command {args.command}", cat="command", action=getattr(args, "action", None)):
+        if args.command in ["help", "--help"]:
+            command_help(args)
+        elif args.command in ["config", "setup"]:
+            command_setup(args)
+        elif args.command == "task":
+            command_task(args)
+        elif args.command == "water":
+            command_water(args)
+        elif args.command == "note":
+            command_note(args)
+        elif args.command == "link":
+            command_link(args)
+        elif args.command == "timer":
+            command_timer(args)
+        elif args.command == "pomo":
+            command_pomo(args)
+        elif args.command == "noise":
+            command_noise(args)
+        elif args.command == "status":
+             command_status(args)
+        elif args.command == "clipboard":
+             command_clipboard(args)
+        elif args.command == "find":
+            command_find(args)
+        elif args.command == "batch":
+            return command_batch(args)
+        elif args.command == "metrics":
+            command_metrics(args)
+        elif args.command == "profile":
+            command_profile(args)
+        else:
+            # Default fallback if something weird happens (though argv=1 is caught above)
+            command_status(args)
+
+def main():
+    parser = build_parser()
 
     # IF no args --> Interactive Mode
     if len(sys.argv) == 1:
@@ -1349,31 +2192,12 @@ def main():
         return
 
     args = parser.parse_args()
-
-    # Dispatcher
-    if args.command in ["help", "--help"]:
-        command_help(args)
-    elif args.command in ["config", "setup"]:
-        command_setup(args)
-    elif args.command == "task":
-        command_task(args)
-    elif args.command == "water":
-        command_water(args)
-    elif args.command == "note":
-        command_note(args)
-    elif args.command == "link":
-        command_link(args)
-    elif args.command == "timer":
-        command_timer(args)
-    elif args.command == "noise":
-        command_noise(args)
-    elif args.command == "status":
-         command_status(args)
-    elif args.command == "clipboard":
-         command_clipboard(args)
-    else:
-        # Default fallback if something weird happens (though argv=1 is caught above)
-        command_status(args)
+    # Reports on the saved profiles don't get one of their own
+    label = None if args.command == "profile" else args.command or "status"
+    with profiling.profiled(label):
+        ok = dispatch(args)
+    if ok is False:
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
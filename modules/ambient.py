@@ -0,0 +1,162 @@
+"""
+Multi-layer ambient soundscapes.
+
+Each layer (noise colours, rain, fan hum) is synthesized once as a seamless
+loop: a little extra audio is generated and crossfaded into the start, so the
+loop point is click-free and playback is just pygame looping a Sound on its
+own channel. Layer gain is the channel volume, so mixing costs nothing at
+runtime. Loops are cached in the audio cache directory under a hash of their
+parameters, so a soundscape starts instantly after its first use.
+"""
+import hashlib
+import json
+from modules.audio_manager import get_audio_dir, ASSET_VERSION
+
+LAYER_SECONDS = 30
+LOOP_FADE_SECONDS = 2
+# Channel 0 belongs to the noise stream; layers take the next ones
+FIRST_LAYER_CHANNEL = 1
+MIN_CHANNELS = 16
+
+LAYERS = ("brown", "pink", "white", "rain", "fan")
+
+PRESETS = {
+    "rain": {"rain": 0.8, "brown": 0.3},
+    "fan": {"fan": 0.8, "pink": 0.2},
+    "storm": {"rain": 1.0, "brown": 0.6, "white": 0.1},
+    "cabin": {"fan": 0.4, "rain": 0.5},
+    "deep": {"brown": 0.8, "pink": 0.2}
+}
+
+def layer_params(kind):
+    """Everything that affects a layer's audio; its hash names the cache file."""
+    from modules import synth
+    return {
+        "kind": kind,
+        "seconds": LAYER_SECONDS,
+        "fade": LOOP_FADE_SECONDS,
+        "sample_rate": synth.SAMPLE_RATE,
+        "version": ASSET_VERSION
+    }
+
+def layer_path(kind):
+    params = layer_params(kind)
+    digest = hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()[:12]
+    return get_audio_dir() / f"layer-{kind}-{digest}.wav"
+
+def _rain(n, synth):
+    # Hiss: high-passed white noise that slowly swells and fades
+    hiss = synth.highpass(synth.white_noise(n), 0.7)
+    swell = synth.lowpass(synth.white_noise(n), 0.9999)
+    depth = 0.3 / (synth.peak(swell) or 1.0)
+    envelope = synth.offset(synth.gain(swell, depth), 0.7)
+    hiss = synth.modulate(hiss, envelope)
+    # Drops: sparse clicks, each ringing out briefly
+    drops = synth.highpass(synth.one_pole(synth.impulses(n, n // 400), 0.99), 0.95)
+    return synth.add_signals(hiss, synth.gain(drops, 0.4))
+
+def _fan(n, synth):
+    # Whole-hertz tones over whole-second loops repeat exactly at the loop point
+    hum = synth.add_signals(
+        synth.gain(synth.sine(n, 60), 0.25),
+        synth.gain(synth.sine(n, 120), 0.12),
+        synth.gain(synth.sine(n, 180), 0.05)
+    )
+    wobble = synth.offset(synth.gain(synth.sine(n, 0.5), 0.08), 1.0)
+    air = synth.NoiseGenerator("pink").generate(n)
+    rumble = synth.NoiseGenerator("brown").generate(n)
+    return synth.add_signals(synth.modulate(hum, wobble), synth.gain(air, 0.6), rumble)
+
+def synthesize_layer(kind):
+    """Float samples for one seamless loop of the layer."""
+    from modules import synth
+    if kind not in LAYERS:
+        raise ValueError(f"Unknown layer: {kind}")
+    fade = int(LOOP_FADE_SECONDS * synth.SAMPLE_RATE)
+    n = int(LAYER_SECONDS * synth.SAMPLE_RATE) + fade
+    if kind == "rain":
+        samples = _rain(n, synth)
+    elif kind == "fan":
+        samples = _fan(n, synth)
+    else:
+        samples = synth.NoiseGenerator(kind).generate(n)
+    return synth.loop_crossfade(samples, fade)
+
+def ensure_layer(kind):
+    """Path of the cached loop, generating it first if needed."""
+    path = layer_path(kind)
+    if not path.exists():
+        from modules import synth
+        synth.write_wav(str(path), synth.to_pcm16(synthesize_layer(kind)))
+    return path
+
+def parse_mix(specs):
+    """['rain=0.8', 'brown'] -> {'rain': 0.8, 'brown': 1.0}; presets expand in place."""
+    mix = {}
+    for spec in specs:
+        name, _, value = spec.partition("=")
+        name = name.strip().lower()
+        if name in PRESETS and not value:
+            mix.update(PRESETS[name])
+            continue
+        if name not in LAYERS:
+            raise ValueError(f"Unknown layer or preset: {name}")
+        mix[name] = max(0.0, min(1.0, float(value))) if value else 1.0
+    return mix
+
+class AmbientMixer:
+    """Plays cached layer loops on dedicated channels; gains change live."""
+    def __init__(self):
+        self.sounds = {}
+        self.gains = {}
+        self.master = 1.0
+
+    @property
+    def playing(self):
+        return bool(self.gains)
+
+    def _channel(self, kind):
+        import pygame
+        return pygame.mixer.Channel(FIRST_LAYER_CHANNEL + LAYERS.index(kind))
+
+    def play(self, mix, master=None):
+        """Starts the given {layer: gain} mix, replacing the current one."""
+        import pygame
+        if pygame.mixer.get_num_channels() < MIN_CHANNELS:
+            pygame.mixer.set_num_channels(MIN_CHANNELS)
+        pygame.mixer.set_reserved(FIRST_LAYER_CHANNEL + len(LAYERS))
+        if master is not None:
+            self.master = max(0.0, min(1.0, master))
+        for kind in list(self.gains):
+            if kind not in mix:
+                self.set_gain(kind, 0)
+        for kind, value in mix.items():
+            self.set_gain(kind, value)
+
+    def set_gain(self, kind, value):
+        channel = self._channel(kind)
+        if value <= 0:
+            channel.stop()
+            self.gains.pop(kind, None)
+            return
+        if kind not in self.gains:
+            import pygame
+            if kind not in self.sounds:
+                self.sounds[kind] = pygame.mixer.Sound(str(ensure_layer(kind)))
+            channel.play(self.sounds[kind], loops=-1)
+        self.gains[kind] = value
+        channel.set_volume(value * self.master)
+
+    def set_master(self, value):
+        self.master = max(0.0, min(1.0, value))
+        for kind, value in self.gains.items():
+            self._channel(kind).set_volume(value * self.master)
+
+    def stop(self):
+        for kind in list(self.gains):
+            self.set_gain(kind, 0)
+
+    def unload(self):
+        """Forgets loaded Sounds (the mixer is being shut down)."""
+        self.gains.clear()
+        self.sounds.clear()
@@ -1,116 +1,142 @@
-import os
-import pygame
-import wave
-import random
-import struct
+"""
+Chime and ambient noise playback.
 
-ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets")
-NOISE_FILE = os.path.join(ASSETS_DIR, "brown_noise.wav")
-CHIME_FILE = os.path.join(ASSETS_DIR, "chime.wav")
+Nothing touches pygame (or numpy) until something actually plays: importing
+this module and constructing AudioManager are free, so commands like
+`note add` never open the audio device. Generated assets live in the user cache directory
+under a content version, and the mixer is shut down again after a stretch of
+silence so the device isn't held for the whole session.
+"""
+from modules.data_handler import get_cache_dir
+
+# Bump when synthesis changes, so stale cached assets are ignored
+ASSET_VERSION = 1
+IDLE_RELEASE_SECONDS = 120
+
+def get_audio_dir():
+    path = get_cache_dir() / "audio" / f"v{ASSET_VERSION}"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
 
 class AudioManager:
-    def __init__(self):
+    def __init__(self, scheduler=None):
         self.enabled = True # Should read from config
-        self.playing = False
+        self.scheduler = scheduler
+        self.noise = None
+        self.ambient = None
+        self.chime_sound = None
+        self.mixer_ready = False
+
+    @property
+    def playing(self):
+        return bool(self.noise and self.noise.playing) or bool(self.ambient and self.ambient.playing)
+
+    def _ensure_mixer(self):
+        """Opens the audio device on first use. Returns False if audio is unavailable."""
+        if self.mixer_ready:
+            return True
+        if not self.enabled:
+            return False
         try:
-            pygame.mixer.init()
-            self.ensure_asset()
-            self.ensure_chime()
-            self.sound = pygame.mixer.Sound(NOISE_FILE)
-            self.chime_sound = pygame.mixer.Sound(CHIME_FILE)
+            import pygame
+            # Signed 16-bit is what the noise engine streams
+            pygame.mixer.init(size=-16)
+            self.chime_sound = pygame.mixer.Sound(str(self.ensure_chime()))
         except Exception as e:
             print(f"Audio init failed: {e}")
             self.enabled = False
-            self.sound = None
-            self.chime_sound = None
-
-    def ensure_asset(self):
-        """Creates a brown noise file if missing."""
-        if not os.path.exists(NOISE_FILE):
-            # Generate 5 seconds of brown noise
-            # Brown noise = integration of white noise
-            duration = 5 
-            sample_rate = 44100
-            n_samples = duration * sample_rate
-            
-            samples = []
-            val = 0.0
-            
-            # Simple random walk
-            for _ in range(n_samples):
-                white = random.uniform(-1, 1)
-                val += white
-                # Leaky integrator to prevent drift
-                val -= val * 0.02 
-                samples.append(val)
-            
-            # Normalize
-            max_val = max(abs(min(samples)), abs(max(samples)))
-            if max_val > 0:
-                samples = [s / max_val for s in samples]
-            
-            # Convert to 16-bit PCM
-            wave_data = bytearray()
-            for s in samples:
-                # Scale to int16
-                i = int(s * 32767)
-                wave_data.extend(struct.pack('<h', i))
-                
-            try:
-                with wave.open(NOISE_FILE, 'w') as f:
-                    f.setnchannels(1)
-                    f.setsampwidth(2)
-                    f.setframerate(sample_rate)
-                    f.writeframes(wave_data)
-            except Exception as e:
-                print(f"Failed to generate noise: {e}")
-
+            return False
+        self.mixer_ready = True
+        return True
 
     def ensure_chime(self):
-        """Creates a simple chime/ding file if missing."""
-        if not os.path.exists(CHIME_FILE):
-            import math
-            duration = 1.0
-            sample_rate = 44100
-            n_samples = int(duration * sample_rate)
-            
-            wave_data = bytearray()
-            
-            # Sine wave with exponential decay (simple ding)
-            frequency = 880.0 # A5
-            
-            for i in range(n_samples):
-                t = float(i) / sample_rate
-                # Sine wave
-                val = math.sin(2.0 * math.pi * frequency * t)
-                # Decay
-                val *= math.exp(-3.0 * t)
-                
-                # Scale to int16
-                sample = int(val * 32767)
-                wave_data.extend(struct.pack('<h', sample))
-                
-            try:
-                with wave.open(CHIME_FILE, 'w') as f:
-                    f.setnchannels(1)
-                    f.setsampwidth(2)
-                    f.setframerate(sample_rate)
-                    f.writeframes(wave_data)
-            except Exception as e:
-                print(f"Failed to generate chime: {e}")
-
-    def toggle_brown_noise(self):
-        if not self.enabled or not self.sound:
+        """Creates a simple chime/ding file in the cache if missing. Returns its path."""
+        path = get_audio_dir() / "chime.wav"
+        if not path.exists():
+            from modules import synth
+            # Sine wave with exponential decay (simple ding), A5
+            synth.write_wav(str(path), synth.chime(1.0, frequency=880.0))
+        return path
+
+    # --- Idle release ---
+
+    def _arm_idle_release(self):
+        if self.scheduler:
+            self.scheduler.schedule(IDLE_RELEASE_SECONDS, self._release_if_idle, key="audio_idle")
+
+    def _release_if_idle(self):
+        if not self.mixer_ready:
+            return
+        import pygame
+        if self.playing or pygame.mixer.get_busy():
+            self._arm_idle_release()
+            return
+        self.release()
+
+    def release(self):
+        """Stops everything and closes the audio device; the next playback reopens it."""
+        if not self.mixer_ready:
+            return
+        import pygame
+        if self.noise:
+            self.noise.stop()
+            self.noise.channel = None
+        if self.ambient:
+            self.ambient.unload()
+        self.chime_sound = None
+        pygame.mixer.quit()
+        self.mixer_ready = False
+
+    # --- Noise ---
+
+    def _noise_engine(self):
+        if self.noise is None:
+            if self.scheduler is None:
+                from modules.scheduler import Scheduler
+                self.scheduler = Scheduler()
+                self.scheduler.start()
+            from modules.noise_engine import NoiseEngine
+            self.noise = NoiseEngine(self.scheduler)
+        return self.noise
+
+    def toggle_noise(self, color=None, volume=None):
+        """Starts or stops the noise stream. Returns True if it is now playing."""
+        engine = self._noise_engine()
+        if engine.playing:
+            engine.stop()
+            self._arm_idle_release()
+            return False
+        if not self._ensure_mixer():
             return False
-        
-        if self.playing:
-            self.sound.stop()
-            self.playing = False
-        else:
-            self.sound.play(loops=-1)
-            self.playing = True
-        return self.playing
+        self.set_noise(color, volume)
+        return engine.start()
+
+    def set_noise(self, color=None, volume=None):
+        """Changes colour and/or volume, live if noise is playing."""
+        engine = self._noise_engine()
+        if color:
+            engine.set_color(color)
+        if volume is not None:
+            engine.set_volume(volume)
+
+    # --- Ambient layers ---
+
+    def play_mix(self, mix, master=None):
+        """Plays a {layer: gain} soundscape (see modules.ambient). Returns False if audio is unavailable."""
+        if not self._ensure_mixer():
+            return False
+        if self.ambient is None:
+            from modules.ambient import AmbientMixer
+            self.ambient = AmbientMixer()
+        self.ambient.play(mix, master)
+        return True
+
+    def stop_mix(self):
+        if self.ambient:
+            self.ambient.stop()
+            self._arm_idle_release()
 
     def play_chime(self):
-        if self.enabled and self.chime_sound:
+        if self._ensure_mixer() and self.chime_sound:
             self.chime_sound.play()
+            self._arm_idle_release()
@@ -0,0 +1,155 @@
+"""
+Clipboard change sources for ClipboardManager.
+
+Event-driven backends keep one long-lived watcher and push each change to the
+manager, instead of spawning a paste subprocess every second:
+
+- WlPasteWatcher: `wl-paste --watch` on Wayland.
+- ClipnotifyWatcher: `clipnotify` on X11 (blocks until the selection changes).
+- PollingWatcher: pyperclip fallback that backs off while the clipboard is idle.
+"""
+import os
+import shutil
+import subprocess
+import threading
+import pyperclip
+
+POLL_MIN_INTERVAL = 1.0
+POLL_MAX_INTERVAL = 8.0
+POLL_BACKOFF = 1.5
+ERROR_BACKOFF = 5.0
+
+class PollingWatcher:
+    """Polls pyperclip on the shared scheduler, slowing down while nothing changes."""
+    name = "poll"
+
+    def __init__(self, scheduler):
+        self.scheduler = scheduler
+        self.running = False
+        self.interval = POLL_MIN_INTERVAL
+        self.last_text = None
+
+    def start(self, on_change, on_error=None):
+        self.on_change = on_change
+        self.running = True
+        self.interval = POLL_MIN_INTERVAL
+        self.scheduler.schedule(0, self._poll, key="clipboard")
+
+    def stop(self):
+        self.running = False
+        self.scheduler.cancel("clipboard")
+
+    def _poll(self):
+        if not self.running:
+            return
+
+        delay = self.interval
+        try:
+            text = pyperclip.paste()
+            if text and text != self.last_text:
+                self.last_text = text
+                self.interval = POLL_MIN_INTERVAL
+                self.on_change(text)
+            else:
+                self.interval = min(POLL_MAX_INTERVAL, self.interval * POLL_BACKOFF)
+            delay = self.interval
+        except Exception:
+            # Fail gracefully, back off before trying again
+            delay = ERROR_BACKOFF
+
+        if self.running:
+            self.scheduler.schedule(delay, self._poll, key="clipboard")
+
+class _ProcessWatcher:
+    """Runs one long-lived helper process and reads change events from its stdout."""
+    command = []
+
+    def __init__(self):
+        self.proc = None
+        self.thread = None
+        self.running = False
+
+    def start(self, on_change, on_error=None):
+        self.on_change = on_change
+        self.on_error = on_error
+        self.proc = subprocess.Popen(
+            self.command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        self.running = True
+        self.thread = threading.Thread(target=self._reader, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        if self.proc:
+            try:
+                self.proc.terminate()
+                self.proc.wait(timeout=1.0)
+            except Exception:
+                pass
+            self.proc = None
+
+    def _reader(self):
+        try:
+            self._read_events(self.proc.stdout)
+        except Exception:
+            pass
+        # The helper went away on its own: let the manager fall back
+        if self.running and self.on_error:
+            self.running = False
+            self.on_error(self)
+
+    def _read_events(self, stream):
+        raise NotImplementedError
+
+class WlPasteWatcher(_ProcessWatcher):
+    """wl-paste runs our tiny sh snippet per change, which echoes the text NUL-terminated."""
+    name = "wl-paste"
+    command = ["wl-paste", "--no-newline", "--type", "text", "--watch", "sh", "-c", "cat; printf '\\000'"]
+
+    def _read_events(self, stream):
+        buf = b""
+        while self.running:
+            chunk = stream.read1(65536) if hasattr(stream, "read1") else stream.read(65536)
+            if not chunk:
+                return
+            buf += chunk
+            *items, buf = buf.split(b"\0")
+            for item in items:
+                text = item.decode("utf-8", errors="replace")
+                if text:
+                    self.on_change(text)
+
+class ClipnotifyWatcher(_ProcessWatcher):
+    """clipnotify exits on every selection change; we read once and re-arm it."""
+    name = "clipnotify"
+    command = ["clipnotify"]
+
+    def _read_events(self, stream):
+        while self.running:
+            code = self.proc.wait()
+            if not self.running or code != 0:
+                return
+            try:
+                text = pyperclip.paste()
+            except Exception:
+                text = None
+            if text:
+                self.on_change(text)
+            self.proc = subprocess.Popen(
+                self.command,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+
+def select_backend(scheduler, preference="auto"):
+    """Picks the cheapest available change source for this session."""
+    if preference in ("auto", "wl-paste") and os.environ.get("WAYLAND_DISPLAY") and shutil.which("wl-paste"):
+        return WlPasteWatcher()
+    if preference in ("auto", "clipnotify") and os.environ.get("DISPLAY") and shutil.which("clipnotify"):
+        return ClipnotifyWatcher()
+    return PollingWatcher(scheduler)
@@ -1,20 +1,40 @@
 import threading
-import time
 import pyperclip
 from rich.console import Console
+from modules.scheduler import Scheduler
+from modules.clipboard_backends import PollingWatcher, select_backend
+from modules.clipboard_store import ClipboardStore, DEFAULT_MAX_ITEMS
+from modules import metrics
 
 console = Console()
 
 class ClipboardManager:
-    def __init__(self, data_manager):
+    def __init__(self, data_manager, scheduler=None):
         self.data_manager = data_manager
         self.running = False
-        self.thread = None
+        self.backend = None
         self.lock = threading.Lock()
         self.last_text = ""
+        if scheduler is None:
+            scheduler = Scheduler()
+            scheduler.start()
+        self.scheduler = scheduler
+        max_items = data_manager.get("app_settings", {}).get("clipboard_max_items", DEFAULT_MAX_ITEMS)
+        self.store = ClipboardStore(max_items=max_items)
+        self._import_legacy_history()
+
+    def _import_legacy_history(self):
+        """One-time move of the old inline config history into the dedicated store."""
+        # Checking for the section reads nothing; it only exists until imported
+        if "clipboard_import" not in self.data_manager.config:
+            return
+        for text in reversed(self.data_manager.config["clipboard_import"] or []):
+            self.store.add(text)
+        del self.data_manager.config["clipboard_import"]
+        self.data_manager.save_config()
 
     def start_monitoring(self):
-        """Starts the clipboard monitoring thread if enabled."""
+        """Starts the clipboard change watcher if enabled."""
         settings = self.data_manager.get("app_settings", {})
         if not settings.get("clipboard_enabled", False):
             return
@@ -23,82 +43,61 @@ class ClipboardManager:
             return
 
         self.running = True
-        self.thread = threading.Thread(target=self._monitor, daemon=True)
-        self.thread.start()
+        self.backend = select_backend(self.scheduler, settings.get("clipboard_backend", "auto"))
+        try:
+            self.backend.start(self.on_clipboard_change, self._on_backend_error)
+        except OSError:
+            self._on_backend_error(self.backend)
 
     def stop_monitoring(self):
-        """Stops the monitoring thread."""
+        """Stops watching; takes effect immediately."""
         self.running = False
-        if self.thread:
-            self.thread.join(timeout=1.0)
-            self.thread = None
-
-    def _monitor(self):
-        """Background loop to check clipboard content."""
-        while self.running:
-            try:
-                # Check setting inside loop in case it changes
-                if not self.data_manager.get("app_settings", {}).get("clipboard_enabled", False):
-                    time.sleep(2.0)
-                    continue
-
-                current_text = pyperclip.paste()
-                if current_text and current_text != self.last_text:
-                    self.last_text = current_text
-                    self.add_entry(current_text)
-                
-                time.sleep(1.0)
-            except Exception as e:
-                # Fail gracefully, maybe log debug
-                time.sleep(5.0)
+        if self.backend:
+            self.backend.stop()
+            self.backend = None
+
+    def _on_backend_error(self, backend):
+        """An event-driven watcher died; keep going with the polling fallback."""
+        if not self.running or isinstance(backend, PollingWatcher):
+            return
+        self.backend = PollingWatcher(self.scheduler)
+        self.backend.start(self.on_clipboard_change)
+
+    def on_clipboard_change(self, text):
+        """Called by the active backend whenever the system clipboard changes."""
+        if text and text != self.last_text:
+            self.last_text = text
+            metrics.inc("dailydash_clipboard_events_total", event="captured")
+            self.add_entry(text)
 
     def add_entry(self, text):
-        """Adds text to history, maintaining max 10 items."""
-        # Simple rudimentary threading safety via lock if needed, 
-        # though DataManager isn't thread safe, we rely on the GIL and atomic-ish dict ops 
-        # for simple cases. Better to be safe when writing to config.
-        
-        with self.lock:
-             # Reload config to be safe? 
-             # For this CLI tool, we assume we are the primary writer during runtime.
-             history = self.data_manager.get("persistent_data", {}).get("clipboard_history", [])
-             
-             # Avoid duplicates at the top
-             if history and history[0] == text:
-                 return
-
-             # Insert at front
-             history.insert(0, text)
-             
-             # Trim
-             if len(history) > 10:
-                 history = history[:10]
-             
-             # Save
-             self.data_manager.config["persistent_data"]["clipboard_history"] = history
-             self.data_manager.save_config()
+        """Adds text to the top of history; an existing copy anywhere is bumped instead."""
+        # The store appends one record per change; config.json is never rewritten here.
+        return self.store.add(text)
 
     def get_history(self):
-        return self.data_manager.get("persistent_data", {}).get("clipboard_history", [])
+        return self.store.items()
+
+    def get_previews(self):
+        """Display text for every entry, newest first, without loading large blobs."""
+        return self.store.previews()
 
     def clear_history(self):
-        self.data_manager.config["persistent_data"]["clipboard_history"] = []
-        self.data_manager.save_config()
+        metrics.inc("dailydash_clipboard_events_total", event="cleared")
+        self.store.clear()
 
     def delete_entry(self, index):
-        history = self.get_history()
-        if 0 <= index < len(history):
-            del history[index]
-            self.data_manager.config["persistent_data"]["clipboard_history"] = history
-            self.data_manager.save_config()
-            return True
-        return False
+        metrics.inc("dailydash_clipboard_events_total", event="deleted")
+        return self.store.delete(index)
 
     def copy_to_system(self, index):
-        history = self.get_history()
-        if 0 <= index < len(history):
-            text = history[index]
-            pyperclip.copy(text)
-            self.last_text = text # avoid re-triggering monitor update immediately
+        text = self.store.get(index)
+        if text is not None:
+            self.copy_text(text)
             return True
         return False
+
+    def copy_text(self, text):
+        pyperclip.copy(text)
+        metrics.inc("dailydash_clipboard_events_total", event="copied")
+        self.last_text = text # avoid re-triggering monitor update immediately
@@ -0,0 +1,240 @@
+"""
+Clipboard history store, kept out of config.json.
+
+History is an append-only JSON-lines log. Every copy appends one small
+record instead of rewriting the whole config. An in-memory index keyed by
+content hash deduplicates anywhere in history: copying an existing item
+appends a tiny "bump" record that moves it back to the top. Memory holds at
+most max_items entries. The log is compacted once it grows well past that,
+so disk use stays bounded too.
+
+Payloads above BLOB_THRESHOLD bytes (big logs, base64 images) are written
+once as zlib-compressed, content-addressed blob files. The log and memory
+only keep the hash, size and a short preview, and the full text is read
+back only when it is actually needed (e.g. copying it to the clipboard).
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from itertools import islice
+from modules.data_handler import CONFIG_DIR
+
+CLIPBOARD_FILE = CONFIG_DIR / "clipboard_history.jsonl"
+BLOB_DIR = CONFIG_DIR / "clipboard_blobs"
+DEFAULT_MAX_ITEMS = 1000
+BLOB_THRESHOLD = 4096
+PREVIEW_CHARS = 200
+
+def content_hash(text):
+    return hashlib.sha1(text.encode("utf-8", errors="replace")).hexdigest()
+
+class ClipboardStore:
+    def __init__(self, path=CLIPBOARD_FILE, max_items=DEFAULT_MAX_ITEMS, blob_dir=BLOB_DIR, blob_threshold=BLOB_THRESHOLD):
+        self.path = path
+        self.blob_dir = blob_dir
+        self.blob_threshold = blob_threshold
+        self.max_items = max(1, int(max_items))
+        self.lock = threading.Lock()
+        # hash -> entry, oldest first; the newest entry is at the end
+        self.entries = OrderedDict()
+        self._log_records = 0
+        self._load()
+        # Optional callable(event, h, text) told about "add", "del" and "clear"
+        self.listener = None
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # torn write from a crash
+                    self._apply(record)
+                    self._log_records += 1
+        except IOError:
+            pass
+
+    def _apply(self, record):
+        h = record.get("h")
+        if record.get("del"):
+            self.entries.pop(h, None)
+        elif "t" in record or "b" in record:
+            self.entries[h] = record
+            self.entries.move_to_end(h)
+            self._trim()
+        elif h in self.entries:
+            # bump: move an existing entry back to the top
+            self.entries[h]["ts"] = record.get("ts", 0)
+            self.entries.move_to_end(h)
+
+    def _trim(self):
+        while len(self.entries) > self.max_items:
+            h, _ = self.entries.popitem(last=False)
+            self._notify("del", h)
+
+    def _notify(self, event, h=None, text=None):
+        listener = getattr(self, "listener", None)
+        if listener:
+            try:
+                listener(event, h, text)
+            except Exception:
+                pass
+
+    def _append(self, record):
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+        except IOError:
+            return
+        self._log_records += 1
+        if self._log_records > 2 * self.max_items + 100:
+            self._compact()
+
+    def _compact(self):
+        """Rewrites the log with only the live entries and drops unreferenced blobs."""
+        tmp = self.path.with_suffix(".tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                for h, entry in self.entries.items():
+                    if "t" in entry and len(entry["t"]) > self.blob_threshold:
+                        entry = self.entries[h] = self._make_record(entry["t"], h, entry.get("ts", 0))
+                    f.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+            os.replace(tmp, self.path)
+            self._log_records = len(self.entries)
+        except IOError:
+            return
+        self._collect_blobs()
+
+    # --- Blobs ---
+
+    def _blob_path(self, h):
+        return self.blob_dir / h[:2] / f"{h}.z"
+
+    def _write_blob(self, h, data):
+        path = self._blob_path(h)
+        if path.exists():
+            return  # content-addressed: same hash, same bytes
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            f.write(zlib.compress(data, 6))
+        os.replace(tmp, path)
+
+    def _read_blob(self, h):
+        try:
+            with open(self._blob_path(h), "rb") as f:
+                return zlib.decompress(f.read()).decode("utf-8", errors="replace")
+        except (IOError, zlib.error):
+            return None
+
+    def _remove_blob(self, h):
+        try:
+            self._blob_path(h).unlink()
+        except OSError:
+            pass
+
+    def _collect_blobs(self):
+        if not self.blob_dir.exists():
+            return
+        live = {h for h, e in self.entries.items() if "b" in e}
+        for path in self.blob_dir.glob("*/*.z"):
+            if path.stem not in live:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def _make_record(self, text, h, ts):
+        data = text.encode("utf-8", errors="replace")
+        if len(data) <= self.blob_threshold:
+            return {"h": h, "t": text, "ts": ts}
+        try:
+            self._write_blob(h, data)
+        except IOError:
+            return {"h": h, "t": text, "ts": ts}
+        return {"h": h, "b": 1, "size": len(data), "p": text[:PREVIEW_CHARS], "ts": ts}
+
+    def _text(self, entry):
+        if "t" in entry:
+            return entry["t"]
+        return self._read_blob(entry["h"])
+
+    def add(self, text):
+        """Adds text at the top, bumping an existing copy. Returns False if it was already on top."""
+        h = content_hash(text)
+        with self.lock:
+            if self.entries and next(reversed(self.entries)) == h:
+                return False
+            now = round(time.time(), 3)
+            if h in self.entries:
+                record = {"h": h, "ts": now}
+            else:
+                record = self._make_record(text, h, now)
+                self._notify("add", h, record["t"] if "t" in record else record["p"])
+            self._apply(record)
+            self._append(record)
+            return True
+
+    def items(self):
+        """Full texts, newest first. Reads every blob; prefer previews() for display."""
+        with self.lock:
+            return [self._text(e) or "" for e in reversed(self.entries.values())]
+
+    def previews(self):
+        """Short display texts, newest first. Never touches blob files."""
+        with self.lock:
+            return [e["t"][:PREVIEW_CHARS] if "t" in e else e["p"] for e in reversed(self.entries.values())]
+
+    def entry(self, index):
+        """Index record at position index (0 = newest): hash, size and preview or text."""
+        with self.lock:
+            if not 0 <= index < len(self.entries):
+                return None
+            return dict(next(islice(reversed(self.entries.values()), index, None)))
+
+    def get(self, index):
+        """Full text at position index (0 = newest), or None. Loads the blob only now."""
+        with self.lock:
+            if not 0 <= index < len(self.entries):
+                return None
+            return self._text(next(islice(reversed(self.entries.values()), index, None)))
+
+    def indexable(self):
+        """(hash, text) pairs, newest first; large blobs contribute their preview only."""
+        with self.lock:
+            return [(h, e["t"] if "t" in e else e["p"]) for h, e in reversed(self.entries.items())]
+
+    def position(self, h):
+        """Current 0-based index (0 = newest) of the entry with this hash, or None."""
+        with self.lock:
+            for i, key in enumerate(reversed(self.entries)):
+                if key == h:
+                    return i
+        return None
+
+    def delete(self, index):
+        with self.lock:
+            if not 0 <= index < len(self.entries):
+                return False
+            h = next(islice(reversed(self.entries), index, None))
+            if "b" in self.entries[h]:
+                self._remove_blob(h)
+            record = {"h": h, "del": 1}
+            self._apply(record)
+            self._append(record)
+            self._notify("del", h)
+            return True
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self._compact()
+            self._notify("clear")
+
+    def __len__(self):
+        return len(self.entries)
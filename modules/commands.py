@@ -1,20 +1,21 @@
 import time
-import subprocess
 import webbrowser
-import threading
 from rich.console import Console
 from rich.prompt import Prompt, IntPrompt, Confirm
 from modules.themes import get_theme
+from modules.scheduler import Scheduler
+from modules import timer_store
+from modules.timer_notifier import fire_timer
 
 class CommandProcessor:
-    def __init__(self, console: Console, data_manager, audio_manager):
+    def __init__(self, console: Console, data_manager, audio_manager, scheduler=None):
         self.console = console
         self.dm = data_manager
         self.am = audio_manager
-        
-        # Timer state
-        self.timer_end_timestamp = None
-        self.current_timer_id = None
+        if scheduler is None:
+            scheduler = Scheduler()
+            scheduler.start()
+        self.scheduler = scheduler
 
     def get_theme(self):
         t_name = self.dm.get("app_settings", {}).get("theme", "default")
@@ -59,11 +60,10 @@ class CommandProcessor:
     # --- TASKS ---
     def task_add(self):
         T = self.get_theme()
-        daily = self.dm.get("daily_state", {})
-        tasks = daily.get("tasks", [])
+        daily = self.dm.daily()
         
         # Find empty slot
-        slot = next((t for t in tasks if not t["text"]), None)
+        slot = daily.free_slot()
         if not slot:
             self.console.print(f"[{T['warning']}]All 3 slots full. Finish or delete one first.[/]")
             return
@@ -71,95 +71,72 @@ class CommandProcessor:
         text = Prompt.ask("Task Description")
         budget = Prompt.ask("Time Budget (e.g. 30m) [Optional]", default="")
         
-        slot["text"] = text
-        slot["done"] = False
-        slot["budget"] = budget if budget else None
-        
-        self.dm.save_config()
+        slot.assign(text, budget if budget else None)
+        self.dm.save_daily(daily)
         self.console.print(f"[{T['success']}]Task added![/]")
 
     def task_toggle(self):
         T = self.get_theme()
-        daily = self.dm.get("daily_state", {})
-        tasks = daily.get("tasks", [])
+        daily = self.dm.daily()
         
         # Simple menu to toggle
-        # Filter non-empty
-        active_tasks = [t for t in tasks if t["text"]]
+        active_tasks = daily.active_tasks()
         if not active_tasks:
             self.console.print(f"[{T['dim']}]No active tasks.[/]")
             return
 
         self.console.print(f"[{T['primary']}]Select task to toggle:[/]")
         for t in active_tasks:
-            status = "[green]DONE[/green]" if t["done"] else "[red]TODO[/red]"
-            self.console.print(f" {t['id']}. {status} {t['text']}")
+            status = "[green]DONE[/green]" if t.done else "[red]TODO[/red]"
+            self.console.print(f" {t.id}. {status} {t.text}")
             
-        choice = IntPrompt.ask("Task ID", choices=[str(t['id']) for t in active_tasks], show_choices=False)
+        choice = IntPrompt.ask("Task ID", choices=[str(t.id) for t in active_tasks], show_choices=False)
         
-        for t in tasks:
-            if t['id'] == choice:
-                t['done'] = not t['done']
-                state = "DONE" if t['done'] else "TODO"
-                self.console.print(f"[{T['success']}]Task {choice} marked as {state}[/]")
-                self.dm.save_config()
-                return
+        task = daily.task(choice)
+        if task:
+            task.done = not task.done
+            state = "DONE" if task.done else "TODO"
+            self.console.print(f"[{T['success']}]Task {choice} marked as {state}[/]")
+            self.dm.save_daily(daily)
 
     def task_delete(self):
         T = self.get_theme()
-        daily = self.dm.get("daily_state", {})
-        tasks = daily.get("tasks", [])
+        daily = self.dm.daily()
         
-        # Filter non-empty
-        active_tasks = [t for t in tasks if t["text"]]
+        active_tasks = daily.active_tasks()
         if not active_tasks:
             self.console.print(f"[{T['dim']}]No tasks to delete.[/]")
             return
             
-        choice = IntPrompt.ask("Delete Task ID", choices=[str(t['id']) for t in active_tasks], show_choices=False)
+        choice = IntPrompt.ask("Delete Task ID", choices=[str(t.id) for t in active_tasks], show_choices=False)
         
-        for t in tasks:
-            if t['id'] == choice:
-                t['text'] = ""
-                t["done"] = False
-                t["budget"] = None
-                self.console.print(f"[{T['warning']}]Task {choice} cleared.[/]")
-                self.dm.save_config()
-                return
+        task = daily.task(choice)
+        if task:
+            task.clear()
+            self.console.print(f"[{T['warning']}]Task {choice} cleared.[/]")
+            self.dm.save_daily(daily)
 
     # --- TIMER ---
     def timer_start(self):
         T = self.get_theme()
         
-        if self.timer_end_timestamp and self.timer_end_timestamp > time.time():
-             remaining = int((self.timer_end_timestamp - time.time()) / 60)
+        active = timer_store.get_active_timer()
+        if active:
+             remaining = int((active["deadline"] - time.time()) / 60)
              if not Confirm.ask(f"Timer running ({remaining}m). Restart?", default=False):
                  return
 
         mins = IntPrompt.ask("Duration (min)", default=25)
-        self.timer_end_timestamp = time.time() + mins * 60
+        timer = timer_store.start_timer(mins)
         
-        # Timer thread
-        self.current_timer_id = time.time()
-        threading.Thread(target=self._timer_worker, args=(self.current_timer_id, mins), daemon=True).start()
+        # Persisted deadline survives this process; ring in-process too while we're alive
+        timer_store.ensure_notifier(timer)
+        self.scheduler.schedule(mins * 60, fire_timer, timer["id"], self.am.play_chime, key="timer")
         
         self.console.print(f"[{T['success']}]Timer set for {mins} minutes.[/]")
 
-    def _timer_worker(self, timer_id, mins):
-        time.sleep(mins * 60)
-        if self.current_timer_id == timer_id:
-            self.am.play_chime()
-            # Try notify
-            try:
-                subprocess.Popen(['notify-send', 'DailyDash', 'Time is up!'])
-            except: pass
-
     def get_timer_status(self):
-        if self.timer_end_timestamp and self.timer_end_timestamp > time.time():
-            remaining_sec = int(self.timer_end_timestamp - time.time())
-            m, s = divmod(remaining_sec, 60)
-            return f"{m:02}:{s:02}"
-        return "IDLE"
+        return timer_store.get_timer_status()
 
     # --- BRAIN DUMP ---
     def note_add(self):
@@ -260,8 +237,12 @@ class CommandProcessor:
         self.dm.save_config()
 
     # --- NOISE ---
-    def noise_toggle(self):
-        playing = self.am.toggle_brown_noise()
+    def noise_toggle(self, color=None, volume=None):
+        settings = self.dm.get("app_settings", {})
+        playing = self.am.toggle_noise(
+            color or settings.get("noise_color", "brown"),
+            settings.get("noise_volume", 0.6) if volume is None else volume
+        )
         T = self.get_theme()
         if playing:
             self.console.print(f"[{T['accent']}]Noise ON 🔈[/]")
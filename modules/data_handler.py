@@ -1,8 +1,16 @@
+import copy
 import json
 import os
 import shutil
+import threading
+from collections.abc import MutableMapping
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime, date, timedelta
+from modules.models import DailyState, blank_tasks
+from modules import migrations
+from modules import tracing
+from modules import metrics
 
 # User Config Directory
 def get_config_dir():
@@ -17,7 +25,22 @@ def get_config_dir():
     path.mkdir(parents=True, exist_ok=True)
     return path
 
+def get_cache_dir():
+    """Returns the user cache directory (e.g. ~/.cache/dailydash)"""
+    home = Path.home()
+    if os.name == 'nt':
+        base = Path(os.environ.get("LOCALAPPDATA", home / "AppData" / "Local"))
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME", home / ".cache"))
+
+    path = base / "dailydash"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
 CONFIG_DIR = get_config_dir()
+# One JSON file per top-level section, so a command only reads what it uses
+SECTIONS_DIR = CONFIG_DIR / "config.d"
+# The older single-file layout; split into SECTIONS_DIR on first load
 CONFIG_FILE = CONFIG_DIR / "config.json"
 HISTORY_FILE = CONFIG_DIR / "daily_history.csv"
 
@@ -30,6 +53,168 @@ if LOCAL_CONFIG.exists() and not CONFIG_FILE.exists():
     except Exception as e:
         print(f"Migration error: {e}")
 
+def section_path(name):
+    return SECTIONS_DIR / f"{name}.json"
+
+def read_section(name):
+    """The parsed section file, or None if it is missing or unreadable."""
+    try:
+        with tracing.span("read section", cat="config", section=name), open(section_path(name), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def write_section(name, value):
+    SECTIONS_DIR.mkdir(parents=True, exist_ok=True)
+    path = section_path(name)
+    tmp = path.with_name(path.name + ".tmp")
+    data = json.dumps(value, indent=4)
+    with tracing.span("write section", cat="config", section=name):
+        with open(tmp, 'w') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    metrics.inc("dailydash_config_bytes_written_total", len(data.encode("utf-8")))
+
+def stored_sections():
+    try:
+        return sorted(p.stem for p in SECTIONS_DIR.glob("*.json"))
+    except OSError:
+        return []
+
+def _read_legacy_config():
+    try:
+        with open(CONFIG_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _stored_version():
+    version = read_section("schema_version")
+    # A layout without the file was created at the current version
+    return version if isinstance(version, int) else migrations.SCHEMA_VERSION
+
+@tracing.traced()
+def load_sections(*names):
+    """
+    Reads only the named top-level config sections, without building a DataManager.
+    Missing sections fall back to their defaults. Used by the rich-free status path.
+    """
+    defaults = DataManager.DEFAULT_CONFIG
+    data = None
+    if not SECTIONS_DIR.exists():
+        data = _read_legacy_config() or {}
+    elif _stored_version() < migrations.SCHEMA_VERSION:
+        data = {name: read_section(name) for name in stored_sections()}
+    if data is not None:
+        # Upgraded in memory only; the next DataManager persists it
+        if data:
+            migrations.migrate(data, defaults)
+        return {name: data.get(name, copy.deepcopy(defaults.get(name, {}))) for name in names}
+
+    sections = {}
+    for name in names:
+        value = read_section(name)
+        sections[name] = value if value is not None else copy.deepcopy(defaults.get(name, {}))
+    return sections
+
+class LazyConfig(MutableMapping):
+    """
+    The config as a mapping of sections, each read from its own file on first
+    access. Membership and iteration never read anything.
+    """
+    def __init__(self, defaults, on_load=None):
+        self.defaults = defaults
+        self.on_load = on_load
+        self.sections = {}
+        stored = stored_sections()
+        self.names = list(defaults) + [name for name in stored if name not in defaults]
+
+    def __getitem__(self, name):
+        if name in self.sections:
+            return self.sections[name]
+        if name not in self.names:
+            raise KeyError(name)
+        value = read_section(name)
+        if value is None:
+            if name not in self.defaults:
+                raise KeyError(name)
+            value = copy.deepcopy(self.defaults[name])
+        self.sections[name] = value
+        if self.on_load:
+            self.on_load(name, value)
+        return value
+
+    def __setitem__(self, name, value):
+        if name not in self.names:
+            self.names.append(name)
+        self.sections[name] = value
+
+    def __delitem__(self, name):
+        self[name]  # Loaded first, so the removal is seen as a change
+        self.names.remove(name)
+        del self.sections[name]
+
+    def __contains__(self, name):
+        return name in self.names
+
+    def __iter__(self):
+        return iter(list(self.names))
+
+    def __len__(self):
+        return len(self.names)
+
+    def reload(self, name):
+        """Re-reads a loaded section from disk; returns False if the file is gone or unreadable."""
+        value = read_section(name)
+        if value is None:
+            return False
+        self.sections[name] = value
+        return True
+
+class ChangeEvent:
+    """One changed value. `path` is the key path, e.g. ("app_settings", "theme")."""
+    __slots__ = ("path", "old", "new")
+
+    def __init__(self, path, old, new):
+        self.path = path
+        self.old = old
+        self.new = new
+
+    @property
+    def key(self):
+        return ".".join(str(part) for part in self.path)
+
+    def __repr__(self):
+        return f"ChangeEvent({self.key!r}, {self.old!r} -> {self.new!r})"
+
+def _split_path(path):
+    if isinstance(path, (tuple, list)):
+        return tuple(path)
+    return tuple(part for part in path.split(".") if part)
+
+def diff_values(old, new, path=()):
+    """
+    ChangeEvents turning `old` into `new`. Dicts and same-length lists are
+    compared item by item; anything else (including a list that grew or
+    shrank) is reported as one replacement at its own path.
+    """
+    events = []
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in new:
+            if key not in old:
+                events.append(ChangeEvent(path + (key,), None, new[key]))
+            else:
+                events.extend(diff_values(old[key], new[key], path + (key,)))
+        for key in old:
+            if key not in new:
+                events.append(ChangeEvent(path + (key,), old[key], None))
+    elif isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        for i, (a, b) in enumerate(zip(old, new)):
+            events.extend(diff_values(a, b, path + (i,)))
+    elif old != new:
+        events.append(ChangeEvent(path, old, new))
+    return events
+
 class DataManager:
     DEFAULT_CONFIG = {
         "user_profile": {
@@ -42,73 +227,245 @@ class DataManager:
         },
         "app_settings": {
             "audio_enabled": True,
+            "noise_color": "brown",
+            "noise_volume": 0.6,
+            "ambient_mix": {"rain": 0.8, "brown": 0.3},
+            "notification_backend": "auto",
             "nag_stand_up": True,
             "nag_eye_strain": True,
             "eod_journal_enabled": False,
             "clipboard_enabled": False,
+            "clipboard_max_items": 1000,
             "history_logging": True,
-            "theme": "default"
+            "theme": "default",
+            "pomodoro": {
+                "work": 25,
+                "short_break": 5,
+                "long_break": 15,
+                "cycles": 4
+            }
         },
         "daily_state": {
             "last_login_date": "",
             "current_water_intake": 0,
             "current_caffeine_intake": 0,
-            "tasks": [
-                {"id": 1, "text": "", "done": False, "budget": None},
-                {"id": 2, "text": "", "done": False, "budget": None},
-                {"id": 3, "text": "", "done": False, "budget": None}
-            ],
+            "tasks": [t.to_dict() for t in blank_tasks()],
             "habit_status": {}
         },
         "persistent_data": {
             "brain_dump_content": [],
             "parking_lot_links": [],
-            "clipboard_history": [],
             "habits": []
         },
-        "setup_complete": False
+        "setup_complete": False,
+        "schema_version": migrations.SCHEMA_VERSION
     }
 
     def __init__(self):
+        self.subscribers = []
+        self.lock = threading.RLock()
+        # Per loaded section: serialized last-saved value and file mtime
+        self._snapshot = {}
+        self._mtimes = {}
+        # Nesting depth of batch() blocks, and whether a save was deferred
+        self._batch_depth = 0
+        self._batch_dirty = False
         self.config = self.load_config()
 
     def get_default_config(self):
-        return self.DEFAULT_CONFIG.copy()
+        # Deep: the nested defaults must never be shared with a live config
+        return copy.deepcopy(self.DEFAULT_CONFIG)
 
+    @tracing.traced()
     def load_config(self):
-        if not CONFIG_FILE.exists():
-            return self.get_default_config()
-        
+        """
+        A LazyConfig over the section files. Nothing is parsed here except the
+        tiny schema_version file, unless the layout needs a one-time upgrade.
+        """
+        self._snapshot = {}
+        self._mtimes = {}
+        if not SECTIONS_DIR.exists() and CONFIG_FILE.exists():
+            self._split_legacy_config()
+        fresh = not SECTIONS_DIR.exists()
+        config = LazyConfig(self.DEFAULT_CONFIG, on_load=self._on_section_loaded)
+        if fresh:
+            # Unsnapshotted, so the first save records the version the layout starts at
+            config.sections["schema_version"] = migrations.SCHEMA_VERSION
+            return config
+        version = _stored_version()
+        if version < migrations.SCHEMA_VERSION:
+            self._migrate_sections(config, version)
+        return config
+
+    @tracing.traced()
+    def _split_legacy_config(self):
+        """Moves config.json into per-section files, migrating it on the way."""
+        data = _read_legacy_config()
+        if not isinstance(data, dict):
+            return  # Unreadable: start from defaults, leave the file for the user
+        old_version = migrations.migrate(data, self.DEFAULT_CONFIG)
         try:
-            with open(CONFIG_FILE, 'r') as f:
-                data = json.load(f)
-                
-            # MIGRATION: Notes string -> list
-            notes = data.get("persistent_data", {}).get("brain_dump_content", "")
-            if isinstance(notes, str):
-                if notes.strip():
-                    lines = [line.strip().lstrip("- ").strip() for line in notes.split('\n') if line.strip()]
-                    data["persistent_data"]["brain_dump_content"] = lines
-                else:
-                    data["persistent_data"]["brain_dump_content"] = []
-
-            # MIGRATION: Ensure Tasks have 'budget'
-            tasks = data.get("daily_state", {}).get("tasks", [])
-            for t in tasks:
-                 if "budget" not in t:
-                     t["budget"] = None
-                     
-            return data
-            
-        except (json.JSONDecodeError, IOError):
-            return self.get_default_config()
+            for name, value in data.items():
+                write_section(name, value)
+            os.replace(CONFIG_FILE, CONFIG_FILE.with_name(f"{CONFIG_FILE.name}.v{old_version}.bak"))
+        except OSError as e:
+            print(f"Error splitting config: {e}")
+
+    @tracing.traced()
+    def _migrate_sections(self, config, old_version):
+        """Upgrades the stored sections once, keeping a copy of the old ones."""
+        try:
+            backup = SECTIONS_DIR.with_name(f"{SECTIONS_DIR.name}.v{old_version}.bak")
+            if not backup.exists():
+                shutil.copytree(SECTIONS_DIR, backup)
+        except OSError as e:
+            print(f"Error backing up config: {e}")
+        data = {name: config[name] for name in config}
+        migrations.migrate(data, self.DEFAULT_CONFIG)
+        for name, value in data.items():
+            config[name] = value
+        for name in list(config):
+            if name not in data:
+                del config[name]
+        self._write_changes(config, self._collect_changes(config))
 
+    def _on_section_loaded(self, name, value):
+        self._snapshot[name] = json.dumps(value)
+        self._mtimes[name] = self._section_mtime(name)
+
+    @tracing.traced()
     def save_config(self):
+        """Writes the sections that changed since they were loaded or last saved."""
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
+        with self.lock:
+            changes = self._collect_changes(self.config)
+            self._write_changes(self.config, changes)
+        if changes:
+            metrics.inc("dailydash_config_saves_total")
+        self._emit_changes(changes)
+
+    def _collect_changes(self, config):
+        """[(name, old serialized or None)] for loaded sections that differ from the snapshot."""
+        changes = []
+        for name in list(self._snapshot.keys() | config.sections.keys()):
+            before = self._snapshot.get(name)
+            if name in config.sections:
+                after = json.dumps(config.sections[name])
+                if after != before:
+                    changes.append((name, before))
+                    self._snapshot[name] = after
+            elif before is not None:
+                changes.append((name, before))
+                del self._snapshot[name]
+        return changes
+
+    def _write_changes(self, config, changes):
+        for name, _ in changes:
+            try:
+                if name in config.sections:
+                    write_section(name, config.sections[name])
+                else:
+                    section_path(name).unlink()
+            except OSError as e:
+                print(f"Error saving config: {e}")
+            self._mtimes[name] = self._section_mtime(name)
+
+    @contextmanager
+    def batch(self):
+        """Defers every save_config() inside the block to a single save at its end."""
+        self._batch_depth += 1
         try:
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(self.config, f, indent=4)
-        except IOError as e:
-            print(f"Error saving config: {e}")
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_dirty:
+                self._batch_dirty = False
+                self.save_config()
+
+    # --- Change notification ---
+
+    def subscribe(self, path, callback):
+        """
+        Calls callback(event) for every ChangeEvent at or below `path`
+        ("app_settings.theme", "persistent_data", "" for everything) once the
+        change is saved. Returns a handle for unsubscribe().
+        """
+        handle = (_split_path(path), callback)
+        with self.lock:
+            self.subscribers.append(handle)
+        return handle
+
+    def unsubscribe(self, handle):
+        with self.lock:
+            if handle in self.subscribers:
+                self.subscribers.remove(handle)
+
+    def update(self, path, value):
+        """Sets one value by key path ("app_settings.theme") and saves it."""
+        keys = _split_path(path)
+        node = self.config
+        for key in keys[:-1]:
+            node = node.setdefault(key, {})
+        node[keys[-1]] = value
+        self.save_config()
+
+    def reload_if_changed(self):
+        """
+        Picks up edits made by another dailydash process (e.g. `water add` in
+        another terminal) and notifies subscribers. Returns True if reloaded.
+        """
+        changes = []
+        with self.lock:
+            # Only sections this process has loaded can be stale
+            for name in list(self.config.sections):
+                mtime = self._section_mtime(name)
+                if mtime is None or mtime == self._mtimes.get(name):
+                    continue
+                self._mtimes[name] = mtime
+                if self.config.reload(name):
+                    changes.extend(self._collect_changes_for(name))
+        self._emit_changes(changes)
+        return bool(changes)
+
+    def _collect_changes_for(self, name):
+        before = self._snapshot.get(name)
+        after = json.dumps(self.config.sections[name])
+        if after == before:
+            return []
+        self._snapshot[name] = after
+        return [(name, before)]
+
+    def _section_mtime(self, name):
+        try:
+            return section_path(name).stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _emit_changes(self, changes):
+        """Delivers ChangeEvents for [(section, old serialized)] to subscribers."""
+        with self.lock:
+            if not changes or not self.subscribers:
+                return
+            events = []
+            for name, before in changes:
+                events.extend(diff_values(
+                    json.loads(before) if before is not None else None,
+                    self.config.sections.get(name),
+                    (name,)
+                ))
+            subscribers = list(self.subscribers)
+
+        for event in events:
+            for prefix, callback in subscribers:
+                n = min(len(prefix), len(event.path))
+                if event.path[:n] != prefix[:n]:
+                    continue
+                try:
+                    callback(event)
+                except Exception:
+                    pass
 
     def _get_effective_date(self):
         """Calculates the effective date based on reset hour."""
@@ -125,35 +482,34 @@ class DataManager:
         return last_login != today_str
 
     def confirm_new_day(self):
-        today_str = self._get_effective_date()
-        
-        self.config["daily_state"]["last_login_date"] = today_str
-        self.config["daily_state"]["current_water_intake"] = 0
-        self.config["daily_state"]["current_caffeine_intake"] = 0
-        self.config["daily_state"]["tasks"] = [
-            {"id": 1, "text": "", "done": False, "budget": None},
-            {"id": 2, "text": "", "done": False, "budget": None},
-            {"id": 3, "text": "", "done": False, "budget": None}
-        ]
-        
-        current_habits = self.config["persistent_data"].get("habits", [])
-        self.config["daily_state"]["habit_status"] = {h: False for h in current_habits}
-        
+        daily = self.daily()
+        daily.reset(self._get_effective_date(), self.config["persistent_data"].get("habits", []))
+        self.save_daily(daily)
+
+    def daily(self):
+        """The daily_state section as a DailyState (a copy: save it back with save_daily)."""
+        return DailyState.from_dict(self.config.get("daily_state", {}))
+
+    def save_daily(self, daily):
+        self.config["daily_state"] = daily.to_dict()
         self.save_config()
 
+    @tracing.traced()
     def log_daily_history(self, note=None):
         import csv
+        from modules.pomodoro import get_day_summary
         
         today_str = date.today().isoformat()
-        daily = self.config.get("daily_state", {})
-        water = daily.get("current_water_intake", 0)
-        caffeine = daily.get("current_caffeine_intake", 0)
-        tasks_done = sum(1 for t in daily.get("tasks", []) if t["done"])
+        daily = self.daily()
+        water = daily.water
+        caffeine = daily.caffeine
+        tasks_done = daily.tasks_done
+        focus_minutes, sessions = get_day_summary(today_str)
         
         file_exists = HISTORY_FILE.exists()
         
         rows = []
-        header = ["Date", "Water_ml", "Caffeine_mg", "Tasks_Completed", "Daily_Note"]
+        header = ["Date", "Water_ml", "Caffeine_mg", "Tasks_Completed", "Daily_Note", "Focus_Minutes", "Sessions_Completed"]
         
         if file_exists:
             try:
@@ -172,6 +528,8 @@ class DataManager:
                 row["Water_ml"] = water
                 row["Caffeine_mg"] = caffeine
                 row["Tasks_Completed"] = tasks_done
+                row["Focus_Minutes"] = focus_minutes
+                row["Sessions_Completed"] = sessions
                 if note is not None:
                      row["Daily_Note"] = note
                 elif "Daily_Note" not in row:
@@ -185,7 +543,9 @@ class DataManager:
                 "Water_ml": water,
                 "Caffeine_mg": caffeine,
                 "Tasks_Completed": tasks_done,
-                "Daily_Note": note if note else ""
+                "Daily_Note": note if note else "",
+                "Focus_Minutes": focus_minutes,
+                "Sessions_Completed": sessions
             }
             rows.append(new_row)
             
@@ -217,4 +577,4 @@ class DataManager:
 
 if __name__ == "__main__":
     dm = DataManager()
-    print(f"Config loaded from {CONFIG_FILE}")
+    print(f"Config loaded from {SECTIONS_DIR}")
@@ -0,0 +1,204 @@
+"""
+Counters and latency histograms, kept across runs.
+
+Each process records into memory (a dict update per event) and merges what
+it recorded into metrics.json in the cache directory when it exits; the
+resident dashboard also flushes once a minute. `dailydash metrics` prints
+the totals in the Prometheus text format, and `--textfile` writes them
+where node-exporter's textfile collector picks them up, e.g.
+
+    dailydash metrics --textfile /var/lib/node_exporter/textfile/dailydash.prom
+
+Setting DAILYDASH_METRICS_TEXTFILE to such a path rewrites it on every flush.
+"""
+import atexit
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+TEXTFILE_ENV = "DAILYDASH_METRICS_TEXTFILE"
+
+# Upper bounds in seconds; a last +Inf bucket is implied
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# name -> (Prometheus type, help) for every metric recorded in the app
+METRICS = {
+    "dailydash_config_saves_total": ("counter", "save_config calls that wrote at least one section"),
+    "dailydash_config_bytes_written_total": ("counter", "Bytes of config section files written"),
+    "dailydash_weather_fetches_total": ("counter", "Weather fetches by result (ok, not_found, error)"),
+    "dailydash_weather_fetch_seconds": ("histogram", "Weather fetch latency, geocoding plus forecast"),
+    "dailydash_clipboard_events_total": ("counter", "Clipboard history events by kind"),
+    "dailydash_render_seconds": ("histogram", "Dashboard frame render time"),
+    "dailydash_timer_fires_total": ("counter", "Timers and pomodoro phases fired, by kind"),
+}
+
+_lock = threading.Lock()
+# Not yet flushed: series -> value, and series -> [bucket counts..., +Inf count, sum]
+_counters = {}
+_histograms = {}
+_registered = False
+
+def metrics_file():
+    # Resolved late: data_handler itself records metrics
+    from modules.data_handler import get_cache_dir
+    return get_cache_dir() / "metrics.json"
+
+def _series(name, labels):
+    if not labels:
+        return name
+    inner = ",".join(f'{k}="{v}"' for k, v in sorted(labels.items()))
+    return f"{name}{{{inner}}}"
+
+def _touch():
+    global _registered
+    if not _registered:
+        _registered = True
+        atexit.register(flush)
+
+def inc(name, value=1, **labels):
+    """Adds `value` to a counter."""
+    series = _series(name, labels)
+    with _lock:
+        _counters[series] = _counters.get(series, 0) + value
+        _touch()
+
+def observe(name, seconds, **labels):
+    """Records one latency sample in a histogram."""
+    series = _series(name, labels)
+    index = next((i for i, bound in enumerate(BUCKETS) if seconds <= bound), len(BUCKETS))
+    with _lock:
+        hist = _histograms.get(series)
+        if hist is None:
+            hist = _histograms[series] = [0] * (len(BUCKETS) + 1) + [0.0]
+        hist[index] += 1
+        hist[-1] += seconds
+        _touch()
+
+@contextmanager
+def timed(name, **labels):
+    """Observes the duration of the block into histogram `name`."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - start, **labels)
+
+def load():
+    """The totals stored on disk: {"counters": {...}, "histograms": {...}}."""
+    try:
+        with open(metrics_file(), 'r') as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data.setdefault("counters", {})
+            data.setdefault("histograms", {})
+            return data
+    except (OSError, ValueError):
+        pass
+    return {"counters": {}, "histograms": {}}
+
+@contextmanager
+def _file_lock():
+    """Serializes flushes from concurrent processes (where flock exists)."""
+    if fcntl is None:
+        yield
+        return
+    try:
+        fd = os.open(metrics_file().with_suffix(".lock"), os.O_CREAT | os.O_RDWR)
+    except OSError:
+        yield
+        return
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
+def flush():
+    """Merges what this process recorded into the metrics file."""
+    global _counters, _histograms
+    with _lock:
+        counters, _counters = _counters, {}
+        histograms, _histograms = _histograms, {}
+    if not counters and not histograms:
+        return
+    try:
+        with _file_lock():
+            data = load()
+            for series, value in counters.items():
+                data["counters"][series] = data["counters"].get(series, 0) + value
+            for series, hist in histograms.items():
+                stored = data["histograms"].get(series)
+                if not stored or len(stored) != len(hist):
+                    stored = [0] * len(hist)
+                data["histograms"][series] = [a + b for a, b in zip(stored, hist)]
+            path = metrics_file()
+            tmp = path.with_suffix(".tmp")
+            with open(tmp, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp, path)
+    except OSError:
+        return
+    textfile = os.environ.get(TEXTFILE_ENV)
+    if textfile:
+        write_textfile(textfile, data)
+
+def _split_series(series):
+    name, _, labels = series.partition("{")
+    return name, labels.rstrip("}")
+
+def render(data=None):
+    """The stored totals in the Prometheus text exposition format."""
+    data = data if data is not None else load()
+    by_name = {}
+    for series, value in data["counters"].items():
+        by_name.setdefault(_split_series(series)[0], []).append((series, value))
+    for series, hist in data["histograms"].items():
+        by_name.setdefault(_split_series(series)[0], []).append((series, hist))
+
+    lines = []
+    for name in sorted(by_name):
+        kind, help_text = METRICS.get(name, ("untyped", ""))
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for series, value in sorted(by_name[name], key=lambda item: item[0]):
+            if kind != "histogram":
+                lines.append(f"{series} {value}")
+                continue
+            labels = _split_series(series)[1]
+            prefix = labels + "," if labels else ""
+            cumulative = 0
+            for bound, count in zip(BUCKETS + ("+Inf",), value[:-1]):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{prefix}le="{bound}"}} {cumulative}')
+            suffix = f"{{{labels}}}" if labels else ""
+            lines.append(f"{name}_sum{suffix} {value[-1]:.6f}")
+            lines.append(f"{name}_count{suffix} {cumulative}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+def write_textfile(path, data=None):
+    """Atomically writes render() to `path` (node-exporter must never see half a file)."""
+    tmp = f"{path}.tmp"
+    try:
+        with open(tmp, 'w') as f:
+            f.write(render(data))
+        os.replace(tmp, path)
+        return True
+    except OSError:
+        return False
+
+def reset():
+    """Forgets the stored totals."""
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+    try:
+        os.remove(metrics_file())
+    except OSError:
+        pass
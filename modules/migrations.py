@@ -0,0 +1,81 @@
+"""
+Config schema versions.
+
+The config carries a `schema_version`. Each migration below upgrades the
+data from the previous version to its own, and runs exactly once: the
+result is saved with the new version, and later loads skip everything when
+the version already matches. To change the format or add a setting,
+append a migration; SCHEMA_VERSION follows the registry.
+"""
+import copy
+from modules import tracing
+
+def _notes_to_list(data, defaults):
+    """Brain dump used to be one free-text string."""
+    persistent = data.get("persistent_data", {})
+    notes = persistent.get("brain_dump_content", [])
+    if isinstance(notes, str):
+        persistent["brain_dump_content"] = [
+            line.strip().lstrip("- ").strip() for line in notes.split('\n') if line.strip()
+        ]
+
+def _complete_tasks(data, defaults):
+    """Tasks from before time budgets lack 'budget' (and very old ones other fields)."""
+    from modules.models import Task
+    daily = data.get("daily_state", {})
+    if "tasks" in daily:
+        daily["tasks"] = [Task.from_dict(t).to_dict() for t in daily["tasks"]]
+
+def _fill_defaults(data, defaults):
+    """
+    Adds sections and settings introduced since the file was written.
+    Only missing keys are added, one level deep: user-shaped values such as
+    the ambient mix are never merged with the defaults.
+    """
+    for name, default in defaults.items():
+        if name not in data:
+            data[name] = copy.deepcopy(default)
+        elif isinstance(default, dict) and isinstance(data[name], dict):
+            for key, value in default.items():
+                data[name].setdefault(key, copy.deepcopy(value))
+
+def _split_clipboard_history(data, defaults):
+    """
+    Clipboard history that predates the clipboard store gets its own section,
+    so reading persistent_data never drags it along. The clipboard manager
+    imports it into the store and deletes the section.
+    """
+    legacy = data.get("persistent_data", {}).pop("clipboard_history", None)
+    if legacy:
+        data["clipboard_import"] = legacy
+
+# Ordered: MIGRATIONS[i] upgrades version i to i + 1
+MIGRATIONS = [
+    _notes_to_list,
+    _complete_tasks,
+    _fill_defaults,
+    _split_clipboard_history
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+def get_version(data):
+    version = data.get("schema_version", 0)
+    return version if isinstance(version, int) else 0
+
+@tracing.traced()
+def migrate(data, defaults):
+    """
+    Upgrades `data` in place to SCHEMA_VERSION. Returns the version it started
+    from, so the caller knows whether there is anything to save; a config
+    written by a newer DailyDash is left alone.
+    """
+    version = get_version(data)
+    if version >= SCHEMA_VERSION:
+        return version
+    for step in MIGRATIONS[version:]:
+        step(data, defaults)
+    # New settings ship with a version bump, so every upgrade picks them up
+    _fill_defaults(data, defaults)
+    data["schema_version"] = SCHEMA_VERSION
+    return version
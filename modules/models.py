@@ -0,0 +1,125 @@
+"""
+Typed model of the day's state.
+
+The on-disk format stays the plain JSON of DataManager.config. These
+__slots__ classes are built from it, edited, and written back with to_dict(),
+so callers use attributes instead of `.get(...)` chains, and every default
+is a fresh object: no task list is shared between DailyStates.
+"""
+
+TASK_SLOTS = 3
+
+class Task:
+    __slots__ = ("id", "text", "done", "budget")
+
+    def __init__(self, id, text="", done=False, budget=None):
+        self.id = id
+        self.text = text
+        self.done = done
+        self.budget = budget
+
+    @classmethod
+    def blank(cls, id):
+        return cls(id)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get("id", 0), data.get("text") or "", bool(data.get("done", False)), data.get("budget"))
+
+    def to_dict(self):
+        return {"id": self.id, "text": self.text, "done": self.done, "budget": self.budget}
+
+    @property
+    def empty(self):
+        return not self.text
+
+    def assign(self, text, budget=None):
+        self.text = text
+        self.done = False
+        self.budget = budget
+
+    def clear(self):
+        self.assign("")
+
+    def __repr__(self):
+        return f"Task({self.id!r}, {self.text!r}, done={self.done!r}, budget={self.budget!r})"
+
+def blank_tasks():
+    return [Task.blank(i) for i in range(1, TASK_SLOTS + 1)]
+
+class Habit:
+    """A habit name with today's completion."""
+    __slots__ = ("name", "done")
+
+    def __init__(self, name, done=False):
+        self.name = name
+        self.done = done
+
+    def __repr__(self):
+        return f"Habit({self.name!r}, done={self.done!r})"
+
+class DailyState:
+    """The `daily_state` config section."""
+    __slots__ = ("last_login_date", "water", "caffeine", "tasks", "habit_status", "extra")
+
+    def __init__(self, last_login_date="", water=0, caffeine=0, tasks=None, habit_status=None, extra=None):
+        self.last_login_date = last_login_date
+        self.water = water
+        self.caffeine = caffeine
+        self.tasks = tasks if tasks is not None else blank_tasks()
+        self.habit_status = habit_status if habit_status is not None else {}
+        # Keys this model doesn't know about, kept so they survive a round trip
+        self.extra = extra if extra is not None else {}
+
+    _KNOWN = ("last_login_date", "current_water_intake", "current_caffeine_intake", "tasks", "habit_status")
+
+    @classmethod
+    def from_dict(cls, data):
+        tasks = data.get("tasks")
+        return cls(
+            data.get("last_login_date", ""),
+            data.get("current_water_intake", 0),
+            data.get("current_caffeine_intake", 0),
+            [Task.from_dict(t) for t in tasks] if tasks is not None else None,
+            dict(data.get("habit_status", {})),
+            {k: v for k, v in data.items() if k not in cls._KNOWN}
+        )
+
+    def to_dict(self):
+        data = {
+            "last_login_date": self.last_login_date,
+            "current_water_intake": self.water,
+            "current_caffeine_intake": self.caffeine,
+            "tasks": [t.to_dict() for t in self.tasks],
+            "habit_status": dict(self.habit_status)
+        }
+        data.update(self.extra)
+        return data
+
+    def task(self, task_id):
+        return next((t for t in self.tasks if t.id == task_id), None)
+
+    def free_slot(self):
+        return next((t for t in self.tasks if t.empty), None)
+
+    def active_tasks(self):
+        return [t for t in self.tasks if not t.empty]
+
+    @property
+    def tasks_done(self):
+        return sum(1 for t in self.tasks if t.done)
+
+    def habits(self, names):
+        """Habit objects for the configured names, in order."""
+        return [Habit(name, bool(self.habit_status.get(name, False))) for name in names]
+
+    def clear_tasks(self):
+        self.tasks = blank_tasks()
+
+    def reset(self, date_str, habit_names):
+        """Starts a new day: counters, tasks and habit checks back to zero."""
+        self.last_login_date = date_str
+        self.water = 0
+        self.caffeine = 0
+        self.clear_tasks()
+        self.habit_status = {name: False for name in habit_names}
@@ -0,0 +1,106 @@
+"""
+Streaming ambient noise.
+
+Synthesizes brown, pink or white noise in short chunks and keeps one chunk
+queued behind the playing one on a reserved pygame mixer channel. The output
+never repeats, memory stays at two chunks, and colour or volume changes take
+effect within a chunk. Refills run on the shared scheduler thread.
+"""
+import time
+from modules import synth
+
+CHUNK_SECONDS = 0.5
+# Check the queue twice per chunk so it never runs dry
+FEED_INTERVAL = CHUNK_SECONDS / 2
+DEFAULT_COLOR = "brown"
+DEFAULT_VOLUME = 0.6
+
+class NoiseEngine:
+    def __init__(self, scheduler, color=DEFAULT_COLOR, volume=DEFAULT_VOLUME):
+        self.scheduler = scheduler
+        self.color = color if color in synth.NOISE_COLORS else DEFAULT_COLOR
+        self.volume = volume
+        self.playing = False
+        self.channel = None
+        self.generator = None
+        self._next_generator = None
+        # Synthesis CPU time vs audio produced, for cpu_percent()
+        self.cpu_seconds = 0.0
+        self.audio_seconds = 0.0
+
+    def start(self):
+        import pygame
+        if self.playing:
+            return True
+        init = pygame.mixer.get_init()
+        if not init:
+            return False
+        self.sample_rate, _, self.channels = init
+        self.chunk_frames = int(self.sample_rate * CHUNK_SECONDS)
+
+        # Keep channel 0 for us; chimes play on the others
+        pygame.mixer.set_reserved(1)
+        self.channel = pygame.mixer.Channel(0)
+        self.generator = synth.NoiseGenerator(self.color)
+        self._next_generator = None
+        self.channel.play(self._next_sound())
+        self.channel.set_volume(self.volume)  # play() resets it
+        self.channel.queue(self._next_sound())
+        self.playing = True
+        self.scheduler.schedule(FEED_INTERVAL, self._feed, interval=FEED_INTERVAL, key="noise")
+        return True
+
+    def stop(self):
+        self.playing = False
+        self.scheduler.cancel("noise")
+        if self.channel:
+            self.channel.stop()
+
+    def set_volume(self, volume):
+        self.volume = max(0.0, min(1.0, float(volume)))
+        if self.channel:
+            self.channel.set_volume(self.volume)
+
+    def set_color(self, color):
+        if color not in synth.NOISE_COLORS:
+            raise ValueError(f"Unknown noise color: {color}")
+        if color == self.color:
+            return
+        self.color = color
+        if self.playing:
+            # Crossfaded into the next chunk by the feeder
+            self._next_generator = synth.NoiseGenerator(color)
+
+    def cpu_percent(self):
+        """CPU time spent synthesizing, as a share of the audio time produced."""
+        if not self.audio_seconds:
+            return 0.0
+        return 100.0 * self.cpu_seconds / self.audio_seconds
+
+    def _next_sound(self):
+        import pygame
+        start = time.thread_time()
+        samples = self.generator.generate(self.chunk_frames)
+        pending = self._next_generator
+        if pending:
+            samples = synth.crossfade(samples, pending.generate(self.chunk_frames))
+            self.generator = pending
+            self._next_generator = None
+        sound = pygame.mixer.Sound(buffer=synth.to_pcm16(samples, peak=1.0, channels=self.channels))
+        self.cpu_seconds += time.thread_time() - start
+        self.audio_seconds += CHUNK_SECONDS
+        return sound
+
+    def _feed(self):
+        import pygame
+        if not self.playing:
+            return
+        try:
+            if not self.channel.get_busy():
+                # Underrun (e.g. after a suspend): start over
+                self.channel.play(self._next_sound())
+                self.channel.set_volume(self.volume)
+            if self.channel.get_queue() is None:
+                self.channel.queue(self._next_sound())
+        except pygame.error:
+            self.stop()
@@ -0,0 +1,254 @@
+"""
+Desktop notification service.
+
+Every notification (health nags, timer and pomodoro alerts) goes through one
+NotificationService instead of spawning notify-send or calling plyer at each
+call site. The service:
+
+- keeps one backend for the life of the process; the D-Bus backend holds a
+  single session-bus connection instead of spawning a process per message,
+- queues messages and coalesces those that arrive close together (e.g. the
+  eye-strain and stand-up reminders landing in the same minute) into one,
+- rate-limits delivery, so a burst never floods the desktop.
+
+Backends: D-Bus via the optional `jeepney` package, `notify-send`, `plyer`,
+and MemoryBackend, an in-process stand-in that records what would be shown.
+"""
+import os
+import shutil
+import subprocess
+import threading
+import time
+
+APP_NAME = "DailyDash"
+# A non-urgent message waits this long for companions to merge with
+COALESCE_SECONDS = 60
+# Minimum gap between two deliveries
+MIN_INTERVAL = 5
+MAX_PENDING = 20
+TIMEOUT_MS = 10000
+
+class DBusBackend:
+    """org.freedesktop.Notifications over one persistent session-bus connection."""
+    name = "dbus"
+
+    def __init__(self):
+        from jeepney import DBusAddress
+        from jeepney.io.blocking import open_dbus_connection
+        self.conn = open_dbus_connection(bus="SESSION")
+        self.address = DBusAddress(
+            "/org/freedesktop/Notifications",
+            bus_name="org.freedesktop.Notifications",
+            interface="org.freedesktop.Notifications"
+        )
+        # Coalesced repeats replace our previous bubble instead of stacking
+        self.last_id = 0
+
+    def send(self, title, message):
+        from jeepney import new_method_call, MessageType
+        msg = new_method_call(self.address, "Notify", "susssasa{sv}i",
+                              (APP_NAME, self.last_id, "", title, message, [], {}, TIMEOUT_MS))
+        reply = self.conn.send_and_get_reply(msg, timeout=2)
+        if reply.header.message_type == MessageType.error:
+            raise OSError(f"Notify failed: {reply.body}")
+        self.last_id = reply.body[0]
+
+    def close(self):
+        try:
+            self.conn.close()
+        except Exception:
+            pass
+
+class NotifySendBackend:
+    name = "notify-send"
+
+    def __init__(self):
+        if not shutil.which("notify-send"):
+            raise OSError("notify-send not found")
+
+    def send(self, title, message):
+        subprocess.Popen(
+            ["notify-send", "-a", APP_NAME, "-t", str(TIMEOUT_MS), title, message],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+
+    def close(self):
+        pass
+
+class PlyerBackend:
+    name = "plyer"
+
+    def __init__(self):
+        from plyer import notification
+        self.notification = notification
+
+    def send(self, title, message):
+        self.notification.notify(title=title, message=message, app_name=APP_NAME, timeout=TIMEOUT_MS // 1000)
+
+    def close(self):
+        pass
+
+class MemoryBackend:
+    """Stand-in for tests: records (title, message) instead of showing anything."""
+    name = "memory"
+
+    def __init__(self):
+        self.sent = []
+
+    def send(self, title, message):
+        self.sent.append((title, message))
+
+    def close(self):
+        pass
+
+BACKENDS = {
+    "dbus": DBusBackend,
+    "notify-send": NotifySendBackend,
+    "plyer": PlyerBackend,
+    "memory": MemoryBackend
+}
+
+def _backend_order(preference="auto"):
+    if os.name == "nt" or os.environ.get("DBUS_SESSION_BUS_ADDRESS") is None:
+        order = ["plyer", "notify-send"]
+    else:
+        order = ["dbus", "notify-send", "plyer"]
+    if preference in BACKENDS:
+        order = [preference] + [name for name in order if name != preference]
+    return order
+
+def select_backend(preference="auto", exclude=()):
+    """The preferred backend, else the first one that works here, else None."""
+    for name in _backend_order(preference):
+        if name in exclude:
+            continue
+        try:
+            return BACKENDS[name]()
+        except Exception:
+            continue
+    return None
+
+class NotificationService:
+    """
+    Queues, coalesces and rate-limits notifications on the shared scheduler.
+    Without a scheduler (one-shot processes) every message is sent at once.
+    """
+    def __init__(self, scheduler=None, backend=None, preference="auto", play_sound=None):
+        self.scheduler = scheduler
+        self._backend = backend
+        self.preference = preference
+        # Called once per delivery that asked for a sound
+        self.play_sound = play_sound
+        self.lock = threading.Lock()
+        self.pending = []
+        self.dropped = 0
+        self.last_sent = 0.0
+
+    def _now(self):
+        return self.scheduler.clock() if self.scheduler else time.monotonic()
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            self._backend = select_backend(self.preference) or MemoryBackend()
+        return self._backend
+
+    def set_preference(self, preference):
+        """Switches backends; the new one is opened on the next delivery."""
+        self.close()
+        self._backend = None
+        self.preference = preference
+
+    def notify(self, title, message, urgent=False, sound=False):
+        """
+        Queues a notification. Urgent ones (timers) go out right away, taking
+        anything pending with them; others wait up to COALESCE_SECONDS.
+        """
+        with self.lock:
+            if any(p[:2] == (title, message) for p in self.pending):
+                return  # Same reminder twice in one window
+            self.pending.append((title, message, sound))
+            if len(self.pending) > MAX_PENDING:
+                self.pending.pop(0)
+                self.dropped += 1
+
+        if self.scheduler is None:
+            self.flush()
+        elif urgent:
+            self.scheduler.schedule(0, self.flush, key="notify_flush")
+        elif not self.scheduler.is_scheduled("notify_flush"):
+            self.scheduler.schedule(COALESCE_SECONDS, self.flush, key="notify_flush")
+
+    def flush(self):
+        """Delivers everything pending as one notification (if the rate limit allows)."""
+        with self.lock:
+            if not self.pending:
+                return
+            now = self._now()
+            wait = self.last_sent + MIN_INTERVAL - now
+            if self.last_sent and wait > 0 and self.scheduler is not None:
+                self.scheduler.schedule(wait, self.flush, key="notify_flush")
+                return
+            batch, self.pending = self.pending, []
+            dropped, self.dropped = self.dropped, 0
+            self.last_sent = now
+
+        title, message = self._merge(batch, dropped)
+        self._deliver(title, message)
+
+        if self.play_sound and any(sound for _, _, sound in batch):
+            try:
+                self.play_sound()
+            except Exception:
+                pass
+
+    def _deliver(self, title, message):
+        failed = []
+        while True:
+            backend = self.backend if not failed else select_backend(self.preference, exclude=failed)
+            if backend is None:
+                return
+            try:
+                backend.send(title, message)
+                self._backend = backend
+                return
+            except Exception:
+                # e.g. the bus connection dropped: move on to the next backend for good
+                backend.close()
+                failed.append(backend.name)
+                self._backend = None
+
+    @staticmethod
+    def _merge(batch, dropped=0):
+        if len(batch) == 1 and not dropped:
+            return batch[0][0], batch[0][1]
+        titles = {title for title, _, _ in batch}
+        title = titles.pop() if len(titles) == 1 else APP_NAME
+        lines = [message if title != APP_NAME else f"{t}: {message}" for t, message, _ in batch]
+        if dropped:
+            lines.append(f"(+{dropped} more)")
+        return title, "\n\n".join(lines)
+
+    def close(self):
+        if self._backend:
+            self._backend.close()
+
+# --- Process-wide default ---
+
+_service = None
+
+def set_service(service):
+    """Installs the service that module-level notify() uses (the interactive app's)."""
+    global _service
+    _service = service
+
+def get_service():
+    global _service
+    if _service is None:
+        _service = NotificationService()
+    return _service
+
+def notify(title, message, urgent=False, sound=False):
+    get_service().notify(title, message, urgent=urgent, sound=sound)
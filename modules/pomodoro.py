@@ -0,0 +1,152 @@
+"""
+Pomodoro cycle engine built on the persisted focus timer.
+
+Each phase is an ordinary timer in timer.json carrying a "pomodoro" block.
+Whoever fires a phase (notifier process, resident daemon or the interactive
+session) advances to the next one, so cycles run with no polling loop.
+Completed work sessions are appended to a small per-day log that feeds the
+daily history CSV.
+"""
+import time
+from datetime import date
+from modules.data_handler import CONFIG_DIR
+from modules import timer_store
+
+SESSIONS_DIR = CONFIG_DIR / "sessions"
+
+DEFAULT_SETTINGS = {
+    "work": 25,
+    "short_break": 5,
+    "long_break": 15,
+    "cycles": 4  # work sessions before a long break
+}
+
+PHASE_LABELS = {
+    "work": "Work",
+    "short_break": "Short Break",
+    "long_break": "Long Break"
+}
+
+PHASE_MESSAGES = {
+    "work": "Work session done! Take a break.",
+    "short_break": "Break over. Back to focus!",
+    "long_break": "Long break over. Ready for the next round?"
+}
+
+def get_settings(app_settings):
+    return _valid_settings(app_settings.get("pomodoro", {}))
+
+def _valid_settings(values):
+    """
+    Durations and cycles must be positive whole numbers; anything else (0,
+    -5, 2.5, "25") falls back to the default instead of failing later in
+    whichever process fires the timer.
+    """
+    settings = dict(DEFAULT_SETTINGS)
+    for key, value in (values or {}).items():
+        if key in DEFAULT_SETTINGS and (isinstance(value, bool) or not isinstance(value, int) or value < 1):
+            continue
+        settings[key] = value
+    return settings
+
+def _start_phase(phase, cycle, completed, settings):
+    # Phases started before validation existed may carry bad settings
+    settings = _valid_settings(settings)
+    state = {"phase": phase, "cycle": cycle, "completed": completed, "settings": settings}
+    return timer_store.start_timer(
+        settings[phase],
+        label=PHASE_LABELS[phase],
+        pomodoro=state,
+        message=PHASE_MESSAGES[phase]
+    )
+
+def start(app_settings):
+    """Starts a fresh cycle with a work phase. Returns the timer."""
+    return _start_phase("work", 1, 0, get_settings(app_settings))
+
+def next_phase(state, completed_work):
+    """Returns (phase, cycle, completed) following the given pomodoro state."""
+    settings = _valid_settings(state["settings"])
+    completed = state["completed"] + (1 if completed_work else 0)
+    if state["phase"] == "work":
+        if completed and completed % settings["cycles"] == 0:
+            return "long_break", state["cycle"], completed
+        return "short_break", state["cycle"], completed
+    return "work", state["cycle"] + 1, completed
+
+def on_phase_complete(timer):
+    """Logs a finished work phase and starts the next one. Called by whoever fired the timer."""
+    state = timer["pomodoro"]
+    if state["phase"] == "work":
+        log_session("work", timer["minutes"], timer["started"])
+    phase, cycle, completed = next_phase(state, completed_work=state["phase"] == "work")
+    return _start_phase(phase, cycle, completed, state["settings"])
+
+def skip():
+    """Ends the current phase early without logging it. Returns the next timer or None."""
+    timer = timer_store.load_timer()
+    if not timer or not timer.get("pomodoro"):
+        return None
+    state = timer["pomodoro"]
+    phase, cycle, completed = next_phase(state, completed_work=False)
+    return _start_phase(phase, cycle, completed, state["settings"])
+
+def pause():
+    """Freezes the running phase. Returns the paused timer or None."""
+    timer = timer_store.get_active_timer()
+    if not timer or not timer.get("pomodoro"):
+        return None
+    timer["paused_remaining"] = max(0, timer["deadline"] - time.time())
+    timer["paused"] = True
+    timer_store.save_timer(timer)
+    return timer
+
+def resume():
+    """Restarts a paused phase with the time it had left. Returns the timer or None."""
+    timer = timer_store.load_timer()
+    if not timer or not timer.get("paused"):
+        return None
+    timer["deadline"] = time.time() + timer.pop("paused_remaining", 0)
+    timer["paused"] = False
+    timer_store.save_timer(timer)
+    return timer
+
+def stop():
+    timer_store.cancel_timer()
+
+def current():
+    """The persisted pomodoro timer (running or paused), or None."""
+    timer = timer_store.load_timer()
+    if timer and timer.get("pomodoro") and not timer.get("fired"):
+        return timer
+    return None
+
+# --- Session Log ---
+
+def _log_file(day):
+    return SESSIONS_DIR / f"{day}.log"
+
+def log_session(phase, minutes, started):
+    """Appends one 'HH:MM:SS,phase,minutes' line to today's session log."""
+    try:
+        SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_log_file(date.today().isoformat()), "a") as f:
+            f.write(f"{time.strftime('%H:%M:%S', time.localtime(started))},{phase},{minutes:g}\n")
+    except IOError:
+        pass
+
+def get_day_summary(day=None):
+    """Returns (focus_minutes, sessions_completed) for the given ISO date (default today)."""
+    day = day or date.today().isoformat()
+    focus_minutes = 0.0
+    sessions = 0
+    try:
+        with open(_log_file(day), "r") as f:
+            for line in f:
+                parts = line.strip().split(",")
+                if len(parts) == 3 and parts[1] == "work":
+                    focus_minutes += float(parts[2])
+                    sessions += 1
+    except (IOError, ValueError):
+        pass
+    return int(focus_minutes), sessions
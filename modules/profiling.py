@@ -0,0 +1,111 @@
+"""
+Opt-in cProfile capture per command.
+
+Run with `--profile` (or DAILYDASH_PROFILE=1) and every CLI command, and
+every key handled by the interactive dashboard, is profiled on its own and
+dumped to the `profiles` directory in the cache dir as a pstats file named
+after it. `dailydash profile report` merges those files into one hotspot
+table to attach to a slowness report.
+
+When profiling is off, profiled() is a shared no-op context.
+"""
+import os
+import time
+from contextlib import contextmanager, nullcontext
+
+ENV_VAR = "DAILYDASH_PROFILE"
+# Oldest profiles are deleted past this many
+MAX_PROFILES = 200
+
+_enabled = False
+_NULL = nullcontext()
+
+def enable():
+    global _enabled
+    _enabled = True
+
+def enabled():
+    return _enabled
+
+def profiles_dir():
+    from modules.data_handler import get_cache_dir
+    path = get_cache_dir() / "profiles"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+def _safe_label(label):
+    return "".join(c if c.isalnum() or c in "-_" else "-" for c in label) or "run"
+
+def profiled(label):
+    """Profiles the block into its own file when profiling is on (and `label` isn't None)."""
+    if not _enabled or label is None:
+        return _NULL
+    return _profile(label)
+
+@contextmanager
+def _profile(label):
+    import cProfile
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        try:
+            path = profiles_dir() / f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{_safe_label(label)}.prof"
+            profiler.dump_stats(path)
+            _prune()
+        except OSError:
+            pass
+
+def list_profiles(label=None):
+    """Profile files, oldest first; `label` keeps only those whose name contains it."""
+    try:
+        files = sorted(profiles_dir().glob("*.prof"))
+    except OSError:
+        return []
+    if label:
+        files = [f for f in files if label in f.stem.split("-", 3)[-1]]
+    return files
+
+def _prune():
+    files = list_profiles()
+    for path in files[:max(0, len(files) - MAX_PROFILES)]:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+def report(top=20, sort="cumulative", label=None, stream=None):
+    """
+    Merges the saved profiles and prints the `top` hottest functions to
+    `stream`. Returns how many profiles went into it.
+    """
+    import pstats
+    files = list_profiles(label)
+    stats = None
+    for path in files:
+        try:
+            if stats is None:
+                stats = pstats.Stats(str(path), stream=stream)
+            else:
+                stats.add(str(path))
+        except Exception:
+            continue  # truncated by a crash mid-dump
+    if stats is None:
+        return 0
+    stats.strip_dirs().sort_stats(sort).print_stats(top)
+    return len(files)
+
+def clear():
+    removed = 0
+    for path in list_profiles():
+        try:
+            path.unlink()
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+if os.environ.get(ENV_VAR, "") not in ("", "0"):
+    enable()
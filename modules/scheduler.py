@@ -0,0 +1,166 @@
+import heapq
+import itertools
+import threading
+import time
+
+class ManualClock:
+    """
+    Injectable clock for tests. Time only moves when advance() is called,
+    and advancing runs everything that became due, so hour-long intervals
+    complete in milliseconds.
+    """
+    def __init__(self, start=0.0):
+        self.now = start
+        self._schedulers = []
+
+    def __call__(self):
+        return self.now
+
+    def attach(self, scheduler):
+        self._schedulers.append(scheduler)
+
+    def advance(self, seconds):
+        target = self.now + seconds
+        # Step through each due time so recurring events fire once per interval
+        while True:
+            due = min((s.next_due() for s in self._schedulers if s.next_due() is not None), default=None)
+            if due is None or due > target:
+                break
+            self.now = max(self.now, due)
+            for s in self._schedulers:
+                s.run_pending()
+        self.now = target
+        for s in self._schedulers:
+            s.run_pending()
+
+class ScheduledEvent:
+    def __init__(self, due, seq, callback, args, interval, key):
+        self.due = due
+        self.seq = seq
+        self.callback = callback
+        self.args = args
+        self.interval = interval
+        self.key = key
+        self.cancelled = False
+
+    def __lt__(self, other):
+        return (self.due, self.seq) < (other.due, other.seq)
+
+class Scheduler:
+    """
+    One thread, one priority queue of due events and a condition variable.
+
+    The thread sleeps exactly until the earliest event is due (or forever when
+    nothing is queued), and is woken immediately when an earlier event is added
+    or an event is cancelled. Events may carry a key; scheduling with an
+    existing key replaces the old event, which is how settings changes and
+    timer restarts take effect straight away.
+    """
+    def __init__(self, clock=None):
+        self.clock = clock or time.monotonic
+        self._heap = []
+        self._keys = {}
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._running = False
+        self._thread = None
+        if hasattr(self.clock, "attach"):
+            self.clock.attach(self)
+
+    def start(self):
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def schedule(self, delay, callback, *args, interval=None, key=None):
+        """Runs callback(*args) after delay seconds, then every interval seconds if given."""
+        with self._cond:
+            if key is not None and key in self._keys:
+                self._keys.pop(key).cancelled = True
+            event = ScheduledEvent(self.clock() + max(0.0, delay), next(self._seq), callback, args, interval, key)
+            heapq.heappush(self._heap, event)
+            if key is not None:
+                self._keys[key] = event
+            if self._heap[0] is event:
+                self._cond.notify()
+            return event
+
+    def cancel(self, event_or_key):
+        with self._cond:
+            if isinstance(event_or_key, ScheduledEvent):
+                event = event_or_key
+                if event.key is not None and self._keys.get(event.key) is event:
+                    del self._keys[event.key]
+            else:
+                event = self._keys.pop(event_or_key, None)
+            if event is None or event.cancelled:
+                return False
+            event.cancelled = True
+            self._prune()
+            self._cond.notify()
+            return True
+
+    def is_scheduled(self, key):
+        with self._cond:
+            return key in self._keys
+
+    def next_due(self, key=None):
+        """Clock time of the given keyed event, or of the earliest event when key is None."""
+        with self._cond:
+            if key is not None:
+                event = self._keys.get(key)
+                return event.due if event else None
+            self._prune()
+            return self._heap[0].due if self._heap else None
+
+    def run_pending(self):
+        """Runs every event that is due now. Returns how many callbacks ran."""
+        ran = 0
+        while True:
+            with self._cond:
+                self._prune()
+                if not self._heap or self._heap[0].due > self.clock():
+                    return ran
+                event = heapq.heappop(self._heap)
+                if event.interval:
+                    # Re-arm from the previous due time, without bursting to catch up after a stall
+                    event.due = max(event.due + event.interval, self.clock())
+                    event.seq = next(self._seq)
+                    heapq.heappush(self._heap, event)
+                elif event.key is not None and self._keys.get(event.key) is event:
+                    del self._keys[event.key]
+
+            try:
+                event.callback(*event.args)
+            except Exception:
+                # A failing reminder must never take the scheduler down
+                pass
+            ran += 1
+
+    def _prune(self):
+        while self._heap and self._heap[0].cancelled:
+            heapq.heappop(self._heap)
+
+    def _run(self):
+        while True:
+            self.run_pending()
+            with self._cond:
+                if not self._running:
+                    return
+                self._prune()
+                timeout = None
+                if self._heap:
+                    timeout = max(0.0, self._heap[0].due - self.clock())
+                # timeout=None: nothing queued, sleep until schedule()/cancel()/stop() notifies
+                self._cond.wait(timeout)
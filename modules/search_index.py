@@ -0,0 +1,184 @@
+"""
+In-memory full-text index over notes, saved links and clipboard history.
+
+An inverted index maps each lowercase word to the documents containing it.
+A sorted copy of the vocabulary answers prefix queries with two bisects, so
+"prox" finds "proxy" and "proxmox" without scanning any documents. One- and
+two-letter prefixes, which match most words, have their own postings, and a
+trigram index over the vocabulary answers the substring fallback. Adding or
+removing a document only touches its own words, which keeps as-you-type
+lookups cheap even with tens of thousands of entries.
+
+Documents are keyed by (kind, ident). Notes and links use their text as the
+ident and are reference-counted, so duplicates survive a single delete;
+clipboard entries use their content hash.
+"""
+import re
+import heapq
+import threading
+from bisect import bisect_left, insort
+
+TOKEN_RE = re.compile(r"\w+")
+KINDS = ("note", "link", "clip")
+
+# Prefixes up to this length get their own postings
+SHORT_PREFIX = 2
+# Substring fallback granularity; shorter terms only match as prefixes
+GRAM = 3
+
+def tokenize(text):
+    return set(TOKEN_RE.findall(text.lower()))
+
+def short_prefixes(tokens):
+    return {t[:n] for t in tokens for n in range(1, SHORT_PREFIX + 1)}
+
+def grams(word):
+    return {word[i:i + GRAM] for i in range(len(word) - GRAM + 1)}
+
+class SearchIndex:
+    def __init__(self):
+        # (kind, ident) -> [text, tokens, refcount]
+        self.docs = {}
+        # token -> set of (kind, ident)
+        self.postings = {}
+        # sorted vocabulary for prefix lookups
+        self.vocab = []
+        # short prefix -> set of (kind, ident)
+        self.short = {}
+        # trigram -> set of vocabulary words containing it
+        self.grams = {}
+        # insertion counter, used to rank newer documents first on ties;
+        # kept in that order, oldest first
+        self.seq = {}
+        self._counter = 0
+        # the clipboard watcher updates the index from its own thread
+        self.lock = threading.RLock()
+
+    def __len__(self):
+        return len(self.docs)
+
+    def add(self, kind, ident, text):
+        with self.lock:
+            self._add(kind, ident, text)
+
+    def _add(self, kind, ident, text):
+        key = (kind, ident)
+        self._counter += 1
+        self.seq.pop(key, None)
+        self.seq[key] = self._counter
+        doc = self.docs.get(key)
+        if doc:
+            doc[2] += 1
+            return
+        tokens = tokenize(text)
+        self.docs[key] = [text, tokens, 1]
+        for token in tokens:
+            keys = self.postings.get(token)
+            if keys is None:
+                self.postings[token] = {key}
+                insort(self.vocab, token)
+                for gram in grams(token):
+                    self.grams.setdefault(gram, set()).add(token)
+            else:
+                keys.add(key)
+        for prefix in short_prefixes(tokens):
+            self.short.setdefault(prefix, set()).add(key)
+
+    def remove(self, kind, ident):
+        with self.lock:
+            self._remove(kind, ident)
+
+    def _remove(self, kind, ident):
+        key = (kind, ident)
+        doc = self.docs.get(key)
+        if not doc:
+            return
+        doc[2] -= 1
+        if doc[2] > 0:
+            return
+        del self.docs[key]
+        self.seq.pop(key, None)
+        for token in doc[1]:
+            keys = self.postings.get(token)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self.postings[token]
+                i = bisect_left(self.vocab, token)
+                if i < len(self.vocab) and self.vocab[i] == token:
+                    del self.vocab[i]
+                for gram in grams(token):
+                    words = self.grams[gram]
+                    words.discard(token)
+                    if not words:
+                        del self.grams[gram]
+        for prefix in short_prefixes(doc[1]):
+            keys = self.short[prefix]
+            keys.discard(key)
+            if not keys:
+                del self.short[prefix]
+
+    def clear(self, kind=None):
+        """Drops every document, or only those of one kind."""
+        with self.lock:
+            for key in [k for k in self.docs if kind is None or k[0] == kind]:
+                self.docs[key][2] = 1
+                self._remove(*key)
+
+    def _matching(self, term):
+        """(docs with a word starting with term, docs with term as a whole word)."""
+        postings = self.postings
+        if len(term) <= SHORT_PREFIX:
+            return self.short.get(term, set()), postings.get(term, set())
+        lo = bisect_left(self.vocab, term)
+        hi = bisect_left(self.vocab, term + "\U0010ffff", lo)
+        words = self.vocab[lo:hi]
+        if not words:
+            # Fuzzy fallback: words holding every trigram of the term, then
+            # the substring check on those few
+            sets = sorted((self.grams.get(g, set()) for g in grams(term)), key=len)
+            words = [w for w in set.intersection(*sets) if term in w]
+        return set().union(*(postings[w] for w in words)), postings.get(term, set())
+
+    def search(self, query, limit=20, kind=None):
+        """
+        Returns up to limit (kind, ident, text) tuples matching every word of
+        the query. Whole-word hits rank above prefix hits, newer entries first.
+        """
+        terms = sorted(tokenize(query), key=len, reverse=True)
+        if not terms:
+            return []
+        with self.lock:
+            return self._search(terms, limit, kind)
+
+    def _search(self, terms, limit, kind):
+        candidates = None
+        exact = None
+        # Longest terms first: they usually have the fewest matches
+        for term in terms:
+            matches, whole = self._matching(term)
+            candidates = matches if candidates is None else candidates & matches
+            exact = set(whole) if exact is None else exact & whole
+            if not candidates:
+                return []
+
+        exact &= candidates
+        if kind:
+            exact = {k for k in exact if k[0] == kind}
+        newest = self.seq.__getitem__
+        best = heapq.nlargest(limit, exact, key=newest)
+        want = limit - len(best)
+        if want > 0 and len(candidates) * 16 >= len(self.seq):
+            # Most documents match (a short prefix): walk them newest first
+            # instead of ranking them all
+            for k in reversed(self.seq):
+                if k in candidates and k not in exact and (not kind or k[0] == kind):
+                    best.append(k)
+                    want -= 1
+                    if not want:
+                        break
+        elif want > 0:
+            rest = (k for k in candidates - exact if not kind or k[0] == kind)
+            best += heapq.nlargest(want, rest, key=newest)
+        return [(k[0], k[1], self.docs[k][0]) for k in best]
@@ -0,0 +1,255 @@
+"""
+Rich-free status output for status bars (waybar, polybar, tmux, i3blocks).
+
+Everything here sticks to the standard library (psutil is optional) so that
+`dailydash status --format ...` stays cheap enough to poll every few seconds,
+and `dailydash watch` can stay resident and stream one line per change.
+"""
+import argparse
+import json
+import os
+import signal
+import sys
+import time
+from modules import tracing
+
+FORMATS = ["json", "line", "template"]
+
+DEFAULT_TEMPLATE = "\U0001F4A7 {water}/{water_goal}ml | ✔ {tasks_done}/{tasks_total} | ☕ {caffeine}mg"
+
+class _BlankDict(dict):
+    """format_map helper: unknown or empty fields render as an empty string."""
+    def __missing__(self, key):
+        return ""
+
+@tracing.traced(cat="vitals")
+def _get_vitals(sample_cpu=False):
+    vitals = {"load": None, "mem": None, "battery": None}
+    if sample_cpu:
+        vitals["cpu"] = None
+    if hasattr(os, "getloadavg"):
+        try:
+            vitals["load"] = round(os.getloadavg()[0], 2)
+        except OSError:
+            pass
+    try:
+        import psutil
+        if sample_cpu:
+            # Non-blocking: measures since the previous call, so only meaningful when resident
+            vitals["cpu"] = psutil.cpu_percent(interval=None)
+        vitals["mem"] = psutil.virtual_memory().percent
+        batt = psutil.sensors_battery()
+        vitals["battery"] = batt.percent if batt else None
+    except Exception:
+        pass
+    return vitals
+
+@tracing.traced()
+def collect_status(include_vitals=True, sample_cpu=False):
+    """
+    Gathers the status bar fields into a flat dict.
+    Only reads the config sections it needs; weather comes from the disk cache.
+    """
+    from modules.data_handler import load_sections
+    from modules.models import DailyState
+    from modules.weather_api import get_cached_weather
+    from modules import timer_store
+
+    sections = load_sections("user_profile", "daily_state", "persistent_data")
+    profile = sections["user_profile"]
+    daily = DailyState.from_dict(sections["daily_state"])
+    habits = daily.habits(sections["persistent_data"].get("habits", []))
+
+    water = daily.water
+    goal = profile.get("daily_water_goal", 2000) or 1
+    tasks = daily.active_tasks()
+
+    status = {
+        "name": profile.get("name", "User"),
+        "date": time.strftime("%a %b %d"),
+        "time": time.strftime("%H:%M"),
+        "water": water,
+        "water_goal": goal,
+        "water_pct": min(100, int((water / goal) * 100)),
+        "caffeine": daily.caffeine,
+        "tasks_done": sum(1 for t in tasks if t.done),
+        "tasks_total": len(tasks),
+        "habits_done": sum(1 for h in habits if h.done),
+        "habits_total": len(habits),
+        "timer": timer_store.get_timer_status(),
+        "timer_remaining": 0,
+        "timer_label": "",
+        "pomo_phase": "",
+        "pomo_cycle": None,
+        "city": profile.get("city", ""),
+        "weather": "",
+        "weather_icon": "",
+        "temp": None,
+        "temp_unit": "",
+        "humidity": None,
+        "wind": None,
+        "weather_stale": None
+    }
+
+    timer = timer_store.get_active_timer()
+    if timer:
+        status["timer_remaining"] = max(0, int(timer["deadline"] - time.time()))
+        status["timer_label"] = timer.get("label", "")
+        if timer.get("pomodoro"):
+            status["pomo_phase"] = timer["pomodoro"]["phase"]
+            status["pomo_cycle"] = timer["pomodoro"]["cycle"]
+
+    record = get_cached_weather(status["city"], profile.get("unit_system", "metric"))
+    if record:
+        status["weather_icon"] = record.get("icon", "")
+        status["temp"] = record.get("temp")
+        status["temp_unit"] = record.get("temp_unit", "")
+        status["humidity"] = record.get("humidity")
+        status["wind"] = record.get("wind")
+        status["weather_stale"] = record.get("stale")
+        status["weather"] = f"{status['weather_icon']} {status['temp']}°{status['temp_unit']}"
+
+    if include_vitals:
+        status.update(_get_vitals(sample_cpu))
+
+    return status
+
+def format_status(status, fmt="line", template=None):
+    """Renders the collected fields as json, a compact line or a user template."""
+    if fmt == "json":
+        return json.dumps(status, ensure_ascii=False, separators=(",", ":"))
+
+    if fmt == "template":
+        fields = _BlankDict({k: ("" if v is None else v) for k, v in status.items()})
+        return (template or DEFAULT_TEMPLATE).format_map(fields)
+
+    line = DEFAULT_TEMPLATE.format_map(_BlankDict(status))
+    if status.get("timer", "IDLE") != "IDLE":
+        label = f"{status['timer_label']} " if status.get("timer_label") else ""
+        line += f" | ⏳ {label}{status['timer']}"
+    if status.get("weather"):
+        line += f" | {status['weather']}"
+    return line
+
+def _watched_mtimes():
+    from modules.data_handler import section_path
+    from modules.weather_api import WEATHER_CACHE_FILE
+    from modules.timer_store import TIMER_FILE
+
+    mtimes = []
+    sections = [section_path(name) for name in ("user_profile", "daily_state", "persistent_data")]
+    for path in sections + [WEATHER_CACHE_FILE, TIMER_FILE]:
+        try:
+            mtimes.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return mtimes
+
+def _refresh_weather():
+    """Kicks the background weather fetch when the cache is stale (resident mode only)."""
+    from modules.data_handler import load_sections
+    from modules.weather_api import get_weather_for_city
+
+    profile = load_sections("user_profile")["user_profile"]
+    get_weather_for_city(profile.get("city", ""), profile.get("unit_system", "metric"))
+
+def watch(interval=5.0, fmt="line", template=None, include_vitals=True, out=None):
+    """
+    Stays resident and writes one line per tick, or immediately when the
+    config, weather cache or timer changes on disk. Only stat() calls happen
+    between ticks. While running it is the resident daemon that fires timers.
+    """
+    from modules import timer_store
+
+    timer_store.register_daemon()
+    try:
+        _watch_loop(interval, fmt, template, include_vitals, out or sys.stdout)
+    finally:
+        timer_store.unregister_daemon()
+        # Nobody else is watching the pending timer now; hand it to a notifier process
+        pending = timer_store.get_active_timer()
+        if pending:
+            timer_store.spawn_notifier(pending["id"])
+
+def _watch_loop(interval, fmt, template, include_vitals, out):
+    from modules import timer_store
+    from modules.timer_notifier import fire_timer
+
+    pending = None
+    check_every = min(interval, 1.0)
+    last_line = None
+    last_mtimes = None
+    next_tick = 0.0
+
+    while True:
+        now = time.monotonic()
+        mtimes = _watched_mtimes()
+        tick = now >= next_tick
+
+        if mtimes != last_mtimes:
+            timer = timer_store.load_timer()
+            pending = timer if timer and not timer.get("fired") else None
+        if pending and time.time() >= pending["deadline"]:
+            fire_timer(pending["id"])
+            pending = None
+
+        if tick or mtimes != last_mtimes:
+            if tick:
+                _refresh_weather()
+                next_tick = now + interval
+            status = collect_status(include_vitals, sample_cpu=True)
+            line = format_status(status, fmt, template)
+            if tick or line != last_line:
+                out.write(line + "\n")
+                out.flush()
+                last_line = line
+            last_mtimes = mtimes
+
+        time.sleep(max(0.0, min(check_every, next_tick - time.monotonic())))
+
+def build_parser(prog="dailydash status"):
+    parser = argparse.ArgumentParser(prog=prog, description="Status bar output")
+    parser.add_argument("--format", "-f", choices=FORMATS, default="line", help="Output format")
+    parser.add_argument("--template", "-t", help="Template for --format template, e.g. '{water}/{water_goal}ml'")
+    parser.add_argument("--no-vitals", action="store_true", help="Skip load/memory/battery sampling")
+    return parser
+
+def build_watch_parser():
+    parser = build_parser("dailydash watch")
+    parser.add_argument("--interval", "-i", type=float, default=5.0, help="Seconds between ticks (default 5)")
+    return parser
+
+def wants_fast_status(argv):
+    """True when argv asks for machine-readable status output (one-shot or streaming)."""
+    if not argv:
+        return False
+    if argv[0] == "watch":
+        return True
+    flags = ("--format", "-f", "--template", "-t")
+    return argv[0] == "status" and any(a.startswith(flags) for a in argv[1:])
+
+def _resolve_format(args, argv):
+    if args.template and "--format" not in argv and "-f" not in argv:
+        args.format = "template"
+
+def run_fast_status(argv):
+    if argv[0] == "watch":
+        args = build_watch_parser().parse_args(argv[1:])
+        _resolve_format(args, argv)
+        # Bars stop us with SIGTERM; exit through watch()'s cleanup instead of dying mid-write
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        try:
+            watch(max(0.1, args.interval), args.format, args.template, not args.no_vitals)
+        except (KeyboardInterrupt, BrokenPipeError):
+            # The bar went away; don't let Python complain about flushing a closed stdout
+            try:
+                sys.stdout = open(os.devnull, "w")
+            except OSError:
+                pass
+        return 0
+
+    args = build_parser().parse_args(argv[1:])
+    _resolve_format(args, argv)
+    status = collect_status(include_vitals=not args.no_vitals)
+    sys.stdout.write(format_status(status, args.format, args.template) + "\n")
+    return 0
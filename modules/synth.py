@@ -0,0 +1,260 @@
+"""
+Bulk sample synthesis for ambient noise and the chime.
+
+Uses numpy when it is installed; otherwise falls back to the array module and
+itertools.accumulate, which keep the per-sample work inside C loops instead of
+Python bytecode plus one struct.pack call per sample. Samples are floats in
+roughly -1..1 until to_pcm16() turns them into little-endian 16-bit PCM.
+"""
+import math
+import os
+import sys
+import wave
+from array import array
+from itertools import accumulate, repeat
+from operator import add, mul
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+SAMPLE_RATE = 44100
+# Leaky integrator coefficient: y[n] = LEAK * (y[n-1] + white[n])
+BROWN_LEAK = 0.98
+NOISE_COLORS = ("brown", "pink", "white")
+# Paul Kellet's economy pink filter: three one-pole sections plus a direct term
+PINK_POLES = ((0.99765, 0.0990460), (0.96300, 0.2965164), (0.57000, 1.0526913))
+PINK_DIRECT = 0.1848
+# Scales each colour to roughly the same loudness (RMS ~0.2, peaks well under full scale)
+COLOR_GAIN = {"brown": 0.2 / 2.84, "pink": 0.2 / 1.56, "white": 0.2 / 0.577}
+
+def _one_pole_numpy(x, a, y0):
+    """y[n] = a * y[n-1] + x[n] over a whole chunk. Returns (y, y[-1])."""
+    n = len(x)
+    # Largest block for which a ** -block stays below ~1e12
+    block = max(1, min(4096, int(27.0 / -math.log(a))))
+    n_blocks = -(-n // block)
+    padded = np.zeros(n_blocks * block)
+    padded[:n] = x
+    j = np.arange(block)
+    # y[i] = a^(i+1) * y_prev + a^i * sum_{k<=i} a^-k * x[k]
+    partial = np.cumsum(padded.reshape(n_blocks, block) * a ** -j, axis=1) * a ** j
+    carry = np.empty(n_blocks)
+    decay = a ** block
+    last = y0
+    for b, tail in enumerate(partial[:, -1].tolist()):
+        carry[b] = last
+        last = decay * last + tail
+    y = (partial + carry[:, None] * a ** (j + 1)).ravel()[:n]
+    return y, float(y[-1]) if n else y0
+
+class NoiseGenerator:
+    """
+    Endless noise of one colour, produced chunk by chunk. Filter state carries
+    over between calls, so consecutive chunks join without clicks and memory
+    stays constant however long it plays.
+    """
+    def __init__(self, color="brown", seed=None):
+        if color not in NOISE_COLORS:
+            raise ValueError(f"Unknown noise color: {color}")
+        self.color = color
+        self.gain = COLOR_GAIN[color]
+        # Filter memory, kept in output units
+        self.state = [0.0] * len(PINK_POLES) if color == "pink" else [0.0]
+        self.rng = np.random.default_rng(seed) if np is not None else None
+
+    def generate(self, n):
+        """Next n samples, roughly within -1..1."""
+        if np is not None:
+            return self._generate_numpy(n)
+        return self._generate_python(n)
+
+    def _generate_numpy(self, n):
+        white = self.rng.uniform(-1.0, 1.0, n)
+        if self.color == "white":
+            return white * self.gain
+        if self.color == "brown":
+            y, self.state[0] = _one_pole_numpy(white * BROWN_LEAK, BROWN_LEAK, self.state[0])
+            return y * self.gain
+        out = white * PINK_DIRECT
+        for i, (a, g) in enumerate(PINK_POLES):
+            y, self.state[i] = _one_pole_numpy(white * g, a, self.state[i])
+            out += y
+        return out * self.gain
+
+    def _generate_python(self, n):
+        white = array('h', os.urandom(2 * n))
+        # Fold the int16 scale and output gain into the filter coefficients,
+        # so each sample costs one C-level accumulate step per filter
+        scale = self.gain / 32768.0
+        if self.color == "white":
+            return array('d', map(scale.__mul__, white))
+        if self.color == "brown":
+            a, g = BROWN_LEAK, BROWN_LEAK * scale
+            y = array('d', accumulate(white, lambda y, x: a * y + g * x, initial=self.state[0]))[1:]
+            self.state[0] = y[-1]
+            return y
+        direct = PINK_DIRECT * scale
+        out = array('d', map(direct.__mul__, white))
+        for i, (a, g) in enumerate(PINK_POLES):
+            gs = g * scale
+            y = array('d', accumulate(white, lambda y, x: a * y + gs * x, initial=self.state[i]))[1:]
+            self.state[i] = y[-1]
+            out = array('d', map(add, out, y))
+        return out
+
+def crossfade(old, new):
+    """Blends from old to new over the length of the chunk (for live colour changes)."""
+    n = len(new)
+    if np is not None and isinstance(new, np.ndarray):
+        ramp = np.linspace(0.0, 1.0, n)
+        return old * (1.0 - ramp) + new * ramp
+    step = 1.0 / max(1, n - 1)
+    return array('d', (o + (w - o) * i * step for i, (o, w) in enumerate(zip(old, new))))
+
+# --- Building blocks for precomputed layers (numpy or array, same interface) ---
+
+def white_noise(n, rng=None):
+    """n uniform samples in -1..1."""
+    if np is not None:
+        return (rng or np.random.default_rng()).uniform(-1.0, 1.0, n)
+    return gain(array('h', os.urandom(2 * n)), 1.0 / 32768.0)
+
+def one_pole(x, a, y0=0.0):
+    """y[n] = a * y[n-1] + x[n]."""
+    if np is not None and isinstance(x, np.ndarray):
+        return _one_pole_numpy(x, a, y0)[0]
+    return array('d', accumulate(x, lambda y, v: a * y + v, initial=y0))[1:]
+
+def lowpass(x, a):
+    """One-pole low-pass; a closer to 1 means a lower cutoff."""
+    return one_pole(gain(x, 1.0 - a), a)
+
+def highpass(x, a):
+    return add_signals(x, gain(lowpass(x, a), -1.0))
+
+def gain(x, g):
+    if np is not None and isinstance(x, np.ndarray):
+        return x * g
+    return array('d', map(float(g).__mul__, x))
+
+def offset(x, c):
+    if np is not None and isinstance(x, np.ndarray):
+        return x + c
+    return array('d', map(float(c).__add__, x))
+
+def add_signals(*signals):
+    if np is not None and isinstance(signals[0], np.ndarray):
+        return sum(signals[1:], signals[0])
+    out = signals[0]
+    for other in signals[1:]:
+        out = array('d', map(add, out, other))
+    return out
+
+def modulate(x, envelope):
+    """Sample-wise product, e.g. a signal and an amplitude envelope."""
+    if np is not None and isinstance(x, np.ndarray):
+        return x * envelope
+    return array('d', map(mul, x, envelope))
+
+def sine(n, frequency, sample_rate=SAMPLE_RATE):
+    if np is not None:
+        return np.sin(2.0 * math.pi * frequency / sample_rate * np.arange(n))
+    w = 2.0 * math.pi * frequency / sample_rate
+    return array('d', map(math.sin, map(w.__mul__, range(n))))
+
+def impulses(n, count, rng=None):
+    """count random-height clicks (either sign) at random positions."""
+    if np is not None:
+        rng = rng or np.random.default_rng()
+        out = np.zeros(n)
+        out[rng.integers(0, n, count)] = rng.uniform(-1.0, 1.0, count)
+        return out
+    import random
+    out = array('d', bytes(8 * n))
+    for pos in random.sample(range(n), min(count, n)):
+        out[pos] = random.uniform(-1.0, 1.0)
+    return out
+
+def peak(x):
+    if np is not None and isinstance(x, np.ndarray):
+        return float(np.abs(x).max()) if len(x) else 0.0
+    return max(max(x), -min(x)) if len(x) else 0.0
+
+def loop_crossfade(samples, fade):
+    """
+    Turns len(samples) - fade samples into a seamless loop: the extra tail is
+    faded into the head, so the last sample flows straight into the first.
+    Done once at generation time; playback just loops the result.
+    """
+    n = len(samples) - fade
+    if np is not None and isinstance(samples, np.ndarray):
+        out = samples[:n].copy()
+        ramp = np.linspace(0.0, 1.0, fade, endpoint=False)
+        out[:fade] = samples[:fade] * ramp + samples[n:] * (1.0 - ramp)
+        return out
+    out = samples[:n]
+    step = 1.0 / fade
+    out[:fade] = array('d', (h * i * step + t * (1.0 - i * step)
+                             for i, (h, t) in enumerate(zip(samples[:fade], samples[n:]))))
+    return out
+
+def brown_noise(seconds, sample_rate=SAMPLE_RATE, seed=None):
+    """Normalised brown noise as int16 PCM bytes."""
+    return to_pcm16(NoiseGenerator("brown", seed).generate(int(seconds * sample_rate)))
+
+def chime(seconds=1.0, frequency=880.0, decay=3.0, sample_rate=SAMPLE_RATE):
+    """Sine 'ding' with an exponential decay as int16 PCM bytes."""
+    n_samples = int(seconds * sample_rate)
+    if np is not None:
+        t = np.arange(n_samples) / sample_rate
+        samples = np.sin(2.0 * math.pi * frequency * t) * np.exp(-decay * t)
+        return to_pcm16(samples, peak=1.0)
+
+    w = 2.0 * math.pi * frequency / sample_rate
+    d = math.exp(-decay / sample_rate)
+    sin = math.sin
+    return to_pcm16(array('d', (sin(w * i) * d ** i for i in range(n_samples))), peak=1.0)
+
+def to_pcm16(samples, peak=None, channels=1):
+    """
+    Scales float samples so peak maps to full scale (default: their own peak),
+    clipping anything beyond it. Mono input is copied to every channel.
+    """
+    if np is not None and isinstance(samples, np.ndarray):
+        if peak is None:
+            peak = float(np.abs(samples).max()) or 1.0
+        pcm = np.clip(samples * (32767.0 / peak), -32767, 32767).astype('<i2')
+        if channels > 1:
+            pcm = np.repeat(pcm, channels)
+        return pcm.tobytes()
+
+    if peak is None:
+        peak = max(max(samples), -min(samples)) if samples else 1.0
+        peak = peak or 1.0
+    scale = 32767.0 / peak
+    try:
+        pcm = array('h', map(int, map(scale.__mul__, samples)))
+    except OverflowError:
+        # Rare peak beyond full scale: redo with clipping
+        scaled = map(scale.__mul__, samples)
+        pcm = array('h', map(int, map(max, repeat(-32767.0), map(min, repeat(32767.0), scaled))))
+    if channels > 1:
+        mono = pcm
+        pcm = array('h', bytes(2 * len(mono) * channels))
+        for c in range(channels):
+            pcm[c::channels] = mono
+    if sys.byteorder == 'big':
+        pcm.byteswap()
+    return pcm.tobytes()
+
+def write_wav(path, pcm, sample_rate=SAMPLE_RATE):
+    """Writes mono 16-bit PCM atomically, so a crash never leaves a truncated asset."""
+    tmp = f"{path}.tmp"
+    with wave.open(tmp, 'w') as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes(pcm)
+    os.replace(tmp, path)
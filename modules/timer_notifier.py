@@ -0,0 +1,79 @@
+"""
+Detached timer notifier: `python -m modules.timer_notifier <timer_id>`.
+
+Sleeps until the persisted deadline, then rings the chime and sends a desktop
+notification, unless the timer was cancelled, paused, replaced or already
+fired by another process in the meantime. For pomodoro cycles it follows on
+to each next phase it starts.
+"""
+import sys
+import time
+from modules import timer_store
+from modules import notifications
+from modules import metrics
+
+# Re-check the wall clock at least this often, so a suspended laptop
+# rings shortly after resume instead of after the full monotonic sleep.
+MAX_SLEEP = 60
+
+def fire_timer(timer_id, play_chime=None):
+    """
+    Claims and fires the timer. Returns False if someone else already did.
+    A pomodoro phase is advanced here, by whoever won the claim.
+    """
+    timer = timer_store.claim_fire(timer_id)
+    if not timer:
+        return False
+    metrics.inc("dailydash_timer_fires_total", kind="pomodoro" if timer.get("pomodoro") else "timer")
+
+    if timer.get("pomodoro"):
+        from modules import pomodoro
+        pomodoro.on_phase_complete(timer)
+
+    if play_chime is None:
+        try:
+            from modules.audio_manager import AudioManager
+            play_chime = AudioManager().play_chime
+        except Exception:
+            play_chime = None
+    if play_chime:
+        play_chime()
+
+    # Desktop Notification
+    notifications.notify(f"DailyDash {timer.get('label', 'Timer')}", timer.get("message", 'Time is up! Take a break.'), urgent=True)
+    return True
+
+def wait_and_fire(timer_id):
+    fired = False
+    while True:
+        timer = timer_store.load_timer()
+        if not timer or timer.get("id") != timer_id or timer.get("fired") or timer.get("paused"):
+            break
+        remaining = timer["deadline"] - time.time()
+        if remaining > 0:
+            time.sleep(min(remaining, MAX_SLEEP))
+            continue
+
+        if not fire_timer(timer_id):
+            break
+        fired = True
+        # A pomodoro phase we just fired started the next one; keep owning it
+        next_timer = timer_store.get_active_timer()
+        if not next_timer or not next_timer.get("pomodoro"):
+            break
+        timer_id = next_timer["id"]
+
+    if fired:
+        # Give the chime time to play before the process exits
+        time.sleep(1.5)
+    return fired
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        return 2
+    wait_and_fire(argv[0])
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
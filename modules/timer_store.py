@@ -0,0 +1,173 @@
+"""
+Persistent focus timer state.
+
+The active timer lives in its own small file (not config.json) as an absolute
+wall-clock deadline, so every process shows the same countdown and a timer
+outlives the process that started it. Firing is claimed through an exclusive
+marker file, so a detached notifier and a resident process never both ring.
+"""
+import json
+import os
+import sys
+import time
+import uuid
+import subprocess
+from modules.data_handler import CONFIG_DIR
+
+TIMER_FILE = CONFIG_DIR / "timer.json"
+DAEMON_PID_FILE = CONFIG_DIR / "daemon.pid"
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def load_timer():
+    try:
+        with open(TIMER_FILE, 'r') as f:
+            return json.load(f)
+    except (IOError, ValueError):
+        return None
+
+def save_timer(timer):
+    tmp = TIMER_FILE.with_suffix(".tmp")
+    with open(tmp, 'w') as f:
+        json.dump(timer, f)
+    os.replace(tmp, TIMER_FILE)
+
+def _marker(timer_id):
+    return CONFIG_DIR / f"timer.{timer_id}.fired"
+
+def _clear_markers():
+    for path in CONFIG_DIR.glob("timer.*.fired"):
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+def start_timer(minutes, label="Focus", **extra):
+    """
+    Persists a new timer, replacing any previous one. Returns the timer dict.
+    Extra keyword fields (e.g. a pomodoro state or notification message) are stored with it.
+    """
+    _clear_markers()
+    now = time.time()
+    timer = {
+        "id": uuid.uuid4().hex,
+        "label": label,
+        "minutes": minutes,
+        "started": now,
+        "deadline": now + minutes * 60,
+        "fired": False
+    }
+    timer.update(extra)
+    save_timer(timer)
+    return timer
+
+def cancel_timer():
+    try:
+        TIMER_FILE.unlink()
+    except OSError:
+        pass
+    _clear_markers()
+
+def get_active_timer():
+    """The running timer, or None when idle, paused, fired or expired."""
+    timer = load_timer()
+    if timer and not timer.get("fired") and not timer.get("paused") and timer.get("deadline", 0) > time.time():
+        return timer
+    return None
+
+def remaining_seconds():
+    timer = get_active_timer()
+    return max(0, int(timer["deadline"] - time.time())) if timer else 0
+
+def format_remaining(seconds):
+    m, s = divmod(int(seconds), 60)
+    return f"{m:02}:{s:02}"
+
+def get_timer_status():
+    """MM:SS countdown of the persisted timer, PAUSED MM:SS, or IDLE."""
+    timer = load_timer()
+    if timer and timer.get("paused"):
+        return f"PAUSED {format_remaining(timer.get('paused_remaining', 0))}"
+    timer = get_active_timer()
+    if timer:
+        return format_remaining(timer["deadline"] - time.time())
+    return "IDLE"
+
+def claim_fire(timer_id):
+    """
+    Atomically claims the right to fire this timer. Returns the timer dict for
+    exactly one caller across all processes; None if it was cancelled, paused
+    or already fired.
+    """
+    timer = load_timer()
+    if not timer or timer.get("id") != timer_id or timer.get("fired") or timer.get("paused"):
+        return None
+    try:
+        fd = os.open(_marker(timer_id), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        os.close(fd)
+    except FileExistsError:
+        return None
+    except OSError:
+        pass
+    timer["fired"] = True
+    try:
+        save_timer(timer)
+    except IOError:
+        pass
+    return timer
+
+# --- Resident daemon registration ---
+
+def register_daemon():
+    try:
+        DAEMON_PID_FILE.write_text(str(os.getpid()))
+    except IOError:
+        pass
+
+def unregister_daemon():
+    try:
+        if DAEMON_PID_FILE.read_text().strip() == str(os.getpid()):
+            DAEMON_PID_FILE.unlink()
+    except (IOError, ValueError):
+        pass
+
+def daemon_alive():
+    """True if a resident process (e.g. `dailydash watch`) will fire timers for us."""
+    try:
+        pid = int(DAEMON_PID_FILE.read_text().strip())
+    except (IOError, ValueError):
+        return False
+    try:
+        import psutil
+        return psutil.pid_exists(pid)
+    except ImportError:
+        try:
+            os.kill(pid, 0)
+            return True
+        except OSError:
+            return False
+
+def spawn_notifier(timer_id):
+    """Starts a detached, rich-free process that sleeps until the deadline and fires."""
+    kwargs = {}
+    if os.name == 'nt':
+        kwargs["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs["start_new_session"] = True
+    try:
+        subprocess.Popen(
+            [sys.executable, "-m", "modules.timer_notifier", timer_id],
+            cwd=PACKAGE_ROOT,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            **kwargs
+        )
+        return True
+    except OSError:
+        return False
+
+def ensure_notifier(timer):
+    """Hands a pending timer to the resident daemon if one is running, else to a notifier process."""
+    if daemon_alive():
+        return
+    spawn_notifier(timer["id"])
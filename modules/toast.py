@@ -0,0 +1,33 @@
+"""
+Transient status line ("toast").
+
+Actions post their outcome here instead of printing it and sleeping so it
+can be read: the next frame shows the message, and frames drawn after
+TOAST_SECONDS no longer do.
+"""
+import time
+
+TOAST_SECONDS = 4
+
+_message = None
+_expires = 0.0
+
+def show(message, seconds=TOAST_SECONDS):
+    """Replaces the current toast. `message` is rich markup or a rich Text."""
+    global _message, _expires
+    _message = message
+    _expires = time.monotonic() + seconds
+
+def current():
+    """The live toast, or None once it has expired."""
+    if _message is not None and time.monotonic() < _expires:
+        return _message
+    return None
+
+def remaining():
+    """Seconds until the live toast fades (0 if there is none)."""
+    return max(0.0, _expires - time.monotonic()) if current() is not None else 0.0
+
+def clear():
+    global _message
+    _message = None
@@ -0,0 +1,115 @@
+"""
+Phase tracing in Chrome trace-event format.
+
+Set DAILYDASH_TRACE=/path/trace.json (or pass `--trace /path/trace.json`) and
+every traced span is written there when the process exits; open the file in
+Perfetto (ui.perfetto.dev) or chrome://tracing.
+
+Tracing is decided once, before the traced modules are imported. When it is
+off, @traced returns the function itself and span() a shared no-op context,
+so instrumented code runs exactly as it would without it.
+"""
+import atexit
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+
+ENV_VAR = "DAILYDASH_TRACE"
+
+_events = None
+_path = None
+_lock = threading.Lock()
+_origin = time.perf_counter()
+_NULL = nullcontext()
+
+def enable(path):
+    """Starts recording; the trace is written to `path` at exit."""
+    global _events, _path
+    if _events is not None:
+        return
+    _events = []
+    _path = str(path)
+    # Child processes (the timer notifier) would overwrite our file
+    os.environ.pop(ENV_VAR, None)
+    atexit.register(write)
+
+def enabled():
+    return _events is not None
+
+def _now_us():
+    return (time.perf_counter() - _origin) * 1e6
+
+def _record(event):
+    event["pid"] = os.getpid()
+    event["tid"] = threading.get_ident()
+    with _lock:
+        _events.append(event)
+
+class _Span:
+    __slots__ = ("name", "cat", "args", "start")
+
+    def __init__(self, name, cat, args):
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.start = _now_us()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        event = {"name": self.name, "cat": self.cat, "ph": "X", "ts": self.start, "dur": _now_us() - self.start}
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        if self.args:
+            event["args"] = self.args
+        _record(event)
+        return False
+
+def span(name, cat="app", **args):
+    """Context manager timing one phase; `args` show up in the trace viewer."""
+    if _events is None:
+        return _NULL
+    return _Span(name, cat, args)
+
+def traced(name=None, cat=None):
+    """Decorator form of span(). Without tracing the function is returned untouched."""
+    def decorate(func):
+        if _events is None:
+            return func
+        label = name or func.__qualname__
+        category = cat or func.__module__.rpartition(".")[2]
+
+        def wrapper(*args, **kwargs):
+            with _Span(label, category, {}):
+                return func(*args, **kwargs)
+        wrapper.__name__ = func.__name__
+        wrapper.__qualname__ = func.__qualname__
+        wrapper.__doc__ = func.__doc__
+        wrapper.__wrapped__ = func
+        return wrapper
+    return decorate
+
+def instant(name, cat="app", **args):
+    """A zero-length marker."""
+    if _events is not None:
+        _record({"name": name, "cat": cat, "ph": "i", "s": "t", "ts": _now_us(), "args": args})
+
+def write():
+    if _events is None or _path is None:
+        return
+    names = {t.ident: t.name for t in threading.enumerate()}
+    with _lock:
+        events = list(_events)
+    meta = [{"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": names[tid]}}
+            for tid in {e["tid"] for e in events} if tid in names]
+    try:
+        with open(_path, 'w') as f:
+            json.dump({"traceEvents": meta + events, "displayTimeUnit": "ms"}, f)
+    except OSError as e:
+        print(f"Could not write trace: {e}")
+
+if os.environ.get(ENV_VAR):
+    enable(os.environ[ENV_VAR])
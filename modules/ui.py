@@ -8,12 +8,14 @@ from rich import box
 from rich.progress import BarColumn, Progress, TextColumn
 import time
 from datetime import datetime
+from modules import tracing
 
 class DailyDashUI:
     def __init__(self, console: Console):
         self.console = console
         self.layout = Layout()
 
+    @tracing.traced(cat="render")
     def render_dashboard(self, data_manager, weather_info, system_vitals, timer_status):
         """
         Renders the full dashboard using a grid layout.
@@ -32,7 +34,8 @@ class DailyDashUI:
         # Populate Footer
         self.layout["footer"].update(self.make_footer(theme))
         
-        self.console.print(self.layout)
+        with tracing.span("print layout", cat="render"):
+            self.console.print(self.layout)
 
     def make_layout(self):
         """Define the grid layout."""
@@ -53,6 +56,7 @@ class DailyDashUI:
         t_name = data_manager.get("app_settings", {}).get("theme", "default")
         return get_theme(t_name)
 
+    @tracing.traced(cat="render")
     def make_header(self, data_manager, theme):
         profile = data_manager.get("user_profile", {})
         name = profile.get("name", "User")
@@ -74,43 +78,41 @@ class DailyDashUI:
         )
         return Panel(grid, style=f"{theme['box']}")
 
+    @tracing.traced(cat="render")
     def make_planning_panel(self, data_manager, theme):
         """Big 3 Tasks & Habits"""
-        daily = data_manager.get("daily_state", {})
-        tasks = daily.get("tasks", [])
+        daily = data_manager.daily()
         
         # Tasks Table
         t_table = Table(box=None, expand=True, show_header=False, padding=(0,0))
         t_table.add_column("State", width=3)
         t_table.add_column("Content")
         
-        for t in tasks:
-            icon = f"[{theme['success']}]✔[/]" if t["done"] else f"[{theme['error']}]☐[/]"
+        for t in daily.tasks:
+            icon = f"[{theme['success']}]✔[/]" if t.done else f"[{theme['error']}]☐[/]"
             
             # Strikethrough if done
-            txt = t["text"] if t["text"] else "[dim]Empty...[/dim]"
-            if t["done"]:
+            txt = t.text if t.text else "[dim]Empty...[/dim]"
+            if t.done:
                 txt = f"[strike {theme['dim']}]{txt}[/strike {theme['dim']}]"
-            elif not t["text"]:
+            elif t.empty:
                 txt = f"[{theme['dim']}]{txt}[/]"
             
-            if t.get("budget"):
-                 txt += f" [{theme['dim']}]({t['budget']})[/]"
+            if t.budget:
+                 txt += f" [{theme['dim']}]({t.budget})[/]"
 
             t_table.add_row(icon, txt)
             t_table.add_row("", "") # Spacer
             
         # Habits Section
         h_table = Table(box=None, expand=True, show_header=False, padding=(0,0))
-        habits = data_manager.get("persistent_data", {}).get("habits", [])
-        habit_status = daily.get("habit_status", {})
+        habits = daily.habits(data_manager.get("persistent_data", {}).get("habits", []))
         
         if habits:
             h_table.add_row(f"[{theme['secondary']}]HABITS[/]")
             for h in habits:
-                checked = habit_status.get(h, False)
-                icon = f"[{theme['success']}]✔[/]" if checked else f"[{theme['dim']}]○[/]"
-                h_table.add_row(f"{icon} {h}")
+                icon = f"[{theme['success']}]✔[/]" if h.done else f"[{theme['dim']}]○[/]"
+                h_table.add_row(f"{icon} {h.name}")
         
         # Combine
         master_grid = Table.grid(expand=True)
@@ -128,6 +130,7 @@ class DailyDashUI:
             border_style=theme['box']
         )
 
+    @tracing.traced(cat="render")
     def make_focus_panel(self, data_manager, theme, timer_status):
         """Timer, Notes, Parking Lot"""
         # Timer
@@ -171,6 +174,7 @@ class DailyDashUI:
         
         return Panel(grid, title=f"[{theme['primary']}]FOCUS ZONE[/]", border_style=theme['box'])
 
+    @tracing.traced(cat="render")
     def make_vitals_panel(self, data_manager, weather, vitals, theme):
         """Water, Weather, System"""
         
@@ -210,6 +214,7 @@ class DailyDashUI:
 
         return Panel(grid, title=f"[{theme['primary']}]VITALS[/]", border_style=theme['box'])
 
+    @tracing.traced(cat="render")
     def make_footer(self, theme):
         text = " [bold]w[/]: Water | [bold]t[/]: Task | [bold]k[/]: Timer | [bold]b[/]: Brain Dump | [bold]q[/]: Quit "
         return Panel(Align.center(text), style=f"{theme['dim']} on black", box=box.ROUNDED)
@@ -1,6 +1,17 @@
-import requests
+import json
+import os
 import time
 import threading
+from modules.data_handler import get_cache_dir
+from modules import tracing
+from modules import metrics
+
+WEATHER_CACHE_FILE = get_cache_dir() / "weather.json"
+CACHE_TTL = 900 # 15 min expiration
+
+# OpenMeteo endpoints (the benchmarks point these at a local stub server)
+GEOCODING_URL = "https://geocoding-api.open-meteo.com/v1/search"
+FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
 
 # Cache Globals
 _weather_cache = {
@@ -12,6 +23,45 @@ _weather_cache = {
 
 _is_fetching = False
 
+def _condition_icons(code):
+    """Maps an OpenMeteo weather code to (rich markup, plain unicode) icons."""
+    if code > 70: return ":snowflake:", "\u2744"
+    if code > 50: return ":cloud_with_rain:", "\U0001F327"
+    if code > 3: return ":cloud:", "\u2601"
+    return ":sunny:", "\u2600"
+
+@tracing.traced()
+def load_weather_cache():
+    """Reads the last successful fetch from disk. Returns a dict or None."""
+    try:
+        with open(WEATHER_CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (IOError, ValueError):
+        return None
+
+def _save_weather_cache(record):
+    tmp = WEATHER_CACHE_FILE.with_suffix(".tmp")
+    try:
+        with open(tmp, 'w') as f:
+            json.dump(record, f)
+        os.replace(tmp, WEATHER_CACHE_FILE)
+    except IOError:
+        pass
+
+@tracing.traced()
+def get_cached_weather(city_name, unit_system="metric"):
+    """
+    Returns the structured on-disk weather record for this city/units, or None.
+    Never touches the network or starts threads (used by status bar output).
+    The record carries a 'stale' flag once it is older than the cache TTL.
+    """
+    record = load_weather_cache()
+    if not record or record.get("city") != city_name or record.get("unit_system") != unit_system:
+        return None
+    record["stale"] = (time.time() - record.get("timestamp", 0)) >= CACHE_TTL
+    return record
+
+@tracing.traced()
 def get_weather_for_city(city_name, unit_system="metric"):
     """
     Fetches current weather for a city name using OpenMeteo.
@@ -24,14 +74,23 @@ def get_weather_for_city(city_name, unit_system="metric"):
         return "No City Configured"
 
     current_time = time.time()
-    
+
+    # 0. Seed from the disk cache so a fresh process can show weather immediately
+    if _weather_cache["data"] is None:
+        record = get_cached_weather(city_name, unit_system)
+        if record:
+            _weather_cache["city"] = city_name
+            _weather_cache["unit_system"] = unit_system
+            _weather_cache["data"] = record["text"]
+            _weather_cache["timestamp"] = record["timestamp"]
+
     # 1. Check if we have valid cache
     if (_weather_cache["city"] == city_name and 
         _weather_cache["unit_system"] == unit_system and 
         _weather_cache["data"] is not None):
         
         age = current_time - _weather_cache["timestamp"]
-        if age < 900: # 15 min expiration
+        if age < CACHE_TTL:
             return _weather_cache["data"]
 
     # 2. If valid cache missing or stale, trigger background update
@@ -47,20 +106,26 @@ def get_weather_for_city(city_name, unit_system="metric"):
     
     return "Weather: Loading..."
 
+@tracing.traced()
 def _fetch_weather_thread(city_name, unit_system):
     """
     Background worker to perform the network request.
     """
     global _is_fetching
-    
+    outcome = "error"
+    start = time.perf_counter()
+
     try:
+        import requests
+
         # 1. Geocode
-        geo_url = f"https://geocoding-api.open-meteo.com/v1/search?name={city_name}&count=1&language=en&format=json"
+        geo_url = f"{GEOCODING_URL}?name={city_name}&count=1&language=en&format=json"
         geo_res = requests.get(geo_url, timeout=10)
         geo_data = geo_res.json()
 
         if not geo_data.get("results"):
             _weather_cache["data"] = f"{city_name}: Not Found"
+            outcome = "not_found"
             return
 
         lat = geo_data["results"][0]["latitude"]
@@ -70,7 +135,7 @@ def _fetch_weather_thread(city_name, unit_system):
         temp_unit = "fahrenheit" if unit_system == "imperial" else "celsius"
         wind_unit = "mph" if unit_system == "imperial" else "kmh"
         
-        weather_url = f"https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={lon}&current_weather=true&hourly=relative_humidity_2m&temperature_unit={temp_unit}&windspeed_unit={wind_unit}"
+        weather_url = f"{FORECAST_URL}?latitude={lat}&longitude={lon}&current_weather=true&hourly=relative_humidity_2m&temperature_unit={temp_unit}&windspeed_unit={wind_unit}"
         
         w_res = requests.get(weather_url, timeout=10)
         w_data = w_res.json()
@@ -87,10 +152,7 @@ def _fetch_weather_thread(city_name, unit_system):
 
             # Simple condition mapping
             code = cw.get("weathercode", 0)
-            icon = ":sunny:" # Rich markup
-            if code > 3: icon = ":cloud:" 
-            if code > 50: icon = ":cloud_with_rain:"
-            if code > 70: icon = ":snowflake:"
+            icon, plain_icon = _condition_icons(code)
             
             unit_ci = "F" if unit_system == "imperial" else "C"
             unit_sp = "mph" if unit_system == "imperial" else "km/h"
@@ -102,6 +164,21 @@ def _fetch_weather_thread(city_name, unit_system):
             _weather_cache["unit_system"] = unit_system
             _weather_cache["data"] = result
             _weather_cache["timestamp"] = time.time()
+
+            _save_weather_cache({
+                "city": city_name,
+                "unit_system": unit_system,
+                "timestamp": _weather_cache["timestamp"],
+                "text": result,
+                "icon": plain_icon,
+                "code": code,
+                "temp": temp,
+                "temp_unit": unit_ci,
+                "humidity": hum,
+                "wind": wind,
+                "wind_unit": unit_sp
+            })
+            outcome = "ok"
             
     except Exception as e:
         # In case of error, we don't update data (keep old if leaks), or set error if None
@@ -109,3 +186,5 @@ def _fetch_weather_thread(city_name, unit_system):
              _weather_cache["data"] = "Weather: Connection Error"
     finally:
         _is_fetching = False
+        metrics.inc("dailydash_weather_fetches_total", result=outcome)
+        metrics.observe("dailydash_weather_fetch_seconds", time.perf_counter() - start)
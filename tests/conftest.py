@@ -0,0 +1,33 @@
+"""
+Shared test setup.
+
+The modules resolve their config and cache directories at import time, so
+HOME points at a throwaway directory before any of them is imported; the
+suite never touches your real data.
+"""
+import os
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+_home = tempfile.mkdtemp(prefix="dailydash-tests-")
+os.environ["HOME"] = _home
+os.environ["XDG_CACHE_HOME"] = os.path.join(_home, ".cache")
+os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "hide"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+for var in ("DAILYDASH_TRACE", "DAILYDASH_PROFILE", "DAILYDASH_METRICS_TEXTFILE"):
+    os.environ.pop(var, None)
+
+@pytest.fixture(scope="session")
+def app():
+    """main.py imported as a module (its globals are the running app's services)."""
+    argv, sys.argv = sys.argv, [os.path.join(ROOT, "main.py")]
+    try:
+        import main
+    finally:
+        sys.argv = argv
+    return main
@@ -0,0 +1,70 @@
+import argparse
+
+import pytest
+
+from modules import timer_store
+
+@pytest.fixture
+def run_batch(app, tmp_path, monkeypatch):
+    # No timer on disk, so "pomo skip" has nothing to skip
+    monkeypatch.setattr(timer_store, "CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(timer_store, "TIMER_FILE", tmp_path / "timer.json")
+
+    def run(text):
+        path = tmp_path / "commands.txt"
+        path.write_text(text)
+        with app.console.capture() as capture:
+            ok = app.command_batch(argparse.Namespace(file=str(path)))
+        return ok, capture.get()
+    return run
+
+def water(app):
+    return app.data_manager.get("daily_state")["current_water_intake"]
+
+def notes(app):
+    return app.data_manager.get("persistent_data")["brain_dump_content"]
+
+@pytest.mark.parametrize("failing", ["pomo skip", "pomo pause", "pomo resume", "task done 9", "note delete 99"])
+def test_failing_middle_line_stops_the_batch(app, run_batch, failing):
+    start = water(app)
+    ok, output = run_batch(f"water add\n{failing}\nwater add\n")
+
+    assert ok is False
+    assert "✗ 2:" in output and "✓ 3:" not in output
+    assert "Stopped after 1 command(s)" in output
+    # The line before the failure is kept, the one after it never ran
+    assert water(app) == start + app.data_manager.get("user_profile", {}).get("container_size", 250)
+
+def test_note_delete_with_an_unknown_id_deletes_nothing_in_a_batch(app, run_batch):
+    ok, _ = run_batch("note clear\nnote add one\nnote add two\n")
+    assert ok is True
+
+    ok, output = run_batch("note delete 1,5\n")
+    assert ok is False
+    assert "out of range" in output
+    assert notes(app) == ["one", "two"]
+
+    # Outside a batch the known IDs are still deleted
+    with app.console.capture():
+        app.command_note(argparse.Namespace(action="delete", target_id="1,5"))
+    assert notes(app) == ["two"]
+
+def test_all_lines_succeed(app, run_batch):
+    start = water(app)
+    ok, output = run_batch("# morning\nwater add\n\ndailydash water add\n")
+    assert ok is True
+    assert "2 command(s) applied." in output
+    assert water(app) == start + 2 * app.data_manager.get("user_profile", {}).get("container_size", 250)
+
+@pytest.mark.parametrize("line", ["timer 10", "pomo start"])
+def test_timer_start_replaces_a_running_timer_without_asking(app, run_batch, monkeypatch, line):
+    def ask(*args, **kwargs):
+        raise AssertionError("batch prompted")
+    monkeypatch.setattr(app.Confirm, "ask", ask)
+    monkeypatch.setattr(app, "arm_timer", lambda timer, spawn_notifier=True: None)
+    running = timer_store.start_timer(5)
+
+    ok, output = run_batch(f"water add\n{line}\nwater add\n")
+    assert ok is True
+    assert "3 command(s) applied." in output
+    assert timer_store.get_active_timer()["id"] != running["id"]
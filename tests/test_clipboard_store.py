@@ -0,0 +1,105 @@
+import json
+import zlib
+
+import pytest
+
+from modules.clipboard_store import ClipboardStore, content_hash, BLOB_THRESHOLD, PREVIEW_CHARS
+
+@pytest.fixture
+def make_store(tmp_path):
+    def make(**kwargs):
+        return ClipboardStore(path=tmp_path / "history.jsonl", blob_dir=tmp_path / "blobs", **kwargs)
+    return make
+
+def log_lines(store):
+    return store.path.read_text(encoding="utf-8").splitlines()
+
+def test_duplicate_moves_to_front_with_a_bump_record(make_store):
+    store = make_store()
+    for text in ("one", "two", "three"):
+        store.add(text)
+    assert store.items() == ["three", "two", "one"]
+
+    assert store.add("one") is True
+    assert store.items() == ["one", "three", "two"]
+    assert len(store) == 3
+    # The copy is not stored again: the log only gets a bump with the hash
+    assert json.loads(log_lines(store)[-1]) == {"h": content_hash("one"), "ts": pytest.approx(store.entry(0)["ts"])}
+    # Already on top: nothing to do
+    assert store.add("one") is False
+    assert len(log_lines(store)) == 4
+
+def test_reload_after_restart(make_store):
+    store = make_store()
+    for text in ("a", "b", "c", "a"):
+        store.add(text)
+    store.delete(1)  # "c"
+
+    reloaded = make_store()
+    assert reloaded.items() == ["a", "b"]
+    assert reloaded.position(content_hash("b")) == 1
+
+def test_torn_last_line_is_skipped(make_store):
+    store = make_store()
+    store.add("kept")
+    with open(store.path, "a") as f:
+        f.write('{"h": "abc", "t": "half')
+    assert make_store().items() == ["kept"]
+
+def test_large_items_go_to_compressed_blobs(make_store):
+    store = make_store()
+    big = "log line\n" * (BLOB_THRESHOLD // 4)
+    store.add(big)
+    store.add("small")
+
+    h = content_hash(big)
+    record = json.loads(log_lines(store)[0])
+    assert record["b"] == 1 and "t" not in record
+    assert record["p"] == big[:PREVIEW_CHARS]
+    blob = store.blob_dir / h[:2] / f"{h}.z"
+    assert zlib.decompress(blob.read_bytes()).decode() == big
+    assert blob.stat().st_size < len(big)
+
+    assert store.previews()[1] == big[:PREVIEW_CHARS]
+    assert store.get(1) == big
+    assert make_store().get(1) == big
+
+    store.delete(1)
+    assert not blob.exists()
+
+def test_at_threshold_stays_inline(make_store):
+    store = make_store()
+    store.add("x" * BLOB_THRESHOLD)
+    assert "t" in store.entry(0)
+    assert not store.blob_dir.exists()
+
+def test_compaction_bounds_the_log(make_store):
+    store = make_store(max_items=10)
+    for i in range(130):
+        store.add(f"entry {i}")
+    store.add("entry 125")  # bump
+
+    # The log was rewritten to the live entries instead of growing forever
+    assert len(log_lines(store)) < 2 * 10 + 100
+    assert len(store) == 10
+    reloaded = make_store(max_items=10)
+    assert reloaded.items() == store.items()
+    assert reloaded.items()[0] == "entry 125"
+    assert reloaded.items()[-1] == "entry 120"
+
+def test_compaction_drops_unreferenced_blobs(make_store):
+    store = make_store(max_items=2)
+    big = "b" * (BLOB_THRESHOLD + 1)
+    store.add(big)
+    store.add("x")
+    store.add("y")  # trims the blob entry from memory
+    store._compact()
+    assert list(store.blob_dir.glob("*/*.z")) == []
+    assert make_store(max_items=2).items() == ["y", "x"]
+
+def test_clear(make_store):
+    store = make_store()
+    store.add("a")
+    store.clear()
+    assert len(store) == 0
+    assert make_store().items() == []
@@ -0,0 +1,103 @@
+import copy
+import json
+import os
+
+import pytest
+
+from modules import clipboard_manager, data_handler, migrations
+from modules.clipboard_store import ClipboardStore
+from modules.scheduler import Scheduler
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "config_v0.json")
+
+def load_fixture():
+    with open(FIXTURE) as f:
+        return json.load(f)
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_handler, "CONFIG_FILE", tmp_path / "config.json")
+    monkeypatch.setattr(data_handler, "SECTIONS_DIR", tmp_path / "config.d")
+    return tmp_path
+
+def snapshot(directory):
+    return {p.name: (p.read_bytes(), p.stat().st_mtime_ns) for p in sorted(directory.glob("*.json"))}
+
+def test_v0_runs_every_step_to_current():
+    data = load_fixture()
+    assert migrations.migrate(data, data_handler.DataManager.DEFAULT_CONFIG) == 0
+
+    assert data["schema_version"] == migrations.SCHEMA_VERSION == 4
+    persistent = data["persistent_data"]
+    assert persistent["brain_dump_content"] == ["first idea", "second idea", "third idea"]
+    assert "clipboard_history" not in persistent
+    assert data["clipboard_import"] == ["newest copy", "older copy"]
+    assert data["daily_state"]["tasks"] == [
+        {"id": 1, "text": "Old task", "done": True, "budget": None},
+        {"id": 2, "text": "", "done": False, "budget": None},
+        {"id": 3, "text": "", "done": False, "budget": None}
+    ]
+    settings = data["app_settings"]
+    # Missing settings are added; the user's values, and their ambient mix, are kept whole
+    assert settings["theme"] == "dracula" and settings["audio_enabled"] is False
+    assert settings["ambient_mix"] == {"fan": 0.5}
+    assert settings["notification_backend"] == "auto"
+    assert settings["pomodoro"]["cycles"] == 4
+    assert persistent["habits"] == []
+
+def test_second_run_changes_nothing():
+    data = load_fixture()
+    migrations.migrate(data, data_handler.DataManager.DEFAULT_CONFIG)
+    before = copy.deepcopy(data)
+    assert migrations.migrate(data, data_handler.DataManager.DEFAULT_CONFIG) == migrations.SCHEMA_VERSION
+    assert data == before
+
+def test_newer_config_is_left_alone():
+    data = {"schema_version": migrations.SCHEMA_VERSION + 1, "persistent_data": {"brain_dump_content": "x"}}
+    assert migrations.migrate(data, data_handler.DataManager.DEFAULT_CONFIG) == migrations.SCHEMA_VERSION + 1
+    assert data["persistent_data"]["brain_dump_content"] == "x"
+
+def test_legacy_file_is_split_backed_up_and_migrated_once(config_dir, monkeypatch):
+    original = (config_dir / "config.json")
+    original.write_text(open(FIXTURE).read())
+    legacy_bytes = original.read_bytes()
+
+    dm = data_handler.DataManager()
+    sections = config_dir / "config.d"
+    assert not original.exists()
+    assert (config_dir / "config.json.v0.bak").read_bytes() == legacy_bytes
+    assert data_handler.read_section("schema_version") == migrations.SCHEMA_VERSION
+    assert data_handler.read_section("persistent_data")["brain_dump_content"] == ["first idea", "second idea", "third idea"]
+    assert data_handler.read_section("clipboard_import") == ["newest copy", "older copy"]
+    assert dm.daily().task(1).text == "Old task"
+
+    # The clipboard manager moves the imported history into its JSONL store
+    store = ClipboardStore(path=config_dir / "clipboard.jsonl", blob_dir=config_dir / "blobs")
+    monkeypatch.setattr(clipboard_manager, "ClipboardStore", lambda **kwargs: store)
+    clipboard_manager.ClipboardManager(dm, Scheduler())
+    assert store.items() == ["newest copy", "older copy"]
+    assert ClipboardStore(path=config_dir / "clipboard.jsonl", blob_dir=config_dir / "blobs").items() == store.items()
+    assert not (sections / "clipboard_import.json").exists()
+
+    # A second start finds the current version and rewrites nothing
+    before = snapshot(sections)
+    dm = data_handler.DataManager()
+    for name in list(dm.config):
+        dm.config[name]
+    dm.save_config()
+    assert snapshot(sections) == before
+    assert not (config_dir / "config.d.v0.bak").exists()
+
+def test_old_section_files_are_backed_up_before_upgrade(config_dir):
+    data = load_fixture()
+    for name, value in data.items():
+        data_handler.write_section(name, value)
+    data_handler.write_section("schema_version", 1)
+
+    dm = data_handler.DataManager()
+    backup = config_dir / "config.d.v1.bak"
+    assert json.loads((backup / "persistent_data.json").read_text())["clipboard_history"] == ["newest copy", "older copy"]
+    assert data_handler.read_section("schema_version") == migrations.SCHEMA_VERSION
+    assert dm.config["clipboard_import"] == ["newest copy", "older copy"]
+    # Steps before version 1 did not run again: the string notes stay as stored
+    assert data_handler.read_section("persistent_data")["brain_dump_content"] == data["persistent_data"]["brain_dump_content"]
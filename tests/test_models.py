@@ -0,0 +1,75 @@
+from modules.models import DailyState, Task, TASK_SLOTS
+
+def test_task_from_legacy_dict_fills_missing_fields():
+    task = Task.from_dict({"id": 2, "text": None})
+    assert (task.id, task.text, task.done, task.budget) == (2, "", False, None)
+    assert task.empty
+    assert task.to_dict() == {"id": 2, "text": "", "done": False, "budget": None}
+
+def test_task_round_trip():
+    data = {"id": 1, "text": "Ship it", "done": True, "budget": "30m"}
+    assert Task.from_dict(data).to_dict() == data
+
+def test_daily_state_round_trip_keeps_unknown_keys():
+    data = {
+        "last_login_date": "2026-10-18",
+        "current_water_intake": 750,
+        "current_caffeine_intake": 95,
+        "tasks": [
+            {"id": 1, "text": "Write tests", "done": True, "budget": None},
+            {"id": 2, "text": "", "done": False, "budget": None},
+            {"id": 3, "text": "Review", "done": False, "budget": "1h"}
+        ],
+        "habit_status": {"Read": True},
+        # Written by a newer version, or by hand
+        "mood": "good",
+        "custom": {"nested": [1, 2]}
+    }
+    daily = DailyState.from_dict(data)
+    assert daily.water == 750 and daily.caffeine == 95
+    assert daily.extra == {"mood": "good", "custom": {"nested": [1, 2]}}
+    assert daily.to_dict() == data
+
+def test_daily_state_from_legacy_dict_with_missing_keys():
+    daily = DailyState.from_dict({"tasks": [{"id": 1, "text": "Old task", "done": False}]})
+    assert daily.last_login_date == "" and daily.water == 0 and daily.caffeine == 0
+    assert daily.habit_status == {}
+    assert daily.to_dict() == {
+        "last_login_date": "",
+        "current_water_intake": 0,
+        "current_caffeine_intake": 0,
+        "tasks": [{"id": 1, "text": "Old task", "done": False, "budget": None}],
+        "habit_status": {}
+    }
+
+def test_empty_dict_gets_blank_task_slots():
+    daily = DailyState.from_dict({})
+    assert [t.id for t in daily.tasks] == list(range(1, TASK_SLOTS + 1))
+    assert daily.active_tasks() == []
+    assert DailyState.from_dict(daily.to_dict()).to_dict() == daily.to_dict()
+
+def test_defaults_are_not_shared():
+    a, b = DailyState(), DailyState()
+    a.tasks[0].assign("Mine")
+    a.habit_status["Read"] = True
+    assert b.tasks[0].empty and b.habit_status == {}
+
+    data = {"habit_status": {"Read": False}}
+    daily = DailyState.from_dict(data)
+    daily.habit_status["Read"] = True
+    assert data["habit_status"] == {"Read": False}
+
+def test_helpers():
+    daily = DailyState.from_dict({"tasks": [
+        {"id": 1, "text": "a", "done": True},
+        {"id": 2, "text": ""},
+        {"id": 3, "text": "c"}
+    ]})
+    assert daily.task(3).text == "c" and daily.task(9) is None
+    assert daily.free_slot().id == 2
+    assert daily.tasks_done == 1
+    assert [h.done for h in daily.habits(["Read", "Run"])] == [False, False]
+
+    daily.reset("2026-10-19", ["Read"])
+    assert daily.last_login_date == "2026-10-19"
+    assert daily.active_tasks() == [] and daily.habit_status == {"Read": False}
@@ -0,0 +1,75 @@
+from modules.notifications import NotificationService, MemoryBackend, COALESCE_SECONDS, MIN_INTERVAL
+from modules.scheduler import ManualClock, Scheduler
+
+EYE = "20-20-20 Rule:\nLook at something 20 feet away for 20 seconds."
+STAND = "Time to Stand Up!\nStretch your legs for a bit."
+
+def make_service(**kwargs):
+    clock = ManualClock(start=1000.0)
+    backend = MemoryBackend()
+    return clock, backend, NotificationService(Scheduler(clock), backend=backend, **kwargs)
+
+def test_reminders_in_the_same_minute_are_coalesced():
+    clock, backend, service = make_service()
+    service.notify("DailyDash Health", EYE)
+    clock.advance(30)
+    service.notify("DailyDash Health", STAND)
+    assert backend.sent == []
+
+    clock.advance(COALESCE_SECONDS - 30)
+    assert backend.sent == [("DailyDash Health", f"{EYE}\n\n{STAND}")]
+
+def test_different_titles_merge_under_the_app_name():
+    clock, backend, service = make_service()
+    service.notify("DailyDash Health", EYE)
+    service.notify("Other", "hello")
+    clock.advance(COALESCE_SECONDS)
+    assert backend.sent == [("DailyDash", f"DailyDash Health: {EYE}\n\nOther: hello")]
+
+def test_same_reminder_twice_in_a_window_is_sent_once():
+    clock, backend, service = make_service()
+    service.notify("DailyDash Health", EYE)
+    service.notify("DailyDash Health", EYE)
+    clock.advance(COALESCE_SECONDS)
+    assert backend.sent == [("DailyDash Health", EYE)]
+
+def test_urgent_goes_out_at_once_and_takes_pending_along():
+    clock, backend, service = make_service()
+    service.notify("DailyDash Health", EYE)
+    service.notify("DailyDash Timer", "Time is up!", urgent=True)
+    clock.advance(0)
+    assert len(backend.sent) == 1
+    assert "Time is up!" in backend.sent[0][1] and EYE in backend.sent[0][1]
+    # Nothing left for the coalescing flush
+    clock.advance(COALESCE_SECONDS)
+    assert len(backend.sent) == 1
+
+def test_rate_limit_holds_deliveries_min_interval_apart():
+    clock, backend, service = make_service()
+    service.notify("DailyDash Timer", "first", urgent=True)
+    clock.advance(0)
+    clock.advance(1)
+    service.notify("DailyDash Timer", "second", urgent=True)
+    clock.advance(0)
+    assert [m for _, m in backend.sent] == ["first"]
+
+    clock.advance(MIN_INTERVAL - 1.5)
+    assert [m for _, m in backend.sent] == ["first"]
+    clock.advance(0.5)
+    assert [m for _, m in backend.sent] == ["first", "second"]
+
+def test_sound_plays_once_per_delivery():
+    chimes = []
+    clock, backend, service = make_service(play_sound=lambda: chimes.append(1))
+    service.notify("DailyDash Health", EYE, sound=True)
+    service.notify("DailyDash Health", STAND, sound=True)
+    clock.advance(COALESCE_SECONDS)
+    assert len(backend.sent) == 1
+    assert chimes == [1]
+
+def test_without_a_scheduler_every_message_is_sent_at_once():
+    backend = MemoryBackend()
+    service = NotificationService(backend=backend)
+    service.notify("DailyDash Health", EYE)
+    service.notify("DailyDash Health", STAND)
+    assert [m for _, m in backend.sent] == [EYE, STAND]
@@ -0,0 +1,115 @@
+import csv
+import time
+from datetime import date
+
+import pytest
+
+from modules import data_handler, notifications, pomodoro, timer_store
+from modules.timer_notifier import fire_timer
+
+SETTINGS = {"pomodoro": {"work": 25, "short_break": 5, "long_break": 15, "cycles": 2}}
+
+@pytest.fixture(autouse=True)
+def isolated(tmp_path, monkeypatch):
+    monkeypatch.setattr(timer_store, "CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(timer_store, "TIMER_FILE", tmp_path / "timer.json")
+    monkeypatch.setattr(pomodoro, "SESSIONS_DIR", tmp_path / "sessions")
+    service = notifications.NotificationService(backend=notifications.MemoryBackend())
+    monkeypatch.setattr(notifications, "_service", service)
+    return service
+
+def fire_current():
+    assert fire_timer(timer_store.load_timer()["id"], play_chime=lambda: None)
+    return timer_store.load_timer()
+
+def phase(timer):
+    return timer["pomodoro"]["phase"], timer["pomodoro"]["cycle"], timer["pomodoro"]["completed"]
+
+def test_work_short_long_cycle():
+    timer = pomodoro.start(SETTINGS)
+    assert phase(timer) == ("work", 1, 0)
+    assert timer["minutes"] == 25
+
+    timer = fire_current()
+    assert phase(timer) == ("short_break", 1, 1)
+    assert timer["minutes"] == 5
+    timer = fire_current()
+    assert phase(timer) == ("work", 2, 1)
+    # The second completed work session earns the long break
+    timer = fire_current()
+    assert phase(timer) == ("long_break", 2, 2)
+    assert timer["minutes"] == 15
+    timer = fire_current()
+    assert phase(timer) == ("work", 3, 2)
+
+def test_invalid_settings_fall_back_to_defaults():
+    settings = pomodoro.get_settings({"pomodoro": {"work": 0, "short_break": -5, "long_break": 2.5, "cycles": 0}})
+    assert settings == pomodoro.DEFAULT_SETTINGS
+    assert pomodoro.get_settings({"pomodoro": {"work": "25", "cycles": True}}) == pomodoro.DEFAULT_SETTINGS
+    assert pomodoro.get_settings({"pomodoro": {"work": 50, "cycles": 1}})["work"] == 50
+
+    pomodoro.start({"pomodoro": {"cycles": 0}})
+    assert phase(fire_current()) == ("short_break", 1, 1)
+
+def test_phase_saved_with_bad_settings_still_advances():
+    # A timer written before the settings were validated
+    bad = {"work": 25, "short_break": 0, "long_break": 15, "cycles": 0}
+    timer_store.start_timer(25, label="Work", pomodoro={"phase": "work", "cycle": 1, "completed": 0, "settings": bad})
+    timer = fire_current()
+    assert phase(timer) == ("short_break", 1, 1)
+    assert timer["minutes"] == pomodoro.DEFAULT_SETTINGS["short_break"]
+
+def test_each_phase_fires_once(isolated):
+    pomodoro.start(SETTINGS)
+    timer_id = timer_store.load_timer()["id"]
+    assert fire_timer(timer_id, play_chime=lambda: None)
+    assert not fire_timer(timer_id, play_chime=lambda: None)
+    assert len(isolated.backend.sent) == 1
+
+def test_skip_does_not_count_or_log():
+    pomodoro.start(SETTINGS)
+    timer = pomodoro.skip()
+    assert phase(timer) == ("short_break", 1, 0)
+    assert pomodoro.get_day_summary() == (0, 0)
+    assert pomodoro.skip() is not None
+    pomodoro.stop()
+    assert pomodoro.skip() is None
+
+def test_pause_and_resume_keep_the_remaining_time():
+    timer = pomodoro.start(SETTINGS)
+    paused = pomodoro.pause()
+    assert paused["paused"]
+    assert timer_store.get_active_timer() is None
+    assert timer_store.get_timer_status().startswith("PAUSED 2")
+    assert pomodoro.pause() is None
+
+    resumed = pomodoro.resume()
+    assert not resumed["paused"]
+    assert resumed["deadline"] == pytest.approx(timer["deadline"], abs=2)
+    assert timer_store.get_active_timer()["id"] == timer["id"]
+    assert pomodoro.resume() is None
+
+def test_session_log_and_day_summary():
+    pomodoro.start(SETTINGS)
+    fire_current()  # work -> logged
+    fire_current()  # short break -> not logged
+    fire_current()  # work -> logged
+
+    log = (pomodoro.SESSIONS_DIR / f"{date.today().isoformat()}.log").read_text().splitlines()
+    assert [line.split(",")[1:] for line in log] == [["work", "25"], ["work", "25"]]
+    assert pomodoro.get_day_summary() == (50, 2)
+    assert pomodoro.get_day_summary("1999-01-01") == (0, 0)
+
+def test_day_summary_feeds_history_columns(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_handler, "HISTORY_FILE", tmp_path / "history.csv")
+    pomodoro.log_session("work", 25, time.time())
+    pomodoro.log_session("work", 12.5, time.time())
+    pomodoro.log_session("short_break", 5, time.time())
+
+    data_handler.DataManager().log_daily_history()
+    with open(tmp_path / "history.csv", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 1
+    assert rows[0]["Date"] == date.today().isoformat()
+    assert rows[0]["Focus_Minutes"] == "37"
+    assert rows[0]["Sessions_Completed"] == "2"
@@ -0,0 +1,67 @@
+from modules.scheduler import ManualClock, Scheduler
+
+def make_scheduler():
+    clock = ManualClock()
+    return clock, Scheduler(clock)
+
+def test_hourly_nag_fires_after_advance():
+    clock, scheduler = make_scheduler()
+    fired = []
+    scheduler.schedule(3600, fired.append, "stand", interval=3600, key="nag_stand_up")
+
+    clock.advance(3599)
+    assert fired == []
+    clock.advance(1)
+    assert fired == ["stand"]
+    # Recurring: once per interval, not once per advance() call
+    clock.advance(3 * 3600)
+    assert fired == ["stand"] * 4
+
+def test_cancel_takes_effect_immediately():
+    clock, scheduler = make_scheduler()
+    fired = []
+    scheduler.schedule(60, fired.append, "x", key="k")
+
+    assert scheduler.cancel("k") is True
+    assert not scheduler.is_scheduled("k")
+    assert scheduler.next_due() is None
+    clock.advance(120)
+    assert fired == []
+    assert scheduler.cancel("k") is False
+
+def test_rescheduling_a_key_replaces_the_pending_event():
+    clock, scheduler = make_scheduler()
+    fired = []
+    scheduler.schedule(60, fired.append, "old", key="timer")
+    scheduler.schedule(300, fired.append, "new", key="timer")
+
+    assert scheduler.next_due("timer") == 300
+    clock.advance(299)
+    assert fired == []
+    clock.advance(1)
+    assert fired == ["new"]
+    assert not scheduler.is_scheduled("timer")
+
+def test_settings_change_reschedules_nags(app, monkeypatch):
+    clock, scheduler = make_scheduler()
+    fired = []
+    monkeypatch.setattr(app, "scheduler", scheduler)
+    monkeypatch.setattr(app, "send_nag", fired.append)
+    app.data_manager.update("app_settings.nag_eye_strain", True)
+    app.data_manager.update("app_settings.nag_stand_up", True)
+
+    app.schedule_nags()
+    assert scheduler.is_scheduled("nag_eye_strain")
+    assert scheduler.is_scheduled("nag_stand_up")
+
+    # Saving the setting is enough: the change subscription re-arms the nags
+    app.data_manager.update("app_settings.nag_stand_up", False)
+    assert not scheduler.is_scheduled("nag_stand_up")
+
+    clock.advance(3600)
+    assert fired == ["nag_eye_strain"] * 3
+
+    app.data_manager.update("app_settings.nag_stand_up", True)
+    assert scheduler.next_due("nag_stand_up") == 3600 + 3600
+    clock.advance(3600)
+    assert fired.count("nag_stand_up") == 1
@@ -0,0 +1,97 @@
+from modules.search_index import SearchIndex
+
+def make_index():
+    index = SearchIndex()
+    index.add("note", "Set up the proxy config", "Set up the proxy config")
+    index.add("note", "Proxmox backup schedule", "Proxmox backup schedule")
+    index.add("link", "https://example.com/proxy-guide", "https://example.com/proxy-guide")
+    index.add("clip", "h1", "ssh config for the build box")
+    return index
+
+def idents(results):
+    return [ident for _, ident, _ in results]
+
+def test_prefix_search_uses_the_sorted_vocabulary():
+    index = make_index()
+    assert index.vocab == sorted(index.vocab)
+    assert set(idents(index.search("prox"))) == {
+        "Set up the proxy config", "Proxmox backup schedule", "https://example.com/proxy-guide"
+    }
+    assert idents(index.search("proxm")) == ["Proxmox backup schedule"]
+    assert index.search("zzz") == []
+
+def test_whole_words_rank_above_prefixes_then_newest_first():
+    index = make_index()
+    index.add("note", "proxying later", "proxying later")
+    assert idents(index.search("proxy")) == [
+        "https://example.com/proxy-guide", "Set up the proxy config", "proxying later"
+    ]
+
+def test_multiple_terms_are_anded():
+    index = make_index()
+    assert idents(index.search("config proxy")) == ["Set up the proxy config"]
+    assert idents(index.search("conf")) == ["h1", "Set up the proxy config"]
+    assert index.search("proxmox config") == []
+
+def test_kind_filter_and_limit():
+    index = make_index()
+    assert idents(index.search("config", kind="clip")) == ["h1"]
+    assert len(index.search("prox", limit=2)) == 2
+
+def test_remove_drops_postings_and_vocabulary():
+    index = make_index()
+    index.remove("note", "Proxmox backup schedule")
+    assert idents(index.search("proxm")) == []
+    assert "proxmox" not in index.vocab
+    assert "backup" not in index.postings
+    # Words still used by other documents stay
+    assert "config" in index.vocab
+    assert len(index) == 3
+
+def test_duplicates_are_reference_counted():
+    index = SearchIndex()
+    index.add("note", "buy milk", "buy milk")
+    index.add("note", "buy milk", "buy milk")
+    index.remove("note", "buy milk")
+    assert idents(index.search("milk")) == ["buy milk"]
+    index.remove("note", "buy milk")
+    assert index.search("milk") == []
+    assert index.vocab == []
+
+def test_clear_one_kind():
+    index = make_index()
+    index.clear("note")
+    assert {kind for kind, _, _ in index.search("config")} == {"clip"}
+    assert len(index) == 2
+
+def test_substring_fallback_uses_trigrams():
+    index = make_index()
+    assert idents(index.search("oxmo")) == ["Proxmox backup schedule"]
+    assert set(idents(index.search("roxy"))) == {"Set up the proxy config", "https://example.com/proxy-guide"}
+    # Shorter terms only match as prefixes
+    assert index.search("ox") == []
+
+    class NoScan(list):
+        def __iter__(self):
+            raise AssertionError("scanned the vocabulary")
+    index.vocab = NoScan(index.vocab)
+    assert idents(index.search("ckup")) == ["Proxmox backup schedule"]
+    assert index.search("qqq") == []
+
+def test_short_prefixes_follow_adds_and_removes():
+    index = make_index()
+    assert len(index.search("p", limit=10)) == 3
+    index.remove("note", "Proxmox backup schedule")
+    assert "Proxmox backup schedule" not in idents(index.search("p"))
+    assert idents(index.search("ba")) == []
+    assert idents(index.search("b")) == ["h1"]
+    index.clear()
+    assert index.short == {} and index.grams == {}
+
+def test_short_prefix_ranks_newest_first():
+    index = SearchIndex()
+    for i in range(40):
+        index.add("note", f"item {i}", f"item {i}")
+    index.add("note", "item 3", "item 3")  # re-added: newest again
+    assert idents(index.search("i", limit=3)) == ["item 3", "item 39", "item 38"]
+    assert idents(index.search("it", limit=2, kind="link")) == []